@@ -1,38 +1,58 @@
-import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Annotated
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.db.session import get_db_session
+from app.repo.match_history_repo import MatchHistoryRepo
 from app.services.deadlock_api_service import DeadlockAPIService
+from app.services.match_history_service import MatchHistoryService
+from app.services.steam_account_service import SteamAccountService, get_steam_account_service
 from app.domain.deadlock_api import MatchSummary
 from app.domain.steam_account import SteamPlayer
-from app.config import get_settings, Settings
+from app.domain.exceptions import DeadlockAPIError, SteamAPIError
 from app.utils.logger import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
-SettingsDep = Annotated[Settings, Depends(get_settings)]
+SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+SteamServiceDep = Annotated[SteamAccountService, Depends(get_steam_account_service)]
+
+def get_match_history_service() -> MatchHistoryService:
+    return MatchHistoryService(DeadlockAPIService(), MatchHistoryRepo())
+
+MatchHistoryServiceDep = Annotated[MatchHistoryService, Depends(get_match_history_service)]
 
 @router.get("/match_history/{steam_id}", response_model=list[MatchSummary])
-async def get_account_match_history(steam_id: str):
-    api_service = DeadlockAPIService()
-    return await api_service.get_account_match_history_for(steam_id)
+async def get_account_match_history(
+    steam_id: int,
+    session: SessionDep,
+    match_history_service: MatchHistoryServiceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    try:
+        return await match_history_service.get_match_history(steam_id, limit, offset, session)
+    except DeadlockAPIError as e:
+        logger.error("Failed to fetch match history for %s: %s", steam_id, e)
+        raise HTTPException(status_code=502, detail="Deadlock API error occurred. Check logs for details.")
+
+@router.get("/steam", response_model=list[SteamPlayer])
+async def get_steam_accounts_details(
+    steam_service: SteamServiceDep,
+    steam_ids: Annotated[list[str], Query(min_length=1, max_length=100)],
+):
+    try:
+        return await steam_service.get_players(steam_ids)
+    except SteamAPIError as e:
+        logger.error("Failed to fetch Steam account details for %s ids: %s", len(steam_ids), e)
+        raise HTTPException(status_code=502, detail=str(e))
 
 @router.get("/steam/{steam_id}", response_model=SteamPlayer)
-async def get_steam_account_details(steam_id: str, settings: SettingsDep):
-    url = "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/"
-    params = {
-        "key": settings.STEAM_WEB_API_KEY,
-        "steamids": steam_id
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        try:
-            response.raise_for_status()
-            data = response.json()
-            player_data = data["response"]["players"][0]
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to fetch Steam account details: {e.response.status_code} - {e.response.text}")
-            raise HTTPException(status_code=e.response.status_code, detail=str(e))
-        except (KeyError, IndexError) as e:
-            logger.error(f"Failed to parse Steam account details: {e}")
-            raise HTTPException(status_code=404, detail="Steam player not found")
-        return SteamPlayer.model_validate(player_data)
\ No newline at end of file
+async def get_steam_account_details(steam_id: str, steam_service: SteamServiceDep):
+    try:
+        player = await steam_service.get_player(steam_id)
+    except SteamAPIError as e:
+        logger.error("Failed to fetch Steam account details for %s: %s", steam_id, e)
+        raise HTTPException(status_code=502, detail=str(e))
+    if player is None:
+        raise HTTPException(status_code=404, detail="Steam player not found")
+    return player
@@ -0,0 +1,73 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.exceptions import MatchDataIntegrityException
+from app.domain.match_analysis import MATCH_SCHEMA_VERSION
+from app.domain.match_stats import CrossMatchDamageStats, MatchSearchResult, StatsGroupBy
+from app.infra.db.session import get_db_session
+from app.repo.match_stats_repo import MatchStatsRepo
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import get_logger
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+
+@router.get("/damage", response_model=CrossMatchDamageStats)
+async def get_cross_match_damage_stats(
+    session: SessionDep,
+    group_by: Annotated[StatsGroupBy, Query()] = StatsGroupBy.HERO,
+    steam_id_32: Annotated[int | None, Query(ge=0)] = None,
+    hero_id: Annotated[int | None, Query()] = None,
+    last_n: Annotated[int, Query(ge=1, le=10000)] = 50,
+    minute: Annotated[int | None, Query(ge=0, le=120)] = None,
+):
+    try:
+        return await MatchStatsRepo().get_damage_stats(
+            MATCH_SCHEMA_VERSION, group_by, last_n, session,
+            steam_id_32=steam_id_32, hero_id=hero_id, minute=minute,
+        )
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load cross-match damage stats")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching damage stats",
+        )
+
+@router.get("/matches", response_model=list[MatchSearchResult])
+async def search_matches(
+    session: SessionDep,
+    steam_id_32: Annotated[int | None, Query(ge=0)] = None,
+    hero_id: Annotated[int | None, Query()] = None,
+    min_match_time_s: Annotated[int | None, Query(ge=0)] = None,
+    max_match_time_s: Annotated[int | None, Query(ge=0)] = None,
+    boss_custom_id: Annotated[int | None, Query()] = None,
+    boss_died_before_s: Annotated[int | None, Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    """
+    Match length bounds are on the played length, without the pregame. Boss
+    filters only see matches whose boss timelines have been stored (see
+    app.jobs.backfill_boss_timelines).
+    """
+    try:
+        return await ParsedMatchesRepo().search_matches(
+            MATCH_SCHEMA_VERSION, session,
+            steam_id_32=steam_id_32,
+            hero_id=hero_id,
+            min_match_time_s=min_match_time_s,
+            max_match_time_s=max_match_time_s,
+            boss_custom_id=boss_custom_id,
+            boss_died_before_s=boss_died_before_s,
+            limit=limit,
+            offset=offset,
+        )
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to search matches")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while searching matches",
+        )
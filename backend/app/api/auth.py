@@ -2,7 +2,6 @@ import re
 from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import RedirectResponse, JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from openid.consumer.consumer import Consumer
 from typing import Annotated
 from app.services.auth.manage_jwt_token import create_access_token
 from app.services.user_service import UserService
@@ -21,6 +20,8 @@ SettingsDep = Annotated[Settings, Depends(get_settings)]
 
 @router.get("/login")
 async def login(settings: SettingsDep):
+    from openid.consumer.consumer import Consumer
+
     consumer = Consumer({}, None)
     auth_begin = consumer.begin(STEAM_OPENID_ENDPOINT)
 
@@ -32,11 +33,13 @@ async def login(settings: SettingsDep):
 
 @router.get("/callback")
 async def callback(request: Request, session: SessionDep, settings: SettingsDep):
+    from openid.consumer.consumer import Consumer
+
     consumer = Consumer({}, None)
     return_url = f"{settings.BACKEND_BASE_URL}/auth/callback"
     response = consumer.complete(request.query_params, return_url)
     if response.status != "success" or not response.identity_url:
-        logger.error(f"Steam login failed: {response.status} - {response.message}")
+        logger.error("Steam login failed: %s - %s", response.status, response.message)
         raise HTTPException(status_code=403, detail="Steam login failed")
 
     identity_url = response.identity_url
@@ -45,11 +48,11 @@ async def callback(request: Request, session: SessionDep, settings: SettingsDep)
 
     if user is None:
         user = await UserService().create_user(steam_id, session)
-        logger.info(f"User created with Steam ID: {steam_id}")
+        logger.info("User created with Steam ID: %s", steam_id)
 
     assert user.id is not None, "User ID should never be None after creation"
-    jwt = create_access_token(user_id=user.id, settings=settings)
-    logger.info(f"User logged in with Steam ID: {steam_id}")
+    jwt = create_access_token(user_id=user.id, settings=settings, user=user)
+    logger.info("User logged in with Steam ID: %s", steam_id)
 
     redirect_url = f"{settings.FRONTEND_BASE_URL}/profile/{steam_id}"
     response = RedirectResponse(url=redirect_url)
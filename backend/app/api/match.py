@@ -1,8 +1,8 @@
-import json
 from typing import Annotated
 from fastapi import (
     APIRouter,
     HTTPException,
+    Query,
     Request,
     Response,
     status,
@@ -13,8 +13,22 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.services.deadlock_api_service import DeadlockAPIService
 from app.services.parser_service import ParserService
 from app.repo.parsed_matches_repo import ParsedMatchesRepo
-from app.domain.match_analysis import MatchAnalysis
+from app.domain.match_analysis import (
+    MATCH_SCHEMA_VERSION,
+    MatchAnalysis,
+    MatchAnalysisSkeleton,
+    MatchDataSkeleton,
+    TransformedMatchData,
+)
+from app.domain.player import PlayerMatchData
+from app.domain.deadlock_api import LeanMatchMetadata, MatchMetadata
+from app.domain.boss import BossEvents, CompactBossTimeline
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.heatmap import HeatmapGroupBy, PositionHeatmaps
+from app.domain.position_track import SIMPLIFICATION_TOLERANCES, CompactPositionTrack
+from app.infra.cache.tiered_cache import TieredCache, analysis_cache_key, get_analysis_cache
 from app.infra.db.session import get_db_session
+from app.infra.metrics.timing import span
 from app.config import Settings, get_settings
 from app.utils.http_cache import check_if_not_modified
 from app.utils.logger import get_logger
@@ -25,6 +39,11 @@ from app.domain.exceptions import (
     MatchDataIntegrityException,
 )
 from app.application.use_cases.analyze_match import AnalyzeMatchUseCase
+from app.application.use_cases.get_boss_timelines import GetBossEventsUseCase, GetBossTimelinesUseCase
+from app.application.use_cases.get_damage_aggregates import GetDamageAggregatesUseCase
+from app.application.use_cases.get_match_skeleton import GetMatchSkeletonUseCase
+from app.application.use_cases.get_position_heatmaps import GetPositionHeatmapsUseCase
+from app.application.use_cases.get_position_tracks import GetPositionTracksUseCase
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -39,9 +58,15 @@ def get_parser_service() -> ParserService:
     return ParserService()
 
 ServiceDep = Annotated[DeadlockAPIService, Depends(get_deadlock_service)]
+AnalysisCacheDep = Annotated[TieredCache, Depends(get_analysis_cache)]
 ParserServiceDep = Annotated[ParserService, Depends(get_parser_service)]
 
-@router.get("/analysis/{match_id}", response_model=MatchAnalysis)
+def _analysis_etag(match_etag: str, full_metadata: bool, per_player_data: bool) -> str:
+    # Each response variant differs, so they must not share an ETag
+    etag = match_etag if per_player_data else f"{match_etag}-skeleton"
+    return f"{etag}-full" if full_metadata else etag
+
+@router.get("/analysis/{match_id}", response_model=MatchAnalysis | MatchAnalysisSkeleton)
 async def get_match_analysis(
     request: Request,
     match_id: int,
@@ -49,24 +74,54 @@ async def get_match_analysis(
     settings: SettingsDep,
     deadlock_api_service: ServiceDep,
     parser_service: ParserServiceDep,
+    analysis_cache: AnalysisCacheDep,
+    full_metadata: Annotated[bool, Query()] = False,
+    per_player_data: Annotated[bool, Query()] = True,
 ):
 
-    schema_version = 1
+    schema_version = MATCH_SCHEMA_VERSION
     repo = ParsedMatchesRepo()
 
     try:
-        # Execute use case
-        use_case = AnalyzeMatchUseCase(parser_service, deadlock_api_service, repo)
-        match_data, etag = await use_case.execute(match_id, schema_version, session)
-
-        # Check ETag for 304 Not Modified
-        if request_etag := request.headers.get("If-None-Match"):
-            not_modified_response = check_if_not_modified(request_etag, etag)
-            if not_modified_response:
+        # Answer conditional requests and cached responses from the etag
+        # column alone, before match_data (or the parser) is touched
+        request_etag = request.headers.get("If-None-Match")
+        stored_etag = await repo.get_etag(match_id, schema_version, session)
+        if stored_etag is not None:
+            etag = _analysis_etag(stored_etag, full_metadata, per_player_data)
+            if request_etag and check_if_not_modified(request_etag, etag):
                 return Response(
                     status_code=status.HTTP_304_NOT_MODIFIED,
                     headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
                 )
+            with span("cache_lookup"):
+                cached_response = await analysis_cache.get(analysis_cache_key(match_id, etag))
+            if cached_response is not None:
+                logger.info("Analysis response cache hit for match_id=%s", match_id)
+                return Response(
+                    content=cached_response,
+                    media_type="application/json",
+                    headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
+                )
+
+        # Execute use case
+        use_case = AnalyzeMatchUseCase(parser_service, deadlock_api_service, repo)
+        match_data: TransformedMatchData | MatchDataSkeleton
+        if per_player_data:
+            match_data, etag = await use_case.execute(match_id, schema_version, session)
+        else:
+            # Skeleton for the initial page load; players are fetched from
+            # /analysis/{match_id}/players/{custom_id} as they're viewed
+            skeleton_use_case = GetMatchSkeletonUseCase(use_case, repo)
+            match_data, etag = await skeleton_use_case.execute(match_id, schema_version, session)
+        etag = _analysis_etag(etag, full_metadata, per_player_data)
+
+        # Check ETag for 304 Not Modified
+        if request_etag and check_if_not_modified(request_etag, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
+            )
 
     except MatchDataUnavailableException:
         raise HTTPException(
@@ -120,28 +175,224 @@ async def get_match_analysis(
             detail="Internal Server Error",
         )
 
-    match_metadata = await deadlock_api_service.get_match_metadata_for(match_id)
+    # The analysis view only needs a handful of metadata fields; the full
+    # document (damage_matrix, match_paths, ...) is opt-in.
+    match_metadata: LeanMatchMetadata | MatchMetadata
+    if full_metadata:
+        match_metadata = await deadlock_api_service.get_match_metadata_for(match_id)
+    else:
+        match_metadata = await deadlock_api_service.get_lean_match_metadata_for(match_id)
 
     # Prepare analysis
     # match_info = match_metadata.match_info
     # players_list = match_info.players
-    analysis = MatchAnalysis(
-        match_metadata=match_metadata,
-        parsed_match_data=match_data,
-    )
+    analysis: MatchAnalysis | MatchAnalysisSkeleton
+    if isinstance(match_data, MatchDataSkeleton):
+        analysis = MatchAnalysisSkeleton(match_metadata=match_metadata, parsed_match_data=match_data)
+    else:
+        analysis = MatchAnalysis(match_metadata=match_metadata, parsed_match_data=match_data)
 
-    response_content = json.dumps(analysis.model_dump())
+    with span("response_encoding"):
+        response_content = analysis.model_dump_json().encode("utf-8")
+    await analysis_cache.set(analysis_cache_key(match_id, etag), response_content)
     response = Response(
         content=response_content, media_type="application/json"
     )
     response.headers["ETag"] = etag
     response.headers["Cache-Control"] = "public, max-age=300"
 
-    response_size = len(response_content.encode('utf-8'))
+    response_size = len(response_content)
     match_time_minutes = analysis.parsed_match_data.total_match_time_s / 60
     logger.info(
-        f"Match analysis for match_id={match_id} served with ETag={etag}. "
-        f"Match time={match_time_minutes:.2f} minutes ({analysis.parsed_match_data.total_match_time_s}s). "
-        f"Response size={response_size:,} bytes ({response_size / 1024:.2f} KB, {response_size / (1024 * 1024):.2f} MB)"
+        "Match analysis for match_id=%s served with ETag=%s. Match time=%.2f minutes (%ss). Response size=%s bytes",
+        match_id, etag, match_time_minutes, analysis.parsed_match_data.total_match_time_s, response_size,
     )
     return response
+
+@router.get("/analysis/{match_id}/players/{custom_id}", response_model=PlayerMatchData)
+async def get_match_player_data(
+    request: Request,
+    match_id: int,
+    custom_id: str,
+    session: SessionDep,
+):
+    try:
+        stored = await ParsedMatchesRepo().get_player_match_data(
+            match_id, MATCH_SCHEMA_VERSION, custom_id, session
+        )
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load player data for match_id=%s custom_id=%s", match_id, custom_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching player data",
+        )
+
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    player_data, match_etag = stored
+    if player_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {custom_id} not found in match {match_id}",
+        )
+
+    etag = f"{match_etag}-player-{custom_id}"
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if check_if_not_modified(request.headers.get("If-None-Match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=player_data.model_dump_json().encode("utf-8"),
+        media_type="application/json",
+        headers=headers,
+    )
+
+@router.get("/analysis/{match_id}/damage", response_model=list[PlayerDamageAggregates])
+async def get_match_damage_aggregates(
+    match_id: int,
+    session: SessionDep,
+    custom_id: Annotated[str | None, Query()] = None,
+):
+    try:
+        use_case = GetDamageAggregatesUseCase(ParsedMatchesRepo())
+        aggregates = await use_case.execute(match_id, MATCH_SCHEMA_VERSION, session, custom_id)
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load damage aggregates for match_id=%s", match_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching damage aggregates",
+        )
+
+    if aggregates is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    if custom_id is not None and not aggregates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {custom_id} not found in match {match_id}",
+        )
+    return aggregates
+
+@router.get("/analysis/{match_id}/heatmap", response_model=PositionHeatmaps)
+async def get_match_position_heatmaps(
+    match_id: int,
+    session: SessionDep,
+    grid_size: Annotated[int, Query(ge=8, le=256)] = 64,
+    group_by: Annotated[HeatmapGroupBy, Query()] = HeatmapGroupBy.MATCH,
+    custom_id: Annotated[list[str] | None, Query()] = None,
+    team: Annotated[int | None, Query()] = None,
+    start_s: Annotated[int, Query(ge=0)] = 0,
+    end_s: Annotated[int | None, Query(ge=0)] = None,
+):
+    if end_s is not None and end_s <= start_s:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="end_s must be greater than start_s",
+        )
+
+    try:
+        use_case = GetPositionHeatmapsUseCase(ParsedMatchesRepo())
+        heatmaps = await use_case.execute(
+            match_id, MATCH_SCHEMA_VERSION, session, grid_size, group_by, custom_id, team, start_s, end_s
+        )
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to build heatmaps for match_id=%s", match_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching match data",
+        )
+
+    if heatmaps is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    return heatmaps
+
+@router.get("/analysis/{match_id}/positions", response_model=list[CompactPositionTrack])
+async def get_match_position_tracks(
+    match_id: int,
+    session: SessionDep,
+    level: Annotated[int, Query(ge=0, le=max(SIMPLIFICATION_TOLERANCES))] = 1,
+    custom_id: Annotated[str | None, Query()] = None,
+):
+    try:
+        use_case = GetPositionTracksUseCase(ParsedMatchesRepo())
+        tracks = await use_case.execute(match_id, MATCH_SCHEMA_VERSION, level, session, custom_id)
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load position tracks for match_id=%s", match_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching position tracks",
+        )
+
+    if tracks is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    if custom_id is not None and not tracks:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {custom_id} not found in match {match_id}",
+        )
+    return tracks
+
+@router.get("/analysis/{match_id}/bosses/timelines", response_model=list[CompactBossTimeline])
+async def get_match_boss_timelines(
+    match_id: int,
+    session: SessionDep,
+):
+    try:
+        use_case = GetBossTimelinesUseCase(ParsedMatchesRepo())
+        timelines = await use_case.execute(match_id, MATCH_SCHEMA_VERSION, session)
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load boss timelines for match_id=%s", match_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching boss timelines",
+        )
+
+    if timelines is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    return timelines
+
+@router.get("/analysis/{match_id}/bosses/events", response_model=BossEvents)
+async def get_match_boss_events(
+    match_id: int,
+    session: SessionDep,
+    start_s: Annotated[int, Query(ge=0)] = 0,
+    end_s: Annotated[int | None, Query(ge=0)] = None,
+    entity_index: Annotated[int | None, Query()] = None,
+):
+    if end_s is not None and end_s <= start_s:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="end_s must be greater than start_s",
+        )
+
+    try:
+        use_case = GetBossEventsUseCase(ParsedMatchesRepo())
+        events = await use_case.execute(
+            match_id, MATCH_SCHEMA_VERSION, session, start_s, end_s, entity_index
+        )
+    except (MatchDataIntegrityException, SQLAlchemyError):
+        logger.exception("Failed to load boss events for match_id=%s", match_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching boss timelines",
+        )
+
+    if events is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Match {match_id} has not been analyzed yet",
+        )
+    return events
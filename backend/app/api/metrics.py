@@ -0,0 +1,104 @@
+from collections.abc import Iterator
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from app.api.session import current_user_lookups
+from app.application.use_cases.get_position_heatmaps import heatmap_cache
+from app.infra.cache.tiered_cache import get_analysis_cache
+from app.infra.deadlock_api.rate_limiter import get_rate_limiter
+from app.infra.deadlock_api.deadlock_api_client import get_deadlock_api_client
+from app.services.steam_account_service import get_steam_account_service
+from app.services.user_service import user_cache
+from app.utils.logger import LoggerManager
+
+router = APIRouter()
+
+
+class AppCountersCollector(Collector):
+    """
+    Exports the plain counters kept on caches and clients, read at scrape
+    time so the hot paths keep incrementing ints.
+    """
+
+    def describe(self) -> Iterator[Metric]:
+        # Without this, registering calls collect() and creates the clients at import
+        return iter(())
+
+    def collect(self) -> Iterator[Metric]:
+        api_client = get_deadlock_api_client()
+        steam_account_service = get_steam_account_service()
+        hits = CounterMetricFamily("cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache misses", labels=["cache"])
+        entries = GaugeMetricFamily("cache_entries", "Entries currently cached", labels=["cache"])
+        for name, cache in (
+            ("user", user_cache),
+            ("steam_summary", steam_account_service.cache),
+            ("heatmap", heatmap_cache),
+        ):
+            hits.add_metric([name], cache.hits)
+            misses.add_metric([name], cache.misses)
+            entries.add_metric([name], len(cache))
+
+        evictions = CounterMetricFamily("cache_evictions", "Entries evicted to stay under the size bound", labels=["cache"])
+        analysis_stats = get_analysis_cache().stats()
+        for tier, stats in analysis_stats.items():
+            name = f"analysis_{tier}"
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            evictions.add_metric([name], stats["evictions"])
+        entries.add_metric(["analysis_local"], analysis_stats["local"]["entries"])
+        yield from (hits, misses, entries, evictions)
+        yield GaugeMetricFamily(
+            "analysis_cache_local_size_bytes", "Bytes held by this worker's analysis cache",
+            value=analysis_stats["local"]["size_bytes"],
+        )
+        if "shared" in analysis_stats:
+            yield CounterMetricFamily(
+                "analysis_cache_shared_errors", "Shared analysis cache failures (served as misses)",
+                value=analysis_stats["shared"]["errors"],
+            )
+
+        yield CounterMetricFamily("deadlock_api_retries", "Deadlock API retries", value=api_client.retry_count)
+        yield CounterMetricFamily("deadlock_api_hedges", "Hedged Deadlock API requests", value=api_client.hedge_count)
+        yield CounterMetricFamily(
+            "deadlock_api_hedge_wins", "Hedged requests answered by the hedge", value=api_client.hedge_win_count
+        )
+
+        rate_limiter = get_rate_limiter()
+        acquired = CounterMetricFamily("deadlock_api_tokens_acquired", "Rate limiter tokens taken", labels=["priority"])
+        throttled = CounterMetricFamily("deadlock_api_throttled", "Requests that waited for a token", labels=["priority"])
+        waited = CounterMetricFamily("deadlock_api_throttle_wait_seconds", "Time spent waiting for tokens", labels=["priority"])
+        for priority in rate_limiter.acquired:
+            acquired.add_metric([priority.name.lower()], rate_limiter.acquired[priority])
+            throttled.add_metric([priority.name.lower()], rate_limiter.throttled[priority])
+            waited.add_metric([priority.name.lower()], rate_limiter.wait_time_s[priority])
+        yield from (acquired, throttled, waited)
+
+        yield CounterMetricFamily(
+            "steam_summary_upstream_calls", "Batched Steam player summary calls",
+            value=steam_account_service.batcher.upstream_calls,
+        )
+
+        lookups = CounterMetricFamily("current_user_lookups", "How /session/current_user resolved users", labels=["source"])
+        lookups.add_metric(["token"], current_user_lookups.from_token)
+        lookups.add_metric(["service"], current_user_lookups.from_service)
+        yield lookups
+
+        logger_manager = LoggerManager()
+        yield CounterMetricFamily(
+            "log_records_dropped", "Log records dropped because the log queue was full",
+            value=logger_manager.queue_handler.dropped,
+        )
+        yield CounterMetricFamily(
+            "log_records_sampled_out", "INFO-and-below log records skipped by LOG_SAMPLE_RATES",
+            value=logger_manager.sampling_filter.sampled_out,
+        )
+
+
+REGISTRY.register(AppCountersCollector())
+
+
+@router.get("")
+async def metrics() -> Response:
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
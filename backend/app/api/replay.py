@@ -14,6 +14,6 @@ async def get_match_replay_url(match_id: int) -> str:
     if demo_url is None:
         raise HTTPException(status_code=404, detail="Demo URL not found for match {match_id}")
 
-    logger.info(f"Demo url ({demo_url}) for match ID: {match_id}")
+    logger.info("Demo url (%s) for match ID: %s", demo_url, match_id)
     encoded_demo_url = base64.urlsafe_b64encode(demo_url.encode()).decode()
     return encoded_demo_url
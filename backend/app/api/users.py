@@ -1,5 +1,5 @@
 from typing import Optional, Annotated
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infra.db.models import User
 from app.infra.db.session import get_db_session
@@ -21,6 +21,14 @@ async def find_user_by_steam_id(steam_id: str, session: Annotated[AsyncSession,
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+@router.get("/find-by-steam-ids", response_model=dict[str, User])
+async def find_users_by_steam_ids(
+    steam_ids: Annotated[list[str], Query(max_length=100)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+):
+    # Unregistered steam ids are simply absent from the result
+    return await UserService().find_users_by_steam_ids(steam_ids, session)
+
 @router.post("/create/{steam_id}", response_model=User, status_code=status.HTTP_201_CREATED)
 async def create_user(steam_id: str, session: Annotated[AsyncSession, Depends(get_db_session)]):
     try:
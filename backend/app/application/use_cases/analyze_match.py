@@ -1,7 +1,5 @@
 import base64
 import gzip
-import json
-import sys
 from app.domain.match_analysis import (
     TransformedMatchData,
     ParsedMatchResponse,
@@ -13,10 +11,11 @@ from app.domain.player import PlayerData
 from app.domain.exceptions import ParserServiceError, DeadlockAPIError
 from app.services.parser_service import ParserService
 from app.services.deadlock_api_service import DeadlockAPIService
-from app.services.transform_service import TransformService
 from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.application.use_cases.store_parsed_match import StoreParsedMatchUseCase
+from app.infra.metrics.memory import profile_memory
+from app.infra.metrics.timing import span
 from app.utils.logger import get_logger
-from app.utils.http_cache import compute_etag
 
 logger = get_logger(__name__)
 
@@ -29,8 +28,7 @@ class AnalyzeMatchUseCase:
     - Cache checking
     - Parser service interaction (local demo check + parsing)
     - Deadlock API fallback
-    - Data transformation
-    - Cache storage
+    - Data transformation and storage (see StoreParsedMatchUseCase)
     """
 
     def __init__(
@@ -65,22 +63,26 @@ class AnalyzeMatchUseCase:
             DeadlockAPIError: If Deadlock API fails
         """
         # 1. Check cache
-        match_data = await self.repo.get_match_data(match_id, schema_version, session)
+        stored = await self.repo.get_match_data_with_etag(match_id, schema_version, session)
 
-        if match_data:
+        if stored:
             logger.info("Cache hit for match_id=%s", match_id)
-            etag = compute_etag(match_data.model_dump(), schema_version)
-            return match_data, etag
+            # The etag was computed from this match_data when it was stored
+            return stored
 
         # 2. Cache miss - need to parse
         logger.info("Cache miss for match_id=%s, fetching data", match_id)
 
-        parsed_json_resp = await self._fetch_and_parse(match_id)
+        # Peak memory per stage (decode, build_models, transform, ...) when profiling
+        with profile_memory("ingest", f"match_id={match_id}"):
+            parsed_json_resp = await self._fetch_and_parse(match_id)
 
-        # 3. Transform parser response to domain model
-        match_data, etag = await self._transform_and_store(
-            match_id, schema_version, parsed_json_resp, session
-        )
+            # 3. Transform parser response to domain model
+            match_data, etag = await self._transform_and_store(
+                match_id, schema_version, parsed_json_resp, session
+            )
+            # Drop the raw payload so "held" reflects what ingestion leaves behind
+            del parsed_json_resp
 
         return match_data, etag
 
@@ -144,68 +146,35 @@ class AnalyzeMatchUseCase:
         Returns:
             (TransformedMatchData, etag) tuple
         """
-        # Log raw response size
-        raw_response_size = len(json.dumps(parsed_json_resp).encode('utf-8'))
-        logger.info(
-            f"Match {match_id} - Raw parser response size: {raw_response_size:,} bytes "
-            f"({raw_response_size / 1024:.2f} KB, {raw_response_size / (1024 * 1024):.2f} MB)"
-        )
-
         # Parse into domain models
-        players_list = [PlayerData(**p) for p in parsed_json_resp.get("players", [])]
-        parsed_damage = [ParsedAttackerVictimMap(**d) for d in parsed_json_resp.get("damage", {})]
-
-        parsed_match = ParsedMatchResponse(
-            total_match_time_s=parsed_json_resp.get("total_match_time_s", 0),
-            match_start_time_s=parsed_json_resp.get("match_start_time_s", 0),
-            damage=parsed_damage,
-            players_data=players_list,
-            positions=Positions(parsed_json_resp.get("positions", [])),
-            bosses=BossData(**parsed_json_resp.get("bosses", {}))
-        )
-
-        # Log compression metrics
-        compressed_parsed_match = gzip.compress(parsed_match.model_dump_json().encode("utf-8"))
+        with span("build_models"):
+            players_list = [PlayerData(**p) for p in parsed_json_resp.get("players", [])]
+            parsed_damage = [ParsedAttackerVictimMap(**d) for d in parsed_json_resp.get("damage", {})]
+
+            parsed_match = ParsedMatchResponse(
+                total_match_time_s=parsed_json_resp.get("total_match_time_s", 0),
+                match_start_time_s=parsed_json_resp.get("match_start_time_s", 0),
+                damage=parsed_damage,
+                players_data=players_list,
+                positions=Positions(parsed_json_resp.get("positions", [])),
+                bosses=BossData(**parsed_json_resp.get("bosses", {}))
+            )
+
+        with span("compress"):
+            parsed_match_json = parsed_match.model_dump_json().encode("utf-8")
+            compressed_parsed_match = gzip.compress(parsed_match_json)
+        uncompressed_size = len(parsed_match_json)
         compressed_size = len(compressed_parsed_match)
+        del parsed_match_json
         logger.info(
-            f"Match {match_id} - Compressed parsed_match size: {compressed_size:,} bytes "
-            f"({compressed_size / 1024:.2f} KB, {compressed_size / (1024 * 1024):.2f} MB)"
-        )
-
-        # Transform to final domain model
-        match_data = TransformService.to_match_data(parsed_match)
-
-        # Log transformation metrics
-        match_data_json = json.dumps(match_data.model_dump())
-        match_data_size = len(match_data_json.encode("utf-8"))
-        match_data_memory = sys.getsizeof(match_data)
-        logger.info(
-            f"Match {match_id} - match_data JSON size: {match_data_size:,} bytes "
-            f"({match_data_size / 1024:.2f} KB, {match_data_size / (1024 * 1024):.2f} MB)"
-        )
-        logger.info(
-            f"Match {match_id} - match_data in-memory size: {match_data_memory:,} bytes "
-            f"({match_data_memory / 1024:.2f} KB, {match_data_memory / (1024 * 1024):.2f} MB)"
-        )
-
-        # Log compression ratio
-        uncompressed_size = len(parsed_match.model_dump_json().encode("utf-8"))
-        compression_ratio = (1 - compressed_size / uncompressed_size) * 100
-        logger.info(
-            f"Match {match_id} - Compression ratio: {compression_ratio:.1f}% "
-            f"(uncompressed: {uncompressed_size:,} bytes, {uncompressed_size / 1024:.2f} KB, "
-            f"{uncompressed_size / (1024 * 1024):.2f} MB)"
+            "Match %s - parsed_match JSON: %s bytes, gzipped: %s bytes (%.1f%% smaller)",
+            match_id, uncompressed_size, compressed_size,
+            (1 - compressed_size / uncompressed_size) * 100,
         )
 
-        # Store in cache
-        etag = compute_etag(match_data.model_dump(), schema_version)
-        await self.repo.create_parsed_match(
-            match_id,
-            schema_version,
-            gzip.compress(parsed_match.model_dump_json().encode("utf-8")),
-            match_data.model_dump(),
-            etag,
-            session,
+        # Transform, derive and store
+        match_data, etag = await StoreParsedMatchUseCase(self.repo).execute(
+            match_id, schema_version, parsed_match, compressed_parsed_match, session
         )
 
         return match_data, etag
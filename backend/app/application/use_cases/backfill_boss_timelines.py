@@ -0,0 +1,53 @@
+from typing import Optional
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.boss_timeline_service import BossTimelineService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackfillBossTimelinesUseCase:
+    """
+    Use case for compacting boss timelines of matches stored before
+    BossTimeline existed, so the match search boss filters can see them.
+
+    Walks stored matches by ascending match_id in batches. Safe to re-run
+    (and to run alongside lazy backfills on read): matches with timelines
+    are skipped and existing rows are kept.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        schema_version: int,
+        session,
+        after_match_id: int = 0,
+        batch_size: int = 100,
+    ) -> tuple[int, Optional[int]]:
+        """
+        Backfill one batch of matches with ids greater than `after_match_id`.
+
+        Returns:
+            (number of matches backfilled, last match_id visited) tuple; the
+            match_id is None once there is nothing left to backfill
+        """
+        match_ids = await self.repo.get_match_ids_without_boss_timelines(
+            schema_version, after_match_id, batch_size, session
+        )
+        backfilled = 0
+        for match_id in match_ids:
+            match_data = await self.repo.get_match_data(match_id, schema_version, session)
+            if match_data is None:
+                continue
+
+            timelines = BossTimelineService.compact(match_data.bosses)
+            if not timelines:
+                logger.warning("Match %s has no bosses to backfill, skipping", match_id)
+                continue
+            await self.repo.create_boss_timelines(match_id, schema_version, timelines, session)
+            backfilled += 1
+
+        logger.info("Backfilled boss timelines for %s/%s matches", backfilled, len(match_ids))
+        return backfilled, (match_ids[-1] if match_ids else None)
@@ -0,0 +1,57 @@
+from typing import Optional
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.damage_aggregation_service import DamageAggregationService
+from app.services.match_stats_service import MatchStatsService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackfillMatchStatsUseCase:
+    """
+    Use case for indexing matches stored before PlayerMatchStat existed.
+
+    Walks stored matches by ascending match_id in batches, reusing stored
+    damage aggregates where a match already has them. Safe to re-run:
+    indexed matches are skipped.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        schema_version: int,
+        session,
+        after_match_id: int = 0,
+        batch_size: int = 100,
+    ) -> tuple[int, Optional[int]]:
+        """
+        Index one batch of matches with ids greater than `after_match_id`.
+
+        Returns:
+            (number of matches indexed, last match_id visited) tuple; the
+            match_id is None once there is nothing left to backfill
+        """
+        match_ids = await self.repo.get_match_ids_without_stats(
+            schema_version, after_match_id, batch_size, session
+        )
+        indexed = 0
+        for match_id in match_ids:
+            match_data = await self.repo.get_match_data(match_id, schema_version, session)
+            if match_data is None:
+                continue
+
+            damage_aggregates = await self.repo.get_damage_aggregates(match_id, schema_version, session)
+            if not damage_aggregates:
+                damage_aggregates = DamageAggregationService.aggregate(match_data)
+
+            match_stats = MatchStatsService.build(match_data, damage_aggregates)
+            if not match_stats:
+                logger.warning("Match %s has no players to index, skipping", match_id)
+                continue
+            await self.repo.create_match_stats(match_id, schema_version, match_stats, session)
+            indexed += 1
+
+        logger.info("Backfilled match stats for %s/%s matches", indexed, len(match_ids))
+        return indexed, (match_ids[-1] if match_ids else None)
@@ -0,0 +1,77 @@
+from typing import Optional
+from app.domain.boss import BossEvents, CompactBossTimeline
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.boss_timeline_service import BossTimelineService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetBossTimelinesUseCase:
+    """
+    Use case for reading change-point encoded boss health timelines.
+
+    Matches stored before boss timelines existed have no rows; those are
+    compacted from the stored match_data on first read and persisted.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        session,
+    ) -> Optional[list[CompactBossTimeline]]:
+        """
+        Returns:
+            Timelines for every boss, or None if the match has not been analyzed yet
+        """
+        timelines = await self.repo.get_boss_timelines(match_id, schema_version, session)
+        if timelines:
+            return timelines
+
+        match_data = await self.repo.get_match_data(match_id, schema_version, session)
+        if match_data is None:
+            return None
+
+        timelines = BossTimelineService.compact(match_data.bosses)
+        if timelines:
+            logger.info("Backfilling boss timelines for match_id=%s", match_id)
+            await self.repo.create_boss_timelines(match_id, schema_version, timelines, session)
+        return timelines
+
+
+class GetBossEventsUseCase:
+    """Use case for boss spawn, damage burst and death events in a time range."""
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        session,
+        start_s: int = 0,
+        end_s: Optional[int] = None,
+        entity_index: Optional[int] = None,
+    ) -> Optional[BossEvents]:
+        """
+        Returns:
+            Events overlapping [start_s, end_s) for every boss (or only
+            `entity_index`), or None if the match has not been analyzed yet
+        """
+        timelines = await GetBossTimelinesUseCase(self.repo).execute(match_id, schema_version, session)
+        if timelines is None:
+            return None
+
+        if entity_index is not None:
+            timelines = [t for t in timelines if t.entity_index == entity_index]
+        return BossEvents(
+            start_s=start_s,
+            end_s=end_s,
+            snapshots=[t.snapshot for t in timelines if t.snapshot is not None],
+            events=BossTimelineService.events(timelines, start_s, end_s),
+        )
@@ -0,0 +1,45 @@
+from typing import Optional
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.damage_aggregation_service import DamageAggregationService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetDamageAggregatesUseCase:
+    """
+    Use case for reading precomputed per-player damage aggregates.
+
+    Matches stored before aggregation existed have no aggregate rows; those
+    are computed from the stored match_data on first read and persisted.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        session,
+        custom_id: Optional[str] = None,
+    ) -> Optional[list[PlayerDamageAggregates]]:
+        """
+        Returns:
+            Aggregates for every player (or only `custom_id`), or None if the
+            match has not been analyzed yet
+        """
+        aggregates = await self.repo.get_damage_aggregates(match_id, schema_version, session)
+        if not aggregates:
+            match_data = await self.repo.get_match_data(match_id, schema_version, session)
+            if match_data is None:
+                return None
+
+            logger.info("Backfilling damage aggregates for match_id=%s", match_id)
+            aggregates = DamageAggregationService.aggregate(match_data)
+            await self.repo.create_damage_aggregates(match_id, schema_version, aggregates, session)
+
+        if custom_id is not None:
+            aggregates = [a for a in aggregates if a.custom_id == custom_id]
+        return aggregates
@@ -0,0 +1,48 @@
+from app.application.use_cases.analyze_match import AnalyzeMatchUseCase
+from app.domain.match_analysis import MatchDataSkeleton
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetMatchSkeletonUseCase:
+    """
+    Use case for the analysis page's initial load: match data without
+    per_player_data.
+
+    Stored matches are projected in Postgres; anything else goes through
+    AnalyzeMatchUseCase first, so a skeleton request can also trigger parsing.
+    """
+
+    def __init__(self, analyze_match: AnalyzeMatchUseCase, repo: ParsedMatchesRepo):
+        self.analyze_match = analyze_match
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        session,
+    ) -> tuple[MatchDataSkeleton, str]:
+        """
+        Returns:
+            (MatchDataSkeleton, etag) tuple; the etag is the full match_data's
+
+        Raises:
+            ParserServiceError: If the match must be parsed and the parser fails
+            DeadlockAPIError: If the match must be parsed and the Deadlock API fails
+        """
+        stored = await self.repo.get_match_skeleton(match_id, schema_version, session)
+        if stored is not None:
+            logger.info("Cache hit for match_id=%s (skeleton)", match_id)
+            return stored
+
+        match_data, etag = await self.analyze_match.execute(match_id, schema_version, session)
+        skeleton = MatchDataSkeleton(
+            total_match_time_s=match_data.total_match_time_s,
+            match_start_time_s=match_data.match_start_time_s,
+            players_data=match_data.players_data,
+            bosses=match_data.bosses,
+        )
+        return skeleton, etag
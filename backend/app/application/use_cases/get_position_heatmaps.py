@@ -0,0 +1,62 @@
+from typing import Optional
+from app.domain.heatmap import HeatmapGroupBy, PositionHeatmaps
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.heatmap_service import HeatmapService
+from app.utils.logger import get_logger
+from app.utils.ttl_cache import TTLCache
+
+logger = get_logger(__name__)
+
+# Keyed by the stored etag, so a re-analyzed match misses instead of serving
+# heatmaps of the old data; entries only expire to bound memory.
+heatmap_cache: TTLCache[tuple, PositionHeatmaps] = TTLCache(ttl_s=3600, maxsize=512)
+
+
+class GetPositionHeatmapsUseCase:
+    """Use case for binning a match's stored positions into heatmaps, with caching."""
+
+    def __init__(self, repo: ParsedMatchesRepo, cache: TTLCache[tuple, PositionHeatmaps] = heatmap_cache):
+        self.repo = repo
+        self.cache = cache
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        session,
+        grid_size: int,
+        group_by: HeatmapGroupBy = HeatmapGroupBy.MATCH,
+        custom_ids: Optional[list[str]] = None,
+        team: Optional[int] = None,
+        start_s: int = 0,
+        end_s: Optional[int] = None,
+    ) -> Optional[PositionHeatmaps]:
+        """
+        Returns:
+            The heatmaps, or None if the match has not been analyzed yet
+        """
+        etag = await self.repo.get_etag(match_id, schema_version, session)
+        if etag is None:
+            return None
+
+        params = (
+            grid_size, group_by,
+            tuple(sorted(custom_ids)) if custom_ids is not None else None,
+            team, start_s, end_s,
+        )
+        cached = self.cache.get((match_id, schema_version, etag, *params))
+        if cached is not None:
+            return cached
+
+        stored = await self.repo.get_match_data_with_etag(match_id, schema_version, session)
+        if stored is None:
+            return None
+        match_data, etag = stored
+
+        heatmaps = HeatmapService.build(
+            match_data, grid_size, group_by, custom_ids, team, start_s, end_s
+        )
+        # Keyed by the etag of the data actually binned, in case the match
+        # was re-analyzed in between
+        self.cache.set((match_id, schema_version, etag, *params), heatmaps)
+        return heatmaps
@@ -0,0 +1,49 @@
+from typing import Optional
+from app.domain.position_track import CompactPositionTrack
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.position_compaction_service import PositionCompactionService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetPositionTracksUseCase:
+    """
+    Use case for reading compact position tracks at a simplification level.
+
+    Matches stored before compaction existed have no track rows; those are
+    compacted from the stored match_data on first read and persisted.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        level: int,
+        session,
+        custom_id: Optional[str] = None,
+    ) -> Optional[list[CompactPositionTrack]]:
+        """
+        Returns:
+            Tracks for every player (or only `custom_id`), or None if the
+            match has not been analyzed yet
+        """
+        tracks = await self.repo.get_position_tracks(match_id, schema_version, level, session)
+        if not tracks:
+            match_data = await self.repo.get_match_data(match_id, schema_version, session)
+            if match_data is None:
+                return None
+
+            logger.info("Backfilling compact position tracks for match_id=%s", match_id)
+            all_tracks = PositionCompactionService.compact_all(
+                {cid: p.positions for cid, p in match_data.per_player_data.items()}
+            )
+            await self.repo.create_position_tracks(match_id, schema_version, all_tracks, session)
+            tracks = [t for t in all_tracks if t.level == level]
+
+        if custom_id is not None:
+            tracks = [t for t in tracks if t.custom_id == custom_id]
+        return tracks
@@ -0,0 +1,52 @@
+import gzip
+import orjson
+from typing import Optional
+from app.application.use_cases.store_parsed_match import StoreParsedMatchUseCase
+from app.domain.match_analysis import ParsedMatchResponse, TransformedMatchData
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RetransformMatchUseCase:
+    """
+    Use case for rebuilding stored match data from its raw parser payload,
+    e.g. after MATCH_SCHEMA_VERSION is bumped, without re-parsing the demo.
+
+    The payload is read through a (memory-mapped, where possible) view of
+    the blob and replaces the match's rows in one transaction.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        from_schema_version: int,
+        to_schema_version: int,
+        session,
+    ) -> Optional[tuple[TransformedMatchData, str]]:
+        """
+        Returns:
+            (TransformedMatchData, etag) tuple, or None if the match isn't
+            stored under `from_schema_version`
+
+        Raises:
+            MatchDataUnavailableException: If the raw payload is missing from the blob store
+            MatchDataIntegrityException: If the rebuilt match could not be
+                stored; the match stays under `from_schema_version`
+        """
+        async with self.repo.open_raw_gzip(match_id, from_schema_version, session) as raw_payload:
+            if raw_payload is None:
+                return None
+
+            parsed_match = ParsedMatchResponse.model_validate(orjson.loads(gzip.decompress(raw_payload)))
+            logger.info(
+                "Re-transforming match_id=%s from schema v%s to v%s",
+                match_id, from_schema_version, to_schema_version,
+            )
+            return await StoreParsedMatchUseCase(self.repo).execute(
+                match_id, to_schema_version, parsed_match, raw_payload, session, replace=True
+            )
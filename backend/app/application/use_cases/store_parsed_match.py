@@ -0,0 +1,73 @@
+from app.domain.match_analysis import ParsedMatchResponse, TransformedMatchData
+from app.infra.metrics.timing import span
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.boss_timeline_service import BossTimelineService
+from app.services.damage_aggregation_service import DamageAggregationService
+from app.services.match_stats_service import MatchStatsService
+from app.services.position_compaction_service import PositionCompactionService
+from app.services.transform_service import TransformService
+from app.utils.http_cache import compute_etag
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StoreParsedMatchUseCase:
+    """
+    Use case for turning a parser response into stored match data.
+
+    Transforms the ParsedMatchResponse, precomputes the derived views
+    (damage aggregates, position tracks, cross-match stats, boss timelines)
+    and stores them with the match in one transaction.
+    """
+
+    def __init__(self, repo: ParsedMatchesRepo):
+        self.repo = repo
+
+    async def execute(
+        self,
+        match_id: int,
+        schema_version: int,
+        parsed_match: ParsedMatchResponse,
+        raw_payload_gzip: bytes | memoryview,
+        session,
+        replace: bool = False,
+    ) -> tuple[TransformedMatchData, str]:
+        """
+        Args:
+            raw_payload_gzip: The gzipped ParsedMatchResponse JSON
+            replace: Replace any stored row (and derived rows) for the match,
+                e.g. when re-transforming under a new schema version
+
+        Returns:
+            (TransformedMatchData, etag) tuple
+        """
+        with span("transform"):
+            match_data = TransformService.to_match_data(parsed_match)
+
+        # Precompute per-player damage aggregates so charts don't need match_data
+        with span("derive"):
+            damage_aggregates = DamageAggregationService.aggregate(match_data)
+            position_tracks = PositionCompactionService.compact_all(
+                {custom_id: p.positions for custom_id, p in match_data.per_player_data.items()}
+            )
+            match_stats = MatchStatsService.build(match_data, damage_aggregates)
+            boss_timelines = BossTimelineService.compact(match_data.bosses)
+
+        with span("etag"):
+            match_data_dump = match_data.model_dump()
+            etag = compute_etag(match_data_dump, schema_version)
+        await self.repo.create_parsed_match(
+            match_id,
+            schema_version,
+            raw_payload_gzip,
+            match_data_dump,
+            etag,
+            session,
+            damage_aggregates=damage_aggregates,
+            position_tracks=position_tracks,
+            match_stats=match_stats,
+            boss_timelines=boss_timelines,
+            replace=replace,
+        )
+        return match_data, etag
@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "secretKey"
     JWT_ALGORITHM: str = "algo"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Embed the session user (id and timestamps, never steam ids) in access
+    # tokens so /session/current_user can skip the DB; claims may then be up
+    # to JWT_ACCESS_TOKEN_EXPIRE_MINUTES stale
+    JWT_EMBED_USER_CLAIMS: bool = False
     FERNET_SECRET_KEY: str = "key"
 
     POSTGRES_USER: str = "user"
@@ -21,6 +25,15 @@ class Settings(BaseSettings):
 
     DEADLOCK_API_KEY: str = "key"
     DEADLOCK_API_DOMAIN: str = "apiDomain"
+    DEADLOCK_API_MAX_RETRIES: int = 3
+    DEADLOCK_API_RATE_LIMIT_PER_S: float = 10.0
+    DEADLOCK_API_RATE_LIMIT_BURST: int = 20
+    # Share of the bucket that background jobs may not dip into; must leave
+    # them at least one token (burst * reserve + 1 <= burst)
+    DEADLOCK_API_BACKGROUND_RESERVE: float = 0.5
+    DEADLOCK_API_HEDGE_ENABLED: bool = True
+    DEADLOCK_API_HEDGE_DEFAULT_DELAY_S: float = 2.0
+    MATCH_HISTORY_REFRESH_INTERVAL_S: int = 300
 
     FRONTEND_BASE_URL: str = "url"
     BACKEND_BASE_URL: str = "url"
@@ -29,5 +42,50 @@ class Settings(BaseSettings):
     STEAM_WEB_API_KEY: str = "key"
     STEAM_HASH_SALT: str = "salt"
     LIFTED_STEAM_ID: str = "steamId"
+    STEAM_SUMMARY_CACHE_TTL_S: int = 300
+    STEAM_SUMMARY_BATCH_WINDOW_MS: int = 5
+    USER_CACHE_TTL_S: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Raw parser payloads: "local" (sharded files under BLOB_STORE_PATH) or
+    # "s3" (any S3-compatible bucket; needs boto3, credentials from the usual
+    # AWS_* environment variables)
+    BLOB_STORE_BACKEND: str = "local"
+    BLOB_STORE_PATH: str = "blobs"
+    BLOB_STORE_S3_BUCKET: str = "bucket"
+    BLOB_STORE_S3_ENDPOINT_URL: str = ""
+    BLOB_STORE_S3_PREFIX: str = "raw-payloads/"
+
+    # Serialized analysis responses: a per-worker LRU plus an optional tier
+    # shared by every worker ("disk" or "redis"; "" disables it)
+    ANALYSIS_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    ANALYSIS_CACHE_SHARED_BACKEND: str = ""
+    ANALYSIS_CACHE_DISK_PATH: str = "cache/analysis"
+    ANALYSIS_CACHE_DISK_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+    ANALYSIS_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    ANALYSIS_CACHE_REDIS_TTL_S: int = 24 * 60 * 60
+
+    # Optional OpenTelemetry tracing (see app/infra/metrics/tracing.py for the
+    # packages it needs). TRACING_EXPORTER is "otlp" (OTLP/HTTP, e.g. a local
+    # collector) or "file" (JSON lines in TRACING_FILE_PATH)
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "otlp"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_SERVICE_NAME: str = "deadlock-analytics-backend"
+    TRACING_SAMPLE_RATIO: float = 1.0
+
+    # Per-stage tracemalloc peaks for match ingestion (app/infra/metrics/memory.py);
+    # slows ingestion down, so only for sizing workers
+    MEMORY_PROFILING_ENABLED: bool = False
+
+    # Logging goes through a bounded queue to a listener thread; records are
+    # dropped (and counted) when it is full. LOG_FORMAT is "text" or "json".
+    # LOG_SAMPLE_RATES keeps a share of INFO-and-below records per logger
+    # prefix, e.g. LOG_SAMPLE_RATES='{"app.api.match": 0.1}'
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_SAMPLE_RATES: dict[str, float] = {}
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
\ No newline at end of file
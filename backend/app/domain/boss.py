@@ -1,6 +1,10 @@
+from enum import Enum
 from sqlmodel import SQLModel
 from typing import Optional
 
+# Health drops at most this many seconds apart are one damage burst
+BOSS_DAMAGE_BURST_GAP_S = 5
+
 class BossSnapshot(SQLModel):
     entity_index: int
     custom_id: int     # Entity type ID (21, 25, 26, 27, 28)
@@ -22,3 +26,35 @@ BossHealthTimeline = list[BossHealthWindow]
 class BossData(SQLModel):
     snapshots: list[BossSnapshot]
     health_timeline: BossHealthTimeline
+
+# Change-point encoding of one boss's health_timeline column: the boss has
+# health[i] from t[i] (seconds since match start) until t[i + 1]. Bosses sit
+# at full health for most of a match, so this is a few dozen points instead
+# of one dict entry per second.
+class CompactBossTimeline(SQLModel):
+    entity_index: int
+    snapshot: Optional[BossSnapshot] = None
+    t: list[int]
+    health: list[int]
+
+class BossEventType(str, Enum):
+    SPAWN = "spawn"
+    DAMAGE = "damage"  # a burst of health loss; see BOSS_DAMAGE_BURST_GAP_S
+    DEATH = "death"    # entity deleted (killed, or removed at match end)
+
+class BossEvent(SQLModel):
+    type: BossEventType
+    entity_index: int
+    time_s: int
+    # Last second of a damage burst; equal to time_s for spawn/death
+    end_s: int
+    # Health after the event
+    health: Optional[int] = None
+    # Health lost over a damage burst
+    damage: Optional[int] = None
+
+class BossEvents(SQLModel):
+    start_s: int
+    end_s: Optional[int] = None
+    snapshots: list[BossSnapshot]
+    events: list[BossEvent]
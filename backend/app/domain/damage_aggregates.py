@@ -0,0 +1,16 @@
+from sqlmodel import SQLModel
+
+# Damage totals for one attacker, precomputed at ingest so charts don't have
+# to re-scan the per-second DamageRecord lists in PlayerMatchData.damage.
+# Dict keys are strings to survive the JSON round trip (victim custom_id,
+# ability_id, citadel_type; missing ids are bucketed under "0").
+class PlayerDamageAggregates(SQLModel):
+    custom_id: str
+    total_damage: int
+    total_absorbed: int
+    total_health_lost: int
+    # cumulative_damage[i] = damage dealt in seconds [0, i]
+    cumulative_damage: list[int]
+    by_victim: dict[str, int]
+    by_ability: dict[str, int]
+    by_citadel_type: dict[str, int]
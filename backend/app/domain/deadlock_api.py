@@ -61,3 +61,21 @@ class MatchSummary(SQLModel):
     match_result: int
     objectives_mask_team0: int
     objectives_mask_team1: int
+
+# Lean projection of MatchMetadata holding only what the analysis view reads.
+# Unknown fields (damage_matrix, match_paths, etc.) are dropped by the validator
+# instead of being validated as Any blobs and re-serialized on every response.
+class LeanMatchInfoFields(SQLModel):
+    duration_s: int
+    match_outcome: int
+    winning_team: int
+    players: list[PlayerInfo]
+    start_time: int
+    match_id: int
+    game_mode: int
+    match_mode: int
+    objectives: list[dict[str, Any]]
+    mid_boss: list[dict[str, Any]]
+
+class LeanMatchMetadata(SQLModel):
+    match_info: LeanMatchInfoFields
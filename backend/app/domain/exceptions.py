@@ -16,4 +16,16 @@ class DeadlockAPIError(Exception):
 
 class ParserServiceError(Exception):
     """Raised when parser service is unavailable or returns an error."""
-    pass
\ No newline at end of file
+    pass
+
+class SteamAPIError(Exception):
+    """Raised when the Steam Web API is unavailable or returns an error."""
+    pass
+
+class BlobStoreError(Exception):
+    """Raised when a blob cannot be written to or read from the blob store."""
+    pass
+
+class BlobNotFoundError(BlobStoreError):
+    """Raised when no blob exists for a digest."""
+    pass
@@ -0,0 +1,24 @@
+from enum import Enum
+from sqlmodel import SQLModel
+
+# m_pGameRules.m_vMinimapMins/Maxs from the parser; constant across the matches
+# checked so far (see WORLD_BOUNDS in the frontend's matchAnalysis.ts)
+MINIMAP_MIN = -10752.0
+MINIMAP_MAX = 10752.0
+
+class HeatmapGroupBy(str, Enum):
+    MATCH = "match"    # one heatmap for every selected player
+    TEAM = "team"      # one heatmap per team, keyed by team number
+    PLAYER = "player"  # one heatmap per player, keyed by custom_id
+
+class PositionHeatmaps(SQLModel):
+    grid_size: int
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+    start_s: int
+    end_s: int
+    group_by: HeatmapGroupBy
+    # counts[row][col]: samples in the cell, rows run along y, cols along x
+    heatmaps: dict[str, list[list[int]]]
@@ -1,6 +1,6 @@
 from sqlmodel import SQLModel
 from app.domain.boss import BossData
-from app.domain.deadlock_api import MatchMetadata
+from app.domain.deadlock_api import LeanMatchMetadata, MatchMetadata
 from app.domain.player import (
     PlayerData,
     # PlayerInfo,
@@ -10,6 +10,10 @@ from app.domain.player import (
     ParsedAttackerVictimMap
 )
 
+# Bump whenever TransformedMatchData (or anything derived from it at ingest)
+# changes shape; stored rows with an older version are treated as misses.
+MATCH_SCHEMA_VERSION = 1
+
 class ParsedMatchResponse(SQLModel):
     total_match_time_s: int
     match_start_time_s: int
@@ -34,6 +38,18 @@ class TransformedMatchData(SQLModel):
     per_player_data: dict[str, PlayerMatchData]
     bosses: BossData
 
+# TransformedMatchData without per_player_data, for the initial page load;
+# players' positions/damage are fetched one at a time afterwards.
+class MatchDataSkeleton(SQLModel):
+    total_match_time_s: int
+    match_start_time_s: int
+    players_data: list[PlayerData]
+    bosses: BossData
+
 class MatchAnalysis(SQLModel):
-    match_metadata: MatchMetadata
+    match_metadata: LeanMatchMetadata | MatchMetadata
     parsed_match_data: TransformedMatchData
+
+class MatchAnalysisSkeleton(SQLModel):
+    match_metadata: LeanMatchMetadata | MatchMetadata
+    parsed_match_data: MatchDataSkeleton
@@ -0,0 +1,44 @@
+from enum import Enum
+from typing import Optional
+from sqlmodel import SQLModel
+
+# One player's line in one match, flattened out of TransformedMatchData so
+# questions across many matches ("avg damage by hero at minute 10 over my last
+# 50 matches") never have to load match_data.
+class PlayerMatchStats(SQLModel):
+    custom_id: str
+    steam_id_32: Optional[int] = None
+    hero_id: Optional[int] = None
+    team: int
+    total_match_time_s: int
+    # Played length: total_match_time_s minus the pregame
+    match_length_s: int
+    total_damage: int
+    total_absorbed: int
+    total_health_lost: int
+    # damage_by_minute[m] = damage dealt in seconds [0, 60 * m]
+    damage_by_minute: list[int]
+
+class StatsGroupBy(str, Enum):
+    HERO = "hero"      # keyed by hero_id
+    PLAYER = "player"  # keyed by steam_id_32
+
+class DamageStatsRow(SQLModel):
+    key: int
+    player_matches: int
+    avg_total_damage: float
+    avg_damage_per_minute: float
+    # None when no minute was asked for, or no match in the group lasted that long
+    avg_damage_at_minute: Optional[float] = None
+
+class CrossMatchDamageStats(SQLModel):
+    group_by: StatsGroupBy
+    minute: Optional[int] = None
+    match_count: int
+    rows: list[DamageStatsRow]
+
+class MatchSearchResult(SQLModel):
+    match_id: int
+    total_match_time_s: Optional[int] = None
+    # Played length: total_match_time_s minus the pregame
+    match_length_s: Optional[int] = None
@@ -0,0 +1,27 @@
+from sqlmodel import SQLModel
+
+# World units per quantization step for compact tracks. The minimap spans
+# 21504 units, so 8 keeps ~2700 steps per axis - finer than any map view.
+POSITION_QUANTUM = 8.0
+
+# Simplification level -> max synchronized distance error (world units).
+# Level 0 keeps every sample; higher levels drop samples a playback view can
+# reconstruct by linear interpolation in time.
+SIMPLIFICATION_TOLERANCES: dict[int, float] = {
+    0: 0.0,
+    1: 64.0,
+    2: 256.0,
+}
+
+# Opt-in compact alternative to PlayerMatchData.positions for map playback.
+# Every list is delta-encoded: the first element is absolute, each following
+# element is the difference from the previous one. t is seconds since match
+# start; x/y/z are coordinates divided by `quantum` and rounded.
+class CompactPositionTrack(SQLModel):
+    custom_id: str
+    level: int
+    quantum: float
+    t: list[int]
+    x: list[int]
+    y: list[int]
+    z: list[int]
@@ -0,0 +1,10 @@
+from datetime import datetime
+from sqlmodel import SQLModel
+
+# The parts of a User that /session/current_user hands to the browser and
+# that access tokens may embed. Steam id ciphertext and hash stay server
+# side; load the User through UserService when they are needed.
+class SessionUser(SQLModel):
+    id: int
+    created_at: datetime
+    updated_at: datetime
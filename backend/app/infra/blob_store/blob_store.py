@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator
+from app.config import get_settings
+from app.domain.exceptions import BlobNotFoundError, BlobStoreError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def compute_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sharded_key(digest: str) -> str:
+    """ab/cd/abcd... - two levels of 256 keeps any one directory small."""
+    return f"{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed, write-once blob storage keyed by SHA-256 hex digest.
+
+    Writing the same bytes twice is a no-op, so callers never need to check
+    for existence first.
+    """
+
+    async def put(self, data: bytes | memoryview) -> str:
+        """Store `data` and return its digest."""
+        digest = compute_digest(data)
+        await self._put(digest, data)
+        return digest
+
+    @abstractmethod
+    async def _put(self, digest: str, data: bytes | memoryview) -> None: ...
+
+    @abstractmethod
+    async def get(self, digest: str) -> bytes:
+        """
+        Raises:
+            BlobNotFoundError: If nothing is stored under `digest`
+        """
+
+    @abstractmethod
+    async def delete(self, digest: str) -> None: ...
+
+    @asynccontextmanager
+    async def open(self, digest: str) -> AsyncIterator[memoryview]:
+        """
+        Read-only view of a blob, valid until the context exits.
+
+        Stores that can map the blob (the local filesystem) do so, so large
+        payloads aren't copied onto the heap; the default reads it in full.
+        """
+        yield memoryview(await self.get(digest))
+
+
+class LocalFileBlobStore(BlobStore):
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / sharded_key(digest)
+
+    async def _put(self, digest: str, data: bytes | memoryview) -> None:
+        await asyncio.to_thread(self._write, self.path_for(digest), data)
+
+    @staticmethod
+    def _write(path: Path, data: bytes | memoryview) -> None:
+        if path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            raise BlobStoreError(f"Write blob {path.name} failed: {e}") from e
+
+    async def get(self, digest: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self.path_for(digest).read_bytes)
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(f"Blob {digest} not found") from e
+        except OSError as e:
+            raise BlobStoreError(f"Read blob {digest} failed: {e}") from e
+
+    async def delete(self, digest: str) -> None:
+        try:
+            await asyncio.to_thread(self.path_for(digest).unlink, missing_ok=True)
+        except OSError as e:
+            raise BlobStoreError(f"Delete blob {digest} failed: {e}") from e
+
+    @asynccontextmanager
+    async def open(self, digest: str) -> AsyncIterator[memoryview]:
+        path = self.path_for(digest)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(f"Blob {digest} not found") from e
+        except OSError as e:
+            raise BlobStoreError(f"Open blob {digest} failed: {e}") from e
+
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blobs in an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    `client` is a boto3 S3 client or anything with the same put_object /
+    get_object / head_object / delete_object methods.
+    """
+
+    def __init__(self, client: Any, bucket: str, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def key_for(self, digest: str) -> str:
+        return f"{self.prefix}{sharded_key(digest)}"
+
+    async def _put(self, digest: str, data: bytes | memoryview) -> None:
+        key = self.key_for(digest)
+        try:
+            if await asyncio.to_thread(self._exists, key):
+                return
+            await asyncio.to_thread(self.client.put_object, Bucket=self.bucket, Key=key, Body=bytes(data))
+        except Exception as e:
+            raise BlobStoreError(f"Write blob {key} failed: {e}") from e
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except Exception as e:
+            if self._is_not_found(e):
+                return False
+            raise
+
+    async def get(self, digest: str) -> bytes:
+        key = self.key_for(digest)
+        try:
+            response = await asyncio.to_thread(self.client.get_object, Bucket=self.bucket, Key=key)
+            return await asyncio.to_thread(response["Body"].read)
+        except Exception as e:
+            if self._is_not_found(e):
+                raise BlobNotFoundError(f"Blob {digest} not found") from e
+            raise BlobStoreError(f"Read blob {key} failed: {e}") from e
+
+    async def delete(self, digest: str) -> None:
+        key = self.key_for(digest)
+        try:
+            await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+        except Exception as e:
+            raise BlobStoreError(f"Delete blob {key} failed: {e}") from e
+
+    @staticmethod
+    def _is_not_found(e: Exception) -> bool:
+        # botocore ClientError carries the S3 error code; avoid importing it
+        code = getattr(e, "response", {}).get("Error", {}).get("Code")
+        return code in ("404", "NoSuchKey", "NotFound")
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    settings = get_settings()
+    if settings.BLOB_STORE_BACKEND == "s3":
+        # Optional dependency; only needed when blobs live in a bucket
+        import boto3  # type: ignore[import-not-found]
+
+        client = boto3.client("s3", endpoint_url=settings.BLOB_STORE_S3_ENDPOINT_URL or None)
+        return S3BlobStore(client, settings.BLOB_STORE_S3_BUCKET, settings.BLOB_STORE_S3_PREFIX)
+    if settings.BLOB_STORE_BACKEND != "local":
+        raise ValueError(f"Unknown BLOB_STORE_BACKEND: {settings.BLOB_STORE_BACKEND}")
+    return LocalFileBlobStore(settings.BLOB_STORE_PATH)
@@ -0,0 +1,180 @@
+"""
+Caches shared by every worker process on a host (or across hosts, for Redis).
+"""
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SharedCache(ABC):
+    """
+    Bytes cache with string keys, shared between processes.
+
+    Every key lives in a namespace (e.g. the match schema version), and
+    `purge_other_namespaces` drops everything written under older ones.
+    Failures are logged and treated as misses; a broken shared tier must
+    never fail a request.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self._get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("%s get failed: %s", self.__class__.__name__, e)
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self._set(key, value)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("%s set failed: %s", self.__class__.__name__, e)
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def _set(self, key: str, value: bytes) -> None: ...
+
+    @abstractmethod
+    async def purge_other_namespaces(self) -> None: ...
+
+
+class DiskCache(SharedCache):
+    """
+    Files under `root/<namespace>/`, one per key, bounded by total bytes.
+
+    Eviction is approximate: when this process's running total passes
+    `max_bytes`, the namespace directory is rescanned and the least recently
+    read files are removed until it is back under 90%.
+    """
+
+    def __init__(self, root: str | Path, namespace: str, max_bytes: int):
+        super().__init__(namespace)
+        self.root = Path(root)
+        self.directory = self.root / namespace
+        self.max_bytes = max_bytes
+        self._size_bytes: Optional[int] = None
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / hashlib.sha256(key.encode()).hexdigest()
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, self.path_for(key))
+
+    @staticmethod
+    def _read(path: Path) -> Optional[bytes]:
+        try:
+            value = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            # Reads refresh the mtime used for eviction, so it acts as LRU
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted by another worker since the read
+        return value
+
+    async def _set(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self._write, self.path_for(key), value)
+
+    def _write(self, path: Path, value: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if self._size_bytes is None:
+            self._size_bytes = self._scan_size()
+        else:
+            self._size_bytes += len(value)
+        if self._size_bytes > self.max_bytes:
+            self._evict()
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.iterdir() if p.is_file())
+
+    def _evict(self) -> None:
+        files = []
+        for p in self.directory.iterdir():
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue  # evicted by another worker
+            files.append((stat.st_mtime, stat.st_size, p))
+        files.sort()
+
+        size_bytes = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        for _, size, p in files:
+            if size_bytes <= target:
+                break
+            p.unlink(missing_ok=True)
+            size_bytes -= size
+            self.evictions += 1
+        self._size_bytes = size_bytes
+
+    async def purge_other_namespaces(self) -> None:
+        await asyncio.to_thread(self._purge)
+
+    def _purge(self) -> None:
+        if not self.root.exists():
+            return
+        for p in self.root.iterdir():
+            if p.is_dir() and p.name != self.namespace:
+                logger.info("Purging stale cache namespace %s", p)
+                shutil.rmtree(p, ignore_errors=True)
+
+
+class RedisCache(SharedCache):
+    """
+    Keys in a Redis-compatible server, prefixed by namespace.
+
+    `client` is a redis.asyncio.Redis (or compatible) client. Entries expire
+    after `ttl_s`, which is also how older namespaces go away.
+    """
+
+    def __init__(self, client: Any, namespace: str, ttl_s: int):
+        super().__init__(namespace)
+        self.client = client
+        self.ttl_s = ttl_s
+
+    def key_for(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.key_for(key))
+
+    async def _set(self, key: str, value: bytes) -> None:
+        await self.client.set(self.key_for(key), value, ex=self.ttl_s)
+
+    async def purge_other_namespaces(self) -> None:
+        # Keys under other namespaces expire on their own; scanning a shared
+        # keyspace to delete them isn't worth it
+        return None
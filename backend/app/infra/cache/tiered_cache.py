@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Optional
+from app.config import get_settings
+from app.domain.match_analysis import MATCH_SCHEMA_VERSION
+from app.infra.cache.shared_cache import DiskCache, RedisCache, SharedCache
+from app.utils.byte_lru_cache import ByteLRUCache
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TieredCache:
+    """
+    Per-process byte-bounded LRU in front of an optional shared cache.
+
+    Reads try the local tier, then the shared tier (promoting hits into the
+    local tier); writes go to both.
+    """
+
+    def __init__(self, local: ByteLRUCache[str], shared: Optional[SharedCache] = None):
+        self.local = local
+        self.shared = shared
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = self.local.get(key)
+        if value is not None or self.shared is None:
+            return value
+
+        value = await self.shared.get(key)
+        if value is not None:
+            self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            await self.shared.set(key, value)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        stats = {
+            "local": {
+                "hits": self.local.hits,
+                "misses": self.local.misses,
+                "evictions": self.local.evictions,
+                "entries": len(self.local),
+                "size_bytes": self.local.size_bytes,
+            },
+        }
+        if self.shared is not None:
+            stats["shared"] = {
+                "hits": self.shared.hits,
+                "misses": self.shared.misses,
+                "evictions": self.shared.evictions,
+                "errors": self.shared.errors,
+            }
+        return stats
+
+
+def analysis_cache_key(match_id: int, etag: str) -> str:
+    # The schema version is the cache namespace; the etag already changes
+    # whenever match_data or the response variant does
+    return f"analysis:{match_id}:{etag}"
+
+
+@lru_cache
+def get_analysis_cache() -> TieredCache:
+    """
+    Serialized /match/analysis responses, namespaced by MATCH_SCHEMA_VERSION
+    so a schema bump never serves entries built from the old shape.
+    """
+    settings = get_settings()
+    namespace = f"v{MATCH_SCHEMA_VERSION}"
+    local = ByteLRUCache[str](settings.ANALYSIS_CACHE_MAX_BYTES)
+
+    shared: Optional[SharedCache] = None
+    if settings.ANALYSIS_CACHE_SHARED_BACKEND == "disk":
+        shared = DiskCache(
+            settings.ANALYSIS_CACHE_DISK_PATH, namespace, settings.ANALYSIS_CACHE_DISK_MAX_BYTES
+        )
+    elif settings.ANALYSIS_CACHE_SHARED_BACKEND == "redis":
+        # Optional dependency; only needed when the shared tier is Redis
+        import redis.asyncio  # type: ignore[import-not-found]
+
+        shared = RedisCache(
+            redis.asyncio.Redis.from_url(settings.ANALYSIS_CACHE_REDIS_URL),
+            namespace,
+            settings.ANALYSIS_CACHE_REDIS_TTL_S,
+        )
+    elif settings.ANALYSIS_CACHE_SHARED_BACKEND:
+        raise ValueError(f"Unknown ANALYSIS_CACHE_SHARED_BACKEND: {settings.ANALYSIS_CACHE_SHARED_BACKEND}")
+
+    return TieredCache(local, shared)
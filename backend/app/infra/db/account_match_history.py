@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlmodel import Column, SQLModel, Field
+from sqlalchemy import BigInteger, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from app.utils.datetime_utils import utcnow
+
+class AccountMatch(SQLModel, table=True):
+    """One row per (account, match) from the Deadlock API match history.
+
+    - summary: the full MatchSummary payload as returned upstream
+    - start_time: copied out of summary so history can be paged and
+      refreshed incrementally without touching JSONB
+    """
+
+    __table_args__ = (
+        Index("ix_accountmatch_account_id_start_time", "account_id", "start_time"),
+    )
+
+    account_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    match_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    start_time: int = Field(nullable=False)
+    summary: dict = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
+
+class AccountMatchHistorySync(SQLModel, table=True):
+    """Tracks when an account's match history was last refreshed upstream."""
+
+    account_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    refreshed_at: datetime = Field(default_factory=utcnow, nullable=False)
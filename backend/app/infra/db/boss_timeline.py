@@ -0,0 +1,35 @@
+from typing import Optional
+from sqlmodel import Column, SQLModel, Field
+from sqlalchemy import Computed, Index, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+class BossTimeline(SQLModel, table=True):
+    """Change-point encoded boss health derived from ParsedMatch.match_data.
+
+    One row per (match, boss entity), written in the same transaction as the
+    ParsedMatch; see CompactBossTimeline for the encoding. snapshot is the
+    BossSnapshot for the entity, if the parser reported one.
+
+    boss_custom_id (boss type, see BossSnapshot.custom_id) and death_time_s
+    are generated from snapshot so "matches where X died before T" is an
+    index scan; they are never written directly.
+    """
+
+    __table_args__ = (
+        Index("ix_bosstimeline_boss_custom_id_death_time_s", "boss_custom_id", "death_time_s"),
+    )
+
+    match_id: int = Field(primary_key=True)
+    schema_version: int = Field(primary_key=True)
+    entity_index: int = Field(primary_key=True)
+    snapshot: Optional[dict] = Field(default=None, sa_column=Column(JSONB, nullable=True))
+    t: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    health: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    boss_custom_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, Computed("(snapshot ->> 'custom_id')::integer", persisted=True)),
+    )
+    death_time_s: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, Computed("(snapshot ->> 'death_time_s')::integer", persisted=True)),
+    )
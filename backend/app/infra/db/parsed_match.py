@@ -1,23 +1,52 @@
 from datetime import datetime
+from typing import Optional
 from sqlmodel import Column, SQLModel, Field
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import LargeBinary
+from sqlalchemy import BigInteger, Computed, Integer, LargeBinary
 from app.utils.datetime_utils import utcnow
 
 class ParsedMatch(SQLModel, table=True):
     """Parsed match storage.
 
     Fields mirror the updated migration (a5efbb84a293):
-    - raw_payload_gzip: original gzipped parser payload bytes
+    - raw_payload_digest / raw_payload_size: SHA-256 and byte size of the
+      gzipped parser payload, which lives in the blob store (see BlobStore)
+    - raw_payload_gzip: the payload itself, only for rows stored before the
+      blob store; NULL otherwise (see app.jobs.offload_raw_payloads)
     - match_data: for data shape, see MatchAnalysis domain model - ParsedMatchData
     - etag: SHA‑256 hex digest of canonical uncompressed *raw* payload
     - schema_version: allows future transform/schema evolution
+    - total_match_time_s: generated from match_data (never written directly)
+    - match_length_s: generated played length, total_match_time_s minus
+      match_start_time_s, so length filters are an index scan instead of a
+      JSONB scan (never written directly)
     """
 
     match_id: int = Field(primary_key=True, index=True)
     schema_version: int = Field(default=1, index=True)
-    raw_payload_gzip: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    raw_payload_digest: Optional[str] = Field(default=None, max_length=64, nullable=True)
+    raw_payload_size: Optional[int] = Field(default=None, sa_column=Column(BigInteger, nullable=True))
+    raw_payload_gzip: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
     match_data: dict = Field(sa_column=Column(JSONB, nullable=False))
     etag: str = Field(nullable=False, index=True)
+    total_match_time_s: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Computed("(match_data ->> 'total_match_time_s')::integer", persisted=True),
+        ),
+    )
+    match_length_s: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Computed(
+                "(match_data ->> 'total_match_time_s')::integer"
+                " - coalesce((match_data ->> 'match_start_time_s')::integer, 0)",
+                persisted=True,
+            ),
+            index=True,
+        ),
+    )
     created_at: datetime = Field(default_factory=utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=utcnow, nullable=False)
@@ -0,0 +1,21 @@
+from sqlmodel import Column, SQLModel, Field
+from sqlalchemy import Integer
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+class PlayerDamageAggregate(SQLModel, table=True):
+    """Per-player damage aggregates derived from ParsedMatch.match_data.
+
+    Rows are written in the same transaction as the ParsedMatch they were
+    computed from; see PlayerDamageAggregates for the field meanings.
+    """
+
+    match_id: int = Field(primary_key=True)
+    schema_version: int = Field(primary_key=True)
+    custom_id: str = Field(primary_key=True)
+    total_damage: int = Field(nullable=False)
+    total_absorbed: int = Field(nullable=False)
+    total_health_lost: int = Field(nullable=False)
+    cumulative_damage: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    by_victim: dict = Field(sa_column=Column(JSONB, nullable=False))
+    by_ability: dict = Field(sa_column=Column(JSONB, nullable=False))
+    by_citadel_type: dict = Field(sa_column=Column(JSONB, nullable=False))
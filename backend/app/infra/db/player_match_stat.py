@@ -0,0 +1,30 @@
+from typing import Optional
+from sqlmodel import Column, SQLModel, Field
+from sqlalchemy import BigInteger, Index, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+
+class PlayerMatchStat(SQLModel, table=True):
+    """One narrow row per (match, player) for cross-match analytics.
+
+    Written in the same transaction as the ParsedMatch it was derived from;
+    see PlayerMatchStats for the field meanings. The indexes cover the two
+    access paths: a player's most recent matches and everything on a hero.
+    """
+
+    __table_args__ = (
+        Index("ix_playermatchstat_steam_id_32_match_id", "steam_id_32", "match_id"),
+        Index("ix_playermatchstat_hero_id_match_id", "hero_id", "match_id"),
+    )
+
+    match_id: int = Field(primary_key=True)
+    schema_version: int = Field(primary_key=True)
+    custom_id: str = Field(primary_key=True)
+    steam_id_32: Optional[int] = Field(default=None, sa_column=Column(BigInteger, nullable=True))
+    hero_id: Optional[int] = Field(default=None, nullable=True)
+    team: int = Field(nullable=False)
+    total_match_time_s: int = Field(nullable=False)
+    match_length_s: int = Field(nullable=False)
+    total_damage: int = Field(nullable=False)
+    total_absorbed: int = Field(nullable=False)
+    total_health_lost: int = Field(nullable=False)
+    damage_by_minute: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
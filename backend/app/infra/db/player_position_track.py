@@ -0,0 +1,21 @@
+from sqlmodel import Column, SQLModel, Field
+from sqlalchemy import Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+
+class PlayerPositionTrack(SQLModel, table=True):
+    """Compact per-player position tracks derived from ParsedMatch.match_data.
+
+    One row per (match, player, simplification level), written in the same
+    transaction as the ParsedMatch. t/x/y/z are delta-encoded; see the
+    CompactPositionTrack domain model for the encoding.
+    """
+
+    match_id: int = Field(primary_key=True)
+    schema_version: int = Field(primary_key=True)
+    custom_id: str = Field(primary_key=True)
+    level: int = Field(primary_key=True)
+    quantum: float = Field(nullable=False)
+    t: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    x: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    y: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+    z: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
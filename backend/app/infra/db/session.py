@@ -1,12 +1,17 @@
-from typing import Annotated, AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, AsyncGenerator, AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
 from fastapi import Depends
 from app.config import Settings, get_settings
 
-async def get_db_session(settings: Annotated[Settings, Depends(get_settings)]) -> AsyncGenerator[AsyncSession, None]:
-    database_url = settings.DATABASE_URL
+@lru_cache
+def get_engine(database_url: str) -> AsyncEngine:
+    """One engine (and connection pool) per database URL for the life of the process."""
+    return create_async_engine(database_url, echo=False)
 
-    engine = create_async_engine(database_url, echo=False)
+async def get_db_session(settings: Annotated[Settings, Depends(get_settings)]) -> AsyncGenerator[AsyncSession, None]:
+    engine = get_engine(settings.DATABASE_URL)
     async_session = async_sessionmaker(engine, expire_on_commit=False)
 
     async with async_session() as session:
@@ -14,4 +19,13 @@ async def get_db_session(settings: Annotated[Settings, Depends(get_settings)]) -
             yield session
         except Exception:
             await session.rollback()
-            raise
\ No newline at end of file
+            raise
+
+@asynccontextmanager
+async def job_sessionmaker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Session factory for jobs run outside a request (see app.jobs); disposes the engine on exit."""
+    engine = create_async_engine(get_settings().DATABASE_URL, echo=False)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
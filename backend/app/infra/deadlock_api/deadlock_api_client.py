@@ -1,43 +1,246 @@
+import asyncio
+import random
 import textwrap
-from httpx import AsyncClient, Response, Timeout
+import time
+import orjson
+from collections import deque
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from httpx import USE_CLIENT_DEFAULT, AsyncClient, Response, Timeout, TransportError
 from app.config import get_settings
-from app.domain.deadlock_api import MatchMetadata, MatchSummary
+from app.domain.deadlock_api import LeanMatchMetadata, MatchMetadata, MatchSummary
 from app.domain.exceptions import DeadlockAPIError
+from app.infra.deadlock_api.rate_limiter import RequestPriority, get_rate_limiter
+from app.infra.metrics.timing import timed
+from app.utils.datetime_utils import utcnow
 from app.utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
+
+# Per-endpoint timeouts. Metadata/salts are small documents; anything slower
+# than this is a sick upstream node and is better retried (or hedged).
+MATCH_HISTORY_TIMEOUT = Timeout(30.0, connect=5.0)
+METADATA_TIMEOUT = Timeout(20.0, connect=5.0)
+SALTS_TIMEOUT = Timeout(15.0, connect=5.0)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter."""
+
+    def __init__(self, max_retries: int = 3, base_delay_s: float = 0.5, max_delay_s: float = 10.0):
+        self.max_retries = max_retries
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+
+    def backoff_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Delay before retry number `attempt + 1`.
+
+        A Retry-After header (delta-seconds or HTTP date) takes precedence,
+        capped at max_delay_s so a misbehaving upstream can't park requests.
+        """
+        if retry_after:
+            retry_after_s = self._parse_retry_after(retry_after)
+            if retry_after_s is not None:
+                return min(retry_after_s, self.max_delay_s)
+
+        ceiling = min(self.max_delay_s, self.base_delay_s * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float | None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - utcnow()).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+class LatencyTracker:
+    """Rolling window of request latencies used to pick the hedge delay."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, latency_s: float) -> None:
+        self.samples.append(latency_s)
+
+    def percentile(self, pct: float) -> float | None:
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+
 class DeadlockAPIClient:
     def __init__(self):
         self.api_key = settings.DEADLOCK_API_KEY
-        self.timeout = Timeout(300.0, connect=30.0)
+        self.timeout = Timeout(60.0, connect=10.0)
         self.client = AsyncClient(timeout=self.timeout)
+        self.retry_policy = RetryPolicy(max_retries=settings.DEADLOCK_API_MAX_RETRIES)
+        self.rate_limiter = get_rate_limiter()
+        self.hedge_enabled = settings.DEADLOCK_API_HEDGE_ENABLED
+        self.hedge_default_delay_s = settings.DEADLOCK_API_HEDGE_DEFAULT_DELAY_S
+        self.hedge_latency = LatencyTracker()
+        self.retry_count = 0
+        self.hedge_count = 0
+        self.hedge_win_count = 0
+
+    @timed("deadlock_api")
+    async def call_api(
+        self,
+        url: str,
+        timeout: Timeout | None = None,
+        hedge: bool = False,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> Response:
+        """
+        GET `url` with retries on 429/5xx and transport errors.
+
+        Every attempt (including retries and hedges) spends a token from the
+        shared rate limiter at the given priority.
+
+        Args:
+            url: Absolute Deadlock API URL
+            timeout: Per-endpoint timeout, defaults to the client timeout
+            hedge: Send a second request if the first is slower than the
+                observed p95. Only use for idempotent GETs.
+            priority: INTERACTIVE for user-facing requests, BACKGROUND for jobs
 
-    async def call_api(self, url: str) -> Response:
+        Raises:
+            DeadlockAPIError: On a non-retryable error or once retries run out
+        """
+        attempt = 0
+        while True:
+            try:
+                if hedge and self.hedge_enabled:
+                    response = await self._hedged_get(url, timeout, priority)
+                else:
+                    response = await self._get(url, timeout, priority)
+            except TransportError as e:
+                if attempt >= self.retry_policy.max_retries:
+                    logger.error("DeadlockAPIClient#call_api(%s) failed: %s - %s", url, e.__class__.__name__, e)
+                    raise DeadlockAPIError(f"#call_api({url}) Failed: {e.__class__.__name__} - {e}") from e
+                delay = self.retry_policy.backoff_delay(attempt)
+                reason = e.__class__.__name__
+            else:
+                if not response.is_error:
+                    return response
+
+                truncated_text = textwrap.shorten(response.text, width=200, placeholder='...')
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.retry_policy.max_retries:
+                    logger.error("DeadlockAPIClient#call_api(%s) failed: %s - %s", url, response.status_code, truncated_text)
+                    raise DeadlockAPIError(f"#call_api({url}) Failed: HTTP {response.status_code} - {truncated_text}")
+                delay = self.retry_policy.backoff_delay(attempt, response.headers.get("Retry-After"))
+                reason = f"HTTP {response.status_code}"
+
+            attempt += 1
+            self.retry_count += 1
+            logger.warning(
+                "DeadlockAPIClient#call_api(%s) got %s, retrying in %.2fs (attempt %s/%s)",
+                url, reason, delay, attempt, self.retry_policy.max_retries,
+            )
+            await asyncio.sleep(delay)
+
+    async def _send(self, url: str, timeout: Timeout | None) -> Response:
         headers = {"X-API-Key": self.api_key}
-        response = await self.client.get(url, headers=headers)
-        if response.is_error:
-            truncated_text = textwrap.shorten(response.text, width=200, placeholder='...')
-            logger.error(f"DeadlockAPIClient#call_api({url}) failed: {response.status_code} - {truncated_text}")
-            raise DeadlockAPIError(f"#call_api({url}) Failed: HTTP {response.status_code} - {truncated_text}")
+        return await self.client.get(
+            url, headers=headers, timeout=timeout if timeout is not None else USE_CLIENT_DEFAULT
+        )
+
+    async def _get(self, url: str, timeout: Timeout | None, priority: RequestPriority) -> Response:
+        await self.rate_limiter.acquire(priority)
+        return await self._send(url, timeout)
+
+    async def _timed_get(self, url: str, timeout: Timeout | None, priority: RequestPriority) -> Response:
+        await self.rate_limiter.acquire(priority)
+        start = time.perf_counter()
+        try:
+            response = await self._send(url, timeout)
+        except asyncio.CancelledError:
+            # A primary that lost to its hedge was at least this slow; dropping
+            # it would leave only the fast samples and pull the p95 down
+            self.hedge_latency.record(time.perf_counter() - start)
+            raise
+        self.hedge_latency.record(time.perf_counter() - start)
         return response
 
-    async def fetch_account_match_history(self, steam_id: str) -> list[MatchSummary]:
+    async def _hedged_get(self, url: str, timeout: Timeout | None, priority: RequestPriority) -> Response:
+        """Race a second request against a slow first one; first to finish wins."""
+        primary = asyncio.create_task(self._timed_get(url, timeout, priority))
+        hedge_delay = self.hedge_latency.percentile(95) or self.hedge_default_delay_s
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        self.hedge_count += 1
+        logger.info("DeadlockAPIClient hedging %s after %.2fs", url, hedge_delay)
+        secondary = asyncio.create_task(self._timed_get(url, timeout, priority))
+        pending = {primary, secondary}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            self.hedge_win_count += 1
+                        return task.result()
+            # Both attempts raised; surface the primary's error to the retry loop
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the loser record its latency before the next hedge delay is picked
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def fetch_account_match_history(
+        self,
+        steam_id: str,
+        min_start_time: int | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> list[MatchSummary]:
         url = self.api_url(f"/v1/players/{steam_id}/match-history")
-        response = await self.call_api(url)
+        if min_start_time is not None:
+            url = f"{url}?min_unix_timestamp={min_start_time}"
+        response = await self.call_api(url, timeout=MATCH_HISTORY_TIMEOUT, priority=priority)
         return response.json()
 
-    async def fetch_match_metadata(self, match_id: int) -> MatchMetadata:
+    async def fetch_match_metadata(
+        self, match_id: int, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> MatchMetadata:
         url = self.api_url(f"/v1/matches/{match_id}/metadata")
-        response = await self.call_api(url)
-        return MatchMetadata(**response.json())
+        response = await self.call_api(url, timeout=METADATA_TIMEOUT, hedge=True, priority=priority)
+        return MatchMetadata.model_validate(orjson.loads(response.content))
 
-    async def fetch_salts(self, match_id: int) -> dict[str, str]:
+    async def fetch_lean_match_metadata(
+        self, match_id: int, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> LeanMatchMetadata:
+        url = self.api_url(f"/v1/matches/{match_id}/metadata")
+        response = await self.call_api(url, timeout=METADATA_TIMEOUT, hedge=True, priority=priority)
+        return LeanMatchMetadata.model_validate(orjson.loads(response.content))
+
+    async def fetch_salts(
+        self, match_id: int, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> dict[str, str]:
         url = self.api_url(f"/v1/matches/{match_id}/salts")
-        response = await self.call_api(url)
+        response = await self.call_api(url, timeout=SALTS_TIMEOUT, hedge=True, priority=priority)
         return response.json()
 
     @staticmethod
     def api_url(path: str) -> str:
         return f"{settings.DEADLOCK_API_DOMAIN}{path}"
 
+
+@lru_cache
+def get_deadlock_api_client() -> DeadlockAPIClient:
+    """The process-wide client, created on first use rather than at import."""
+    return DeadlockAPIClient()
+
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from enum import IntEnum
+from functools import lru_cache
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Who is waiting on an outbound Deadlock API request."""
+    INTERACTIVE = 0  # a user is waiting on the response (e.g. /match/analysis)
+    BACKGROUND = 1   # backfill, prewarm and other batch jobs
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket shared by every Deadlock API request in the process.
+
+    Interactive requests may spend any available token. Background requests
+    only run while the bucket holds more than `background_reserve` of its
+    capacity and no interactive request is waiting, so batch jobs are the
+    first to be throttled as we approach the API key quota.
+
+    Raises:
+        ValueError: If the reserve leaves no room for a background token,
+            which would stall background requests forever
+    """
+
+    def __init__(self, rate_per_s: float, burst: int, background_reserve: float = 0.5):
+        if rate_per_s <= 0 or burst < 1:
+            raise ValueError(f"Rate limiter needs rate_per_s > 0 and burst >= 1, got {rate_per_s} and {burst}")
+        reserve_tokens = burst * background_reserve
+        if background_reserve < 0 or reserve_tokens + 1 > burst:
+            raise ValueError(
+                f"background_reserve={background_reserve} must be >= 0 and leave at least one "
+                f"of the {burst} burst tokens to background requests"
+            )
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self.reserve_tokens = reserve_tokens
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._interactive_waiting = 0
+        self.acquired = {priority: 0 for priority in RequestPriority}
+        self.throttled = {priority: 0 for priority in RequestPriority}
+        self.wait_time_s = {priority: 0.0 for priority in RequestPriority}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate_per_s)
+        self.updated_at = now
+
+    def _tokens_needed(self, priority: RequestPriority) -> float:
+        # Background requests must leave the reserve untouched after taking a token
+        return 1.0 if priority == RequestPriority.INTERACTIVE else 1.0 + self.reserve_tokens
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> None:
+        """Wait until a token is available for `priority`, then take it."""
+        started_at = time.monotonic()
+        throttled = False
+        if priority == RequestPriority.INTERACTIVE:
+            self._interactive_waiting += 1
+        try:
+            while True:
+                self._refill()
+                needed = self._tokens_needed(priority)
+                blocked_by_interactive = (
+                    priority == RequestPriority.BACKGROUND and self._interactive_waiting > 0
+                )
+                if self.tokens >= needed and not blocked_by_interactive:
+                    self.tokens -= 1.0
+                    break
+
+                throttled = True
+                shortfall = max(needed - self.tokens, 0.0)
+                await asyncio.sleep(max(shortfall / self.rate_per_s, 0.001))
+        finally:
+            if priority == RequestPriority.INTERACTIVE:
+                self._interactive_waiting -= 1
+
+        self.acquired[priority] += 1
+        if throttled:
+            waited = time.monotonic() - started_at
+            self.throttled[priority] += 1
+            self.wait_time_s[priority] += waited
+            logger.debug("Deadlock API %s request throttled for %.3fs", priority.name, waited)
+
+
+@lru_cache
+def get_rate_limiter() -> TokenBucketRateLimiter:
+    settings = get_settings()
+    return TokenBucketRateLimiter(
+        rate_per_s=settings.DEADLOCK_API_RATE_LIMIT_PER_S,
+        burst=settings.DEADLOCK_API_RATE_LIMIT_BURST,
+        background_reserve=settings.DEADLOCK_API_BACKGROUND_RESERVE,
+    )
@@ -0,0 +1,146 @@
+"""
+Opt-in memory profiling for match ingestion.
+
+With tracemalloc running (MEMORY_PROFILING_ENABLED, or PYTHONTRACEMALLOC=N
+in the environment), every timing.span also records how far Python
+allocations rose above their level at the start of the stage, and how much
+of that was still held at the end. Stages are observed in Prometheus and
+collected per match by `profile_memory`, which logs one line per ingestion.
+
+tracemalloc is process-wide, so concurrent requests inflate each other's
+numbers; profile with one ingestion at a time when sizing workers.
+Allocations made outside Python's allocator (numpy buffers are traced,
+most C extensions are not) only show up in the RSS figures.
+"""
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import Gauge, Histogram
+from app.config import Settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MB = 1024 * 1024
+# From small DB reads to the largest matches we have seen OOM a worker
+MEMORY_BUCKETS = tuple(n * MB for n in (1, 4, 16, 64, 128, 256, 512, 1024, 2048, 4096))
+
+STAGE_MEMORY_PEAK = Histogram(
+    "stage_memory_peak_bytes",
+    "Peak traced Python allocations during a stage, above the level at its start",
+    ["stage"],
+    buckets=MEMORY_BUCKETS,
+)
+PROCESS_MAX_RSS = Gauge(
+    "process_max_rss_bytes",
+    "High-water mark of the worker's resident set size",
+)
+
+
+def max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryProfile:
+    """Per-stage memory for one ingestion; repeated stages keep the largest peak."""
+
+    def __init__(self, label: str):
+        self.label = label
+        # stage -> (peak_bytes, retained_bytes)
+        self.stages: dict[str, tuple[int, int]] = {}
+        self.peak_bytes = 0
+        self.max_rss_bytes: Optional[int] = None
+
+    def record(self, stage: str, peak_bytes: int, retained_bytes: int) -> None:
+        previous_peak, _ = self.stages.get(stage, (0, 0))
+        self.stages[stage] = (max(previous_peak, peak_bytes), retained_bytes)
+
+    def summary(self) -> str:
+        stages = ", ".join(
+            f"{stage}={peak / MB:.1f}MB (+{retained / MB:.1f}MB held)"
+            for stage, (peak, retained) in self.stages.items()
+        )
+        max_rss = f"{self.max_rss_bytes / MB:.1f}MB" if self.max_rss_bytes is not None else "n/a"
+        return f"peak={self.peak_bytes / MB:.1f}MB, max_rss={max_rss}; {stages}"
+
+
+class _Frame:
+    def __init__(self):
+        # Absolute traced peak seen by nested stages, which reset the counter
+        self.nested_peak_bytes = 0
+
+
+_profile: ContextVar[Optional[MemoryProfile]] = ContextVar("memory_profile", default=None)
+_frame: ContextVar[Optional[_Frame]] = ContextVar("memory_frame", default=None)
+
+
+@contextmanager
+def track(stage: str) -> Iterator[None]:
+    """Record the memory used by the enclosed block as `stage` (a no-op unless tracing)."""
+    if not tracemalloc.is_tracing():
+        yield
+        return
+
+    parent = _frame.get()
+    start_bytes, peak_so_far = tracemalloc.get_traced_memory()
+    if parent is not None:
+        parent.nested_peak_bytes = max(parent.nested_peak_bytes, peak_so_far)
+    tracemalloc.reset_peak()
+    frame = _Frame()
+    token = _frame.set(frame)
+    try:
+        yield
+    finally:
+        _frame.reset(token)
+        end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        peak_bytes = max(peak_bytes, frame.nested_peak_bytes)
+        if parent is not None:
+            parent.nested_peak_bytes = max(parent.nested_peak_bytes, peak_bytes)
+
+        STAGE_MEMORY_PEAK.labels(stage).observe(peak_bytes - start_bytes)
+        profile = _profile.get()
+        if profile is not None:
+            profile.record(stage, peak_bytes - start_bytes, end_bytes - start_bytes)
+
+
+@contextmanager
+def profile_memory(stage: str, label: str) -> Iterator[Optional[MemoryProfile]]:
+    """
+    Track the block as `stage`, collect the stages run inside it and log
+    them as one line.
+
+    Yields:
+        The MemoryProfile being filled in, or None if profiling is off
+    """
+    if not tracemalloc.is_tracing():
+        yield None
+        return
+
+    profile = MemoryProfile(label)
+    token = _profile.set(profile)
+    try:
+        with track(stage):
+            yield profile
+    finally:
+        _profile.reset(token)
+        profile.peak_bytes = profile.stages.get(stage, (0, 0))[0]
+        profile.max_rss_bytes = max_rss_bytes()
+        if profile.max_rss_bytes is not None:
+            PROCESS_MAX_RSS.set(profile.max_rss_bytes)
+        logger.info("Memory profile for %s: %s", label, profile.summary())
+
+
+def setup_memory_profiling(settings: Settings) -> None:
+    """Start tracemalloc if MEMORY_PROFILING_ENABLED; it slows allocation-heavy code down noticeably."""
+    if settings.MEMORY_PROFILING_ENABLED and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        logger.info("Memory profiling enabled")
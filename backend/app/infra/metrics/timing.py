@@ -0,0 +1,132 @@
+"""
+Per-request timing spans, reported as a Server-Timing header and as
+Prometheus histograms.
+"""
+import functools
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Optional, ParamSpec, TypeVar
+from prometheus_client import Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infra.metrics import memory
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Stages run from sub-millisecond (etag lookups) to minutes (parsing a demo)
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+STAGE_DURATION = Histogram(
+    "stage_duration_seconds",
+    "Time spent in one stage of request handling (db_fetch, parse, transform, ...)",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response headers were sent",
+    ["method", "route", "status"],
+    buckets=STAGE_BUCKETS,
+)
+
+
+class RequestTimings:
+    """Stage durations for one request; repeated stages are summed."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: dict[str, tuple[float, int]] = {}
+
+    def record(self, stage: str, duration_s: float) -> None:
+        total_s, count = self.stages.get(stage, (0.0, 0))
+        self.stages[stage] = (total_s + duration_s, count + 1)
+
+    def server_timing(self) -> str:
+        entries = [f"{stage};dur={total_s * 1000:.1f}" for stage, (total_s, _) in self.stages.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started_at) * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+# OpenTelemetry tracer, set by tracing.setup_tracing when tracing is enabled
+_tracer: Optional[Any] = None
+
+
+def set_tracer(tracer: Optional[Any]) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Time the enclosed block as `stage`.
+
+    Always observed in the stage histogram; also added to the current
+    request's Server-Timing header when run inside a request, traced as a
+    span when tracing is enabled, and memory-profiled when tracemalloc runs.
+    """
+    start = time.perf_counter()
+    try:
+        with (
+            _tracer.start_as_current_span(stage) if _tracer is not None else nullcontext(),
+            memory.track(stage),
+        ):
+            yield
+    finally:
+        duration_s = time.perf_counter() - start
+        STAGE_DURATION.labels(stage).observe(duration_s)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.record(stage, duration_s)
+
+
+def timed(stage: str) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Decorator form of `span` for coroutine functions."""
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with span(stage):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ServerTimingMiddleware:
+    """
+    Collects spans for each HTTP request, adds them as a Server-Timing header
+    and observes the request duration by route template.
+
+    Spans that finish after the headers are sent (e.g. while streaming a
+    body) still reach the stage histogram but not the header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+                route = scope.get("route")
+                REQUEST_DURATION.labels(
+                    scope["method"],
+                    getattr(route, "path", "unmatched"),
+                    str(message["status"]),
+                ).observe(time.perf_counter() - timings.started_at)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _request_timings.reset(token)
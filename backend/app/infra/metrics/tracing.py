@@ -0,0 +1,76 @@
+"""
+Optional OpenTelemetry tracing for routes, outbound httpx calls (the parser
+service, Deadlock API) and SQLAlchemy.
+
+Needs opentelemetry-sdk, opentelemetry-exporter-otlp-proto-http and
+opentelemetry-instrumentation-{fastapi,httpx,sqlalchemy}; they are only
+imported when TRACING_ENABLED is set.
+"""
+from typing import Any, Optional
+from fastapi import FastAPI
+from app.config import Settings
+from app.infra.db.session import get_engine
+from app.infra.metrics import timing
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _span_exporter(settings: Settings) -> Any:
+    if settings.TRACING_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    if settings.TRACING_EXPORTER == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        # One JSON span per line, for offline analysis
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE_PATH, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    raise ValueError(f"Unknown TRACING_EXPORTER: {settings.TRACING_EXPORTER}")
+
+
+def setup_tracing(app: FastAPI, settings: Settings) -> Optional[Any]:
+    """
+    Instrument `app` and export its traces, if TRACING_ENABLED.
+
+    httpx instrumentation propagates the trace context (traceparent header)
+    to the parser service. Stages timed with timing.span also become spans,
+    so a cold analysis shows db, parser, transform and encoding as children
+    of the route span.
+
+    Returns:
+        The TracerProvider to shut down on exit, or None if tracing is off
+    """
+    if not settings.TRACING_ENABLED:
+        return None
+
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(_span_exporter(settings)))
+    trace.set_tracer_provider(provider)
+
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=provider, excluded_urls="metrics")
+    HTTPXClientInstrumentor().instrument(tracer_provider=provider)
+    # create_async_engine binds create_engine at import, so the instrumentor's
+    # module patching never sees our engine; instrument it directly
+    SQLAlchemyInstrumentor().instrument(
+        tracer_provider=provider, engine=get_engine(settings.DATABASE_URL).sync_engine
+    )
+    timing.set_tracer(provider.get_tracer("app"))
+
+    logger.info("OpenTelemetry tracing enabled (%s exporter)", settings.TRACING_EXPORTER)
+    return provider
@@ -0,0 +1,55 @@
+"""create account match history
+
+Revision ID: b4621bd63f63
+Revises: a5efbb84a293
+Create Date: 2026-10-19 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b4621bd63f63"
+down_revision: Union[str, Sequence[str], None] = "a5efbb84a293"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.create_table(
+        "accountmatch",
+        sa.Column("account_id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column("match_id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column("start_time", sa.Integer(), nullable=False),
+        sa.Column(
+            "summary", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.create_index(
+        "ix_accountmatch_account_id_start_time",
+        "accountmatch",
+        ["account_id", "start_time"],
+    )
+    op.create_table(
+        "accountmatchhistorysync",
+        sa.Column("account_id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+def downgrade():
+    op.drop_table("accountmatchhistorysync")
+    op.drop_index("ix_accountmatch_account_id_start_time", table_name="accountmatch")
+    op.drop_table("accountmatch")
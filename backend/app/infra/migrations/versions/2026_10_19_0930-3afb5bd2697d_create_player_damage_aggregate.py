@@ -0,0 +1,36 @@
+"""create player damage aggregate
+
+Revision ID: 3afb5bd2697d
+Revises: b4621bd63f63
+Create Date: 2026-10-19 09:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3afb5bd2697d"
+down_revision: Union[str, Sequence[str], None] = "b4621bd63f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.create_table(
+        "playerdamageaggregate",
+        sa.Column("match_id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("schema_version", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("custom_id", sa.String(), primary_key=True, nullable=False),
+        sa.Column("total_damage", sa.Integer(), nullable=False),
+        sa.Column("total_absorbed", sa.Integer(), nullable=False),
+        sa.Column("total_health_lost", sa.Integer(), nullable=False),
+        sa.Column("cumulative_damage", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("by_victim", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("by_ability", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("by_citadel_type", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    )
+
+def downgrade():
+    op.drop_table("playerdamageaggregate")
@@ -0,0 +1,35 @@
+"""create player position track
+
+Revision ID: 1589404712ae
+Revises: 3afb5bd2697d
+Create Date: 2026-10-19 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "1589404712ae"
+down_revision: Union[str, Sequence[str], None] = "3afb5bd2697d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.create_table(
+        "playerpositiontrack",
+        sa.Column("match_id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("schema_version", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("custom_id", sa.String(), primary_key=True, nullable=False),
+        sa.Column("level", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("quantum", sa.Float(), nullable=False),
+        sa.Column("t", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("x", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("y", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("z", postgresql.ARRAY(sa.Integer()), nullable=False),
+    )
+
+def downgrade():
+    op.drop_table("playerpositiontrack")
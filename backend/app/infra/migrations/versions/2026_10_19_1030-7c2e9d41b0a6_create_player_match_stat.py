@@ -0,0 +1,49 @@
+"""create player match stat
+
+Revision ID: 7c2e9d41b0a6
+Revises: 1589404712ae
+Create Date: 2026-10-19 10:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9d41b0a6"
+down_revision: Union[str, Sequence[str], None] = "1589404712ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.create_table(
+        "playermatchstat",
+        sa.Column("match_id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("schema_version", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("custom_id", sa.String(), primary_key=True, nullable=False),
+        sa.Column("steam_id_32", sa.BigInteger(), nullable=True),
+        sa.Column("hero_id", sa.Integer(), nullable=True),
+        sa.Column("team", sa.Integer(), nullable=False),
+        sa.Column("total_match_time_s", sa.Integer(), nullable=False),
+        sa.Column("total_damage", sa.Integer(), nullable=False),
+        sa.Column("total_absorbed", sa.Integer(), nullable=False),
+        sa.Column("total_health_lost", sa.Integer(), nullable=False),
+        sa.Column("damage_by_minute", postgresql.ARRAY(sa.Integer()), nullable=False),
+    )
+    op.create_index(
+        "ix_playermatchstat_steam_id_32_match_id",
+        "playermatchstat",
+        ["steam_id_32", "match_id"],
+    )
+    op.create_index(
+        "ix_playermatchstat_hero_id_match_id",
+        "playermatchstat",
+        ["hero_id", "match_id"],
+    )
+
+def downgrade():
+    op.drop_index("ix_playermatchstat_hero_id_match_id", table_name="playermatchstat")
+    op.drop_index("ix_playermatchstat_steam_id_32_match_id", table_name="playermatchstat")
+    op.drop_table("playermatchstat")
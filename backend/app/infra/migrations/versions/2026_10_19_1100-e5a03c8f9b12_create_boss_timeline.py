@@ -0,0 +1,34 @@
+"""create boss timeline
+
+Revision ID: e5a03c8f9b12
+Revises: 7c2e9d41b0a6
+Create Date: 2026-10-19 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a03c8f9b12"
+down_revision: Union[str, Sequence[str], None] = "7c2e9d41b0a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.create_table(
+        "bosstimeline",
+        sa.Column("match_id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("schema_version", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("entity_index", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column(
+            "snapshot", postgresql.JSONB(astext_type=sa.Text()), nullable=True
+        ),
+        sa.Column("t", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("health", postgresql.ARRAY(sa.Integer()), nullable=False),
+    )
+
+def downgrade():
+    op.drop_table("bosstimeline")
@@ -0,0 +1,65 @@
+"""add generated match projection columns
+
+Revision ID: 0d8f6b7a3c21
+Revises: e5a03c8f9b12
+Create Date: 2026-10-19 11:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0d8f6b7a3c21"
+down_revision: Union[str, Sequence[str], None] = "e5a03c8f9b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    # Stored generated columns are computed for existing rows here, which
+    # rewrites both tables once
+    op.add_column(
+        "parsedmatch",
+        sa.Column(
+            "total_match_time_s",
+            sa.Integer(),
+            sa.Computed("(match_data ->> 'total_match_time_s')::integer", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_parsedmatch_total_match_time_s",
+        "parsedmatch",
+        ["total_match_time_s"],
+    )
+    op.add_column(
+        "bosstimeline",
+        sa.Column(
+            "boss_custom_id",
+            sa.Integer(),
+            sa.Computed("(snapshot ->> 'custom_id')::integer", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "bosstimeline",
+        sa.Column(
+            "death_time_s",
+            sa.Integer(),
+            sa.Computed("(snapshot ->> 'death_time_s')::integer", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_bosstimeline_boss_custom_id_death_time_s",
+        "bosstimeline",
+        ["boss_custom_id", "death_time_s"],
+    )
+
+def downgrade():
+    op.drop_index("ix_bosstimeline_boss_custom_id_death_time_s", table_name="bosstimeline")
+    op.drop_column("bosstimeline", "death_time_s")
+    op.drop_column("bosstimeline", "boss_custom_id")
+    op.drop_index("ix_parsedmatch_total_match_time_s", table_name="parsedmatch")
+    op.drop_column("parsedmatch", "total_match_time_s")
@@ -0,0 +1,29 @@
+"""move raw payloads to blob store
+
+Revision ID: 9b41e7d2c5f0
+Revises: 0d8f6b7a3c21
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9b41e7d2c5f0"
+down_revision: Union[str, Sequence[str], None] = "0d8f6b7a3c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.add_column("parsedmatch", sa.Column("raw_payload_digest", sa.String(length=64), nullable=True))
+    op.add_column("parsedmatch", sa.Column("raw_payload_size", sa.BigInteger(), nullable=True))
+    # Existing payloads stay in place until app.jobs.offload_raw_payloads moves them
+    op.alter_column("parsedmatch", "raw_payload_gzip", existing_type=sa.LargeBinary(), nullable=True)
+
+def downgrade():
+    # raw_payload_gzip stays nullable: offloaded rows have no payload to put
+    # back, and they can still be re-parsed from the demo
+    op.drop_column("parsedmatch", "raw_payload_size")
+    op.drop_column("parsedmatch", "raw_payload_digest")
@@ -0,0 +1,51 @@
+"""add generated match length column
+
+Revision ID: 3f6a2b8d1e47
+Revises: 9b41e7d2c5f0
+Create Date: 2026-10-19 12:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a2b8d1e47"
+down_revision: Union[str, Sequence[str], None] = "9b41e7d2c5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    # total_match_time_s includes pregame, so length filters move to the
+    # played length. A generated column can't reference another one, hence
+    # the repeated JSONB lookups. Rewrites parsedmatch once.
+    op.add_column(
+        "parsedmatch",
+        sa.Column(
+            "match_length_s",
+            sa.Integer(),
+            sa.Computed(
+                "(match_data ->> 'total_match_time_s')::integer"
+                " - coalesce((match_data ->> 'match_start_time_s')::integer, 0)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_parsedmatch_match_length_s",
+        "parsedmatch",
+        ["match_length_s"],
+    )
+    # Nothing filters on the raw end time any more
+    op.drop_index("ix_parsedmatch_total_match_time_s", table_name="parsedmatch")
+
+def downgrade():
+    op.create_index(
+        "ix_parsedmatch_total_match_time_s",
+        "parsedmatch",
+        ["total_match_time_s"],
+    )
+    op.drop_index("ix_parsedmatch_match_length_s", table_name="parsedmatch")
+    op.drop_column("parsedmatch", "match_length_s")
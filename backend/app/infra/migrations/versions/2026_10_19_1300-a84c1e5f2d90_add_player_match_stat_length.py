@@ -0,0 +1,34 @@
+"""add played length to player match stats
+
+Revision ID: a84c1e5f2d90
+Revises: 3f6a2b8d1e47
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a84c1e5f2d90"
+down_revision: Union[str, Sequence[str], None] = "3f6a2b8d1e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade():
+    op.add_column("playermatchstat", sa.Column("match_length_s", sa.Integer(), nullable=True))
+    # Existing rows take the played length of the match they were derived from
+    op.execute(
+        """
+        UPDATE playermatchstat AS s
+        SET match_length_s = coalesce(m.match_length_s, s.total_match_time_s)
+        FROM parsedmatch AS m
+        WHERE m.match_id = s.match_id
+        """
+    )
+    op.execute("UPDATE playermatchstat SET match_length_s = total_match_time_s WHERE match_length_s IS NULL")
+    op.alter_column("playermatchstat", "match_length_s", existing_type=sa.Integer(), nullable=False)
+
+def downgrade():
+    op.drop_column("playermatchstat", "match_length_s")
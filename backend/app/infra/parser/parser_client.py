@@ -1,7 +1,9 @@
 import time
+from functools import lru_cache
 import httpx
 from app.config import get_settings
 from app.domain.exceptions import ParserServiceError
+from app.infra.metrics.timing import span
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -40,7 +42,7 @@ class CircuitBreaker:
             self.last_failure_time = time.time()
 
             if self.failures >= self.failure_threshold:
-                logger.error(f"Circuit breaker threshold reached ({self.failures} failures) - opening circuit")
+                logger.error("Circuit breaker threshold reached (%s failures) - opening circuit", self.failures)
                 self.state = "open"
 
             raise
@@ -72,7 +74,8 @@ class ParserClient:
             url = f"{self.base_url}/check-demo/{match_id}"
             try:
                 logger.info("Checking parser for local demo: match_id=%s", match_id)
-                response = await self.client.get(url)
+                with span("parser_check"):
+                    response = await self.client.get(url)
                 response.raise_for_status()
                 data = response.json()
                 available = data.get("available", False)
@@ -120,13 +123,16 @@ class ParserClient:
 
             try:
                 logger.info("Calling parser service")
-                response = await self.client.post(
-                    url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
+                with span("parser_parse"):
+                    response = await self.client.post(
+                        url,
+                        json=payload,
+                        headers={"Content-Type": "application/json"}
+                    )
                 response.raise_for_status()
-                return response.json()
+                logger.info("Parser response: %s bytes", len(response.content))
+                with span("parser_decode"):
+                    return response.json()
 
             except httpx.TimeoutException as e:
                 logger.error("Parser timeout: %s", e)
@@ -142,3 +148,9 @@ class ParserClient:
                 raise ParserServiceError(f"Failed to parse: {e}")
 
         return await self.circuit_breaker.call(_parse)
+
+
+@lru_cache
+def get_parser_client() -> ParserClient:
+    """The process-wide client, created on first use rather than at import."""
+    return ParserClient()
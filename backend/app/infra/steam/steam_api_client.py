@@ -0,0 +1,57 @@
+import httpx
+from app.config import get_settings
+from app.domain.exceptions import SteamAPIError
+from app.domain.steam_account import SteamAccountResponse, SteamPlayer
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+PLAYER_SUMMARIES_URL = "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/"
+# GetPlayerSummaries accepts at most 100 comma-separated steam ids per call
+MAX_IDS_PER_CALL = 100
+
+
+class SteamAPIClient:
+    """HTTP client for the Steam Web API."""
+
+    def __init__(self):
+        self.api_key = settings.STEAM_WEB_API_KEY
+        self.timeout = httpx.Timeout(10.0, connect=5.0)
+        self.client = httpx.AsyncClient(timeout=self.timeout)
+
+    async def fetch_player_summaries(self, steam_ids: list[str]) -> list[SteamPlayer]:
+        """
+        Fetch player summaries for the given steam ids.
+
+        Ids are sent in chunks of MAX_IDS_PER_CALL. Unknown ids are simply
+        absent from the result, so callers should match on `steamid`.
+
+        Raises:
+            SteamAPIError: If the Steam API is unreachable or returns an error
+        """
+        players: list[SteamPlayer] = []
+        for start in range(0, len(steam_ids), MAX_IDS_PER_CALL):
+            chunk = steam_ids[start:start + MAX_IDS_PER_CALL]
+            players.extend(await self._fetch_chunk(chunk))
+        return players
+
+    async def _fetch_chunk(self, steam_ids: list[str]) -> list[SteamPlayer]:
+        params = {
+            "key": self.api_key,
+            "steamids": ",".join(steam_ids),
+        }
+        try:
+            response = await self.client.get(PLAYER_SUMMARIES_URL, params=params)
+            response.raise_for_status()
+            return SteamAccountResponse.model_validate(response.json()).response.players
+        except httpx.HTTPStatusError as e:
+            logger.error("Steam GetPlayerSummaries failed: %s - %s",
+                         e.response.status_code, e.response.text[:200])
+            raise SteamAPIError(f"Steam API returned {e.response.status_code}")
+        except httpx.HTTPError as e:
+            logger.error("Steam GetPlayerSummaries request failed: %s", e)
+            raise SteamAPIError(f"Failed to reach Steam API: {e}")
+        except ValueError as e:
+            logger.error("Failed to parse Steam GetPlayerSummaries response: %s", e)
+            raise SteamAPIError(f"Malformed Steam API response: {e}")
@@ -0,0 +1,49 @@
+"""
+Compact boss timelines for every stored match that has none.
+
+Matches analyzed after BossTimeline was added get their timelines at
+ingest, and older ones on their first boss read. The match search boss
+filters only see matches with timelines, so run this once after migrating:
+
+    python -m app.jobs.backfill_boss_timelines --batch-size 100
+"""
+import argparse
+import asyncio
+from app.application.use_cases.backfill_boss_timelines import BackfillBossTimelinesUseCase
+from app.domain.match_analysis import MATCH_SCHEMA_VERSION
+from app.infra.db.session import job_sessionmaker
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import LoggerManager, get_logger
+
+logger = get_logger(__name__)
+
+
+async def backfill(batch_size: int) -> int:
+    use_case = BackfillBossTimelinesUseCase(ParsedMatchesRepo())
+
+    total = 0
+    after_match_id: int | None = 0
+    async with job_sessionmaker() as async_session:
+        while after_match_id is not None:
+            # Fresh session per batch so loaded match_data doesn't pile up
+            async with async_session() as session:
+                backfilled, after_match_id = await use_case.execute(
+                    MATCH_SCHEMA_VERSION, session, after_match_id, batch_size
+                )
+            total += backfilled
+
+    logger.info("Boss timeline backfill complete: %s matches backfilled", total)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    LoggerManager()
+    asyncio.run(backfill(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Move raw parser payloads stored in parsedmatch.raw_payload_gzip (rows
+written before the blob store) into the blob store:
+
+    python -m app.jobs.offload_raw_payloads --batch-size 50
+
+Run VACUUM FULL parsedmatch (or pg_repack) afterwards to return the space.
+"""
+import argparse
+import asyncio
+from app.infra.db.session import job_sessionmaker
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import LoggerManager, get_logger
+
+logger = get_logger(__name__)
+
+
+async def offload(batch_size: int) -> int:
+    repo = ParsedMatchesRepo()
+    total = 0
+    async with job_sessionmaker() as async_session:
+        while True:
+            async with async_session() as session:
+                moved = await repo.offload_raw_payloads(batch_size, session)
+            if not moved:
+                break
+            total += moved
+            logger.info("Offloaded %s raw payloads so far", total)
+
+    logger.info("Raw payload offload complete: %s rows moved", total)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    LoggerManager()
+    asyncio.run(offload(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
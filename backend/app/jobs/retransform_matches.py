@@ -0,0 +1,64 @@
+"""
+Rebuild every match stored under an older schema version from its raw
+parser payload, without re-parsing demos:
+
+    python -m app.jobs.retransform_matches --from-schema-version 1
+"""
+import argparse
+import asyncio
+from app.application.use_cases.retransform_match import RetransformMatchUseCase
+from app.domain.exceptions import MatchDataIntegrityException, MatchDataUnavailableException
+from app.domain.match_analysis import MATCH_SCHEMA_VERSION
+from app.infra.db.session import job_sessionmaker
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.utils.logger import LoggerManager, get_logger
+
+logger = get_logger(__name__)
+
+
+async def retransform(from_schema_version: int, batch_size: int) -> int:
+    repo = ParsedMatchesRepo()
+    use_case = RetransformMatchUseCase(repo)
+    total = 0
+    skipped = 0
+    after_match_id = 0
+    async with job_sessionmaker() as async_session:
+        while True:
+            async with async_session() as session:
+                match_ids = await repo.get_match_ids(from_schema_version, after_match_id, batch_size, session)
+            if not match_ids:
+                break
+
+            for match_id in match_ids:
+                # One session per match so each payload's memory is released
+                async with async_session() as session:
+                    try:
+                        if await use_case.execute(match_id, from_schema_version, MATCH_SCHEMA_VERSION, session):
+                            total += 1
+                    except (MatchDataUnavailableException, MatchDataIntegrityException) as e:
+                        skipped += 1
+                        logger.error("Skipping match_id=%s: %s", match_id, e)
+            after_match_id = match_ids[-1]
+
+    logger.info(
+        "Re-transform complete: %s matches moved to schema v%s, %s skipped",
+        total, MATCH_SCHEMA_VERSION, skipped,
+    )
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--from-schema-version", type=int, required=True)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.from_schema_version == MATCH_SCHEMA_VERSION:
+        parser.error(f"Matches are already at schema v{MATCH_SCHEMA_VERSION}")
+
+    LoggerManager()
+    asyncio.run(retransform(args.from_schema_version, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
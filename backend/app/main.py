@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.utils.logger import LoggerManager
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,9 +6,28 @@ from fastapi.middleware.gzip import GZipMiddleware
 # from app.api import auth, internal
 # Only need the line below for now. Uncomment the line above
 # when we implement internal API endpoints.
-from app.api import auth, account, match, users, replay, session
+from app.api import auth, account, analytics, match, metrics, users, replay, session
+from app.infra.cache.tiered_cache import get_analysis_cache
+from app.config import get_settings
+from app.infra.metrics.memory import setup_memory_profiling
+from app.infra.metrics.timing import ServerTimingMiddleware
+from app.infra.metrics.tracing import setup_tracing
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_memory_profiling(get_settings())
+    # Drop shared analysis cache entries written under an older schema version
+    shared_cache = get_analysis_cache().shared
+    if shared_cache is not None:
+        await shared_cache.purge_other_namespaces()
+    yield
+    if tracer_provider is not None:
+        # Flush spans still queued in the batch processor
+        tracer_provider.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 # Initialize logger manager (singleton)
 LoggerManager()
 
@@ -23,6 +43,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=9)
+# Outermost, so the total includes compression
+app.add_middleware(ServerTimingMiddleware)
 
 # Mount routers
 # app.include_router(internal.router, prefix="/internal", tags=["Internal"])
@@ -30,5 +52,11 @@ app.include_router(auth.router, prefix="/auth")
 app.include_router(users.router, prefix="/users")
 app.include_router(account.router, prefix="/account")
 app.include_router(match.router, prefix="/match")
+app.include_router(analytics.router, prefix="/analytics")
 app.include_router(replay.router, prefix="/replay")
 app.include_router(session.router, prefix="/session")
+app.include_router(metrics.router, prefix="/metrics")
+
+# Instruments the app, so this can't wait for the lifespan hook (the
+# middleware stack is built by then)
+tracer_provider = setup_tracing(app, get_settings())
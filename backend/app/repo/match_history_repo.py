@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Annotated, Optional
+from fastapi import Depends
+from sqlmodel import col, select
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.deadlock_api import MatchSummary
+from app.domain.exceptions import MatchDataIntegrityException
+from app.infra.db.account_match_history import AccountMatch, AccountMatchHistorySync
+from app.infra.db.session import get_db_session
+from app.utils.datetime_utils import utcnow
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class MatchHistoryRepo:
+    async_session: Annotated[AsyncSession, Depends(get_db_session)]
+
+    async def get_refreshed_at(
+        self,
+        account_id: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[datetime]:
+        stmt = select(AccountMatchHistorySync.refreshed_at).where(
+            AccountMatchHistorySync.account_id == account_id
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_latest_start_time(
+        self,
+        account_id: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[int]:
+        stmt = select(func.max(AccountMatch.start_time)).where(
+            AccountMatch.account_id == account_id
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_match_history(
+        self,
+        account_id: int,
+        limit: int,
+        offset: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[MatchSummary]:
+        stmt = (
+            select(AccountMatch.summary)
+            .where(AccountMatch.account_id == account_id)
+            .order_by(col(AccountMatch.start_time).desc(), col(AccountMatch.match_id).desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await session.execute(stmt)
+        return [MatchSummary.model_validate(summary) for summary in result.scalars()]
+
+    async def store_matches(
+        self,
+        account_id: int,
+        matches: list[MatchSummary],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> None:
+        """Insert new matches (ignoring ones already stored) and mark the account refreshed."""
+        try:
+            if matches:
+                insert_matches = insert(AccountMatch).values([
+                    {
+                        "account_id": account_id,
+                        "match_id": match.match_id,
+                        "start_time": match.start_time,
+                        "summary": match.model_dump(),
+                    }
+                    for match in matches
+                ]).on_conflict_do_nothing(index_elements=["account_id", "match_id"])
+                await session.execute(insert_matches)
+
+            now = utcnow()
+            upsert_sync = insert(AccountMatchHistorySync).values(
+                account_id=account_id, refreshed_at=now
+            ).on_conflict_do_update(
+                index_elements=["account_id"], set_={"refreshed_at": now}
+            )
+            await session.execute(upsert_sync)
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Store match history failed: {e}")
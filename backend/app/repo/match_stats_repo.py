@@ -0,0 +1,92 @@
+from typing import Annotated, Optional
+from fastapi import Depends
+from sqlmodel import col, select
+from sqlalchemy import distinct, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.exceptions import MatchDataIntegrityException
+from app.domain.match_stats import CrossMatchDamageStats, DamageStatsRow, StatsGroupBy
+from app.infra.db.player_match_stat import PlayerMatchStat
+from app.infra.db.session import get_db_session
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class MatchStatsRepo:
+    async_session: Annotated[AsyncSession, Depends(get_db_session)]
+
+    async def get_damage_stats(
+        self,
+        schema_version: int,
+        group_by: StatsGroupBy,
+        last_n_matches: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+        steam_id_32: Optional[int] = None,
+        hero_id: Optional[int] = None,
+        minute: Optional[int] = None,
+    ) -> CrossMatchDamageStats:
+        """
+        Average damage per hero or per player over the most recent matches.
+
+        Args:
+            last_n_matches: How many of the most recent matches (by match_id)
+                to include; when steam_id_32 is set, that player's matches
+            steam_id_32: Only include this player's rows
+            hero_id: Only include rows on this hero
+            minute: Also average cumulative damage at this minute
+        """
+        filters = [PlayerMatchStat.schema_version == schema_version]
+        if steam_id_32 is not None:
+            filters.append(PlayerMatchStat.steam_id_32 == steam_id_32)
+        if hero_id is not None:
+            filters.append(PlayerMatchStat.hero_id == hero_id)
+
+        recent_matches = (
+            select(distinct(col(PlayerMatchStat.match_id)).label("match_id"))
+            .where(*filters)
+            .order_by(col(PlayerMatchStat.match_id).desc())
+            .limit(last_n_matches)
+            .subquery()
+        )
+
+        key = col(PlayerMatchStat.hero_id) if group_by == StatsGroupBy.HERO else col(PlayerMatchStat.steam_id_32)
+        columns = [
+            key.label("key"),
+            func.count().label("player_matches"),
+            func.avg(PlayerMatchStat.total_damage).label("avg_total_damage"),
+            # Per played minute; total_match_time_s would count the pregame
+            func.avg(
+                PlayerMatchStat.total_damage * 60.0 / func.greatest(PlayerMatchStat.match_length_s, 1)
+            ).label("avg_damage_per_minute"),
+        ]
+        if minute is not None:
+            # Postgres arrays are 1-indexed; out-of-range reads are NULL and
+            # drop out of the average, so short matches don't count as zero
+            columns.append(
+                func.avg(col(PlayerMatchStat.damage_by_minute)[minute + 1]).label("avg_damage_at_minute")
+            )
+
+        stmt = (
+            select(*columns)
+            .where(
+                *filters,
+                col(PlayerMatchStat.match_id).in_(select(recent_matches.c.match_id)),
+                key.is_not(None),
+            )
+            .group_by(key)
+            .order_by(key)
+        )
+        count_stmt = select(func.count()).select_from(recent_matches)
+
+        try:
+            rows = (await session.execute(stmt)).mappings().all()
+            match_count = (await session.execute(count_stmt)).scalar_one()
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch damage stats failed: {e}")
+
+        return CrossMatchDamageStats(
+            group_by=group_by,
+            minute=minute,
+            match_count=match_count,
+            rows=[DamageStatsRow.model_validate(dict(row)) for row in rows],
+        )
@@ -1,12 +1,29 @@
-from typing import Annotated, Optional
+from contextlib import asynccontextmanager
+from collections.abc import Sequence
+from typing import Annotated, AsyncIterator, Optional
 from fastapi.params import Depends
-from sqlmodel import select
+from pydantic import BaseModel
+from sqlmodel import SQLModel, col, select
+from sqlalchemy import ColumnElement, delete, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.domain.match_analysis import TransformedMatchData
+from app.domain.boss import CompactBossTimeline
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.match_analysis import MatchDataSkeleton, TransformedMatchData
+from app.domain.player import PlayerMatchData
+from app.domain.match_stats import MatchSearchResult, PlayerMatchStats
+from app.domain.position_track import CompactPositionTrack
+from app.infra.blob_store.blob_store import BlobStore, get_blob_store
+from app.infra.db.boss_timeline import BossTimeline
 from app.infra.db.parsed_match import ParsedMatch
+from app.infra.db.player_damage_aggregate import PlayerDamageAggregate
+from app.infra.db.player_match_stat import PlayerMatchStat
+from app.infra.db.player_position_track import PlayerPositionTrack
 from app.infra.db.session import get_db_session
+from app.infra.metrics.timing import span, timed
 from app.domain.exceptions import (
+    BlobStoreError,
     MatchDataUnavailableException,
     MatchParseException,
     MatchDataIntegrityException,
@@ -18,64 +35,305 @@ logger = get_logger(__name__)
 class ParsedMatchesRepo:
     async_session: Annotated[AsyncSession, Depends(get_db_session)]
 
+    def __init__(self, blob_store: Optional[BlobStore] = None):
+        # Raw parser payloads live in the blob store; rows only keep the digest
+        self.blob_store = blob_store or get_blob_store()
+
     async def get_match_data(
         self,
         match_id: int,
         schema_version: int,
         session: Annotated[AsyncSession, Depends(get_db_session)],
     ) -> TransformedMatchData | None:
+        stored = await self.get_match_data_with_etag(match_id, schema_version, session)
+        return stored[0] if stored is not None else None
+
+    async def get_match_data_with_etag(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[tuple[TransformedMatchData, str]]:
+        # Only the columns we use; raw_payload_gzip is as large as match_data
+        # and is never needed to serve a read
         try:
-            logger.info(f"Fetching match_data for match_id={match_id}, schema_version={schema_version}")
+            logger.info("Fetching match_data for match_id=%s, schema_version=%s", match_id, schema_version)
 
-            stmt = select(ParsedMatch).where(
+            stmt = select(ParsedMatch.match_data, ParsedMatch.etag).where(
                 ParsedMatch.match_id == match_id,
                 ParsedMatch.schema_version == schema_version,
             )
-            result = await session.execute(stmt)
-            record = result.scalar_one_or_none()
+            with span("db_fetch"):
+                result = await session.execute(stmt)
+                row = result.one_or_none()
 
-            if record is None:
+            if row is None:
                 return None
 
-            return TransformedMatchData(**record.match_data)
+            match_data, etag = row
+            with span("build_models"):
+                return TransformedMatchData(**match_data), etag
 
         except SQLAlchemyError as e:
             raise MatchDataIntegrityException(f"Fetch match_data failed: {e}")
 
+    @timed("db_etag")
+    async def get_etag(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[str]:
+        """The stored etag alone, so conditional requests can 304 without loading match_data."""
+        try:
+            stmt = select(ParsedMatch.etag).where(
+                ParsedMatch.match_id == match_id,
+                ParsedMatch.schema_version == schema_version,
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch etag failed: {e}")
+
+    @timed("db_fetch")
+    async def get_match_skeleton(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[tuple[MatchDataSkeleton, str]]:
+        """
+        match_data minus per_player_data, and the stored etag.
+
+        per_player_data is dropped in Postgres (jsonb - key) so the bulk of
+        the document never leaves the database.
+        """
+        try:
+            stmt = select(
+                col(ParsedMatch.match_data).op("-")("per_player_data"),
+                ParsedMatch.etag,
+            ).where(
+                ParsedMatch.match_id == match_id,
+                ParsedMatch.schema_version == schema_version,
+            )
+            result = await session.execute(stmt)
+            row = result.one_or_none()
+            if row is None:
+                return None
+
+            skeleton, etag = row
+            return MatchDataSkeleton.model_validate(skeleton), etag
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch match skeleton failed: {e}")
+
+    @timed("db_fetch")
+    async def get_player_match_data(
+        self,
+        match_id: int,
+        schema_version: int,
+        custom_id: str,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> Optional[tuple[Optional[PlayerMatchData], str]]:
+        """
+        One player's entry of match_data.per_player_data, and the stored etag.
+
+        Returns:
+            None if the match isn't stored; (None, etag) if it is but has no
+            such player
+        """
+        try:
+            stmt = select(
+                col(ParsedMatch.match_data)["per_player_data"][custom_id],
+                ParsedMatch.etag,
+            ).where(
+                ParsedMatch.match_id == match_id,
+                ParsedMatch.schema_version == schema_version,
+            )
+            result = await session.execute(stmt)
+            row = result.one_or_none()
+            if row is None:
+                return None
+
+            player_data, etag = row
+            if player_data is None:
+                return None, etag
+            return PlayerMatchData.model_validate(player_data), etag
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch player match_data failed: {e}")
+
+    async def search_matches(
+        self,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+        steam_id_32: Optional[int] = None,
+        hero_id: Optional[int] = None,
+        min_match_time_s: Optional[int] = None,
+        max_match_time_s: Optional[int] = None,
+        boss_custom_id: Optional[int] = None,
+        boss_died_before_s: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[MatchSearchResult]:
+        """
+        Stored matches matching every given filter, newest match_id first.
+
+        Only indexed projections are touched: parsedmatch.match_length_s,
+        playermatchstat (steam_id_32, hero_id) and bosstimeline
+        (boss_custom_id, death_time_s). match_data is never read.
+
+        Args:
+            steam_id_32: A player who was in the match
+            min_match_time_s, max_match_time_s: Bounds on the played length
+                (match_length_s), which leaves out the pregame
+            hero_id: A hero that was played in the match; combined with
+                steam_id_32, that player was on that hero
+            boss_custom_id: Boss type (see BossSnapshot.custom_id) that died;
+                with boss_died_before_s, died before that many seconds. Only
+                matches with BossTimeline rows can match; matches stored
+                before those existed need app.jobs.backfill_boss_timelines
+        """
+        filters: list[ColumnElement[bool]] = [col(ParsedMatch.schema_version) == schema_version]
+        if min_match_time_s is not None:
+            filters.append(col(ParsedMatch.match_length_s) >= min_match_time_s)
+        if max_match_time_s is not None:
+            filters.append(col(ParsedMatch.match_length_s) <= max_match_time_s)
+
+        if steam_id_32 is not None or hero_id is not None:
+            player_filters: list[ColumnElement[bool]] = [
+                col(PlayerMatchStat.match_id) == ParsedMatch.match_id,
+                col(PlayerMatchStat.schema_version) == schema_version,
+            ]
+            if steam_id_32 is not None:
+                player_filters.append(col(PlayerMatchStat.steam_id_32) == steam_id_32)
+            if hero_id is not None:
+                player_filters.append(col(PlayerMatchStat.hero_id) == hero_id)
+            filters.append(select(PlayerMatchStat.match_id).where(*player_filters).exists())
+
+        if boss_custom_id is not None or boss_died_before_s is not None:
+            boss_filters: list[ColumnElement[bool]] = [
+                col(BossTimeline.match_id) == ParsedMatch.match_id,
+                col(BossTimeline.schema_version) == schema_version,
+                col(BossTimeline.death_time_s).is_not(None),
+            ]
+            if boss_custom_id is not None:
+                boss_filters.append(col(BossTimeline.boss_custom_id) == boss_custom_id)
+            if boss_died_before_s is not None:
+                boss_filters.append(col(BossTimeline.death_time_s) < boss_died_before_s)
+            filters.append(select(BossTimeline.match_id).where(*boss_filters).exists())
+
+        stmt = (
+            select(ParsedMatch.match_id, ParsedMatch.total_match_time_s, ParsedMatch.match_length_s)
+            .where(*filters)
+            .order_by(col(ParsedMatch.match_id).desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        try:
+            result = await session.execute(stmt)
+            return [MatchSearchResult.model_validate(dict(row)) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Search matches failed: {e}")
+
     async def get_raw_gzip(
         self,
         match_id: int,
         schema_version: int,
         session: Annotated[AsyncSession, Depends(get_db_session)],
     ) -> Optional[bytes]:
+        async with self.open_raw_gzip(match_id, schema_version, session) as raw_payload:
+            return bytes(raw_payload) if raw_payload is not None else None
+
+    @asynccontextmanager
+    async def open_raw_gzip(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> AsyncIterator[Optional[memoryview]]:
+        """
+        Read-only view of the gzipped parser payload, or None if the match
+        isn't stored. The view is memory-mapped when the blob store allows it
+        and is only valid inside the `async with` block.
+        """
         try:
-            stmt = select(ParsedMatch.raw_payload_gzip).where(
+            stmt = select(ParsedMatch.raw_payload_digest, ParsedMatch.raw_payload_gzip).where(
                 ParsedMatch.match_id == match_id,
                 ParsedMatch.schema_version == schema_version,
             )
             result = await session.execute(stmt)
-            return result.scalar_one_or_none()
+            row = result.one_or_none()
         except SQLAlchemyError as e:
-            raise MatchDataIntegrityException(f"Fetch raw_payload_gzip failed: {e}")
+            raise MatchDataIntegrityException(f"Fetch raw payload failed: {e}")
+
+        if row is None:
+            yield None
+            return
 
+        digest, legacy_payload = row
+        if digest is None:
+            # Stored before the blob store and not offloaded yet
+            yield memoryview(legacy_payload) if legacy_payload is not None else None
+            return
+
+        try:
+            async with self.blob_store.open(digest) as raw_payload:
+                yield raw_payload
+        except BlobStoreError as e:
+            raise MatchDataUnavailableException(f"Raw payload for match {match_id} unavailable: {e}") from e
+
+    @timed("db_store")
     async def create_parsed_match(
         self,
         match_id: int,
         schema_version: int,
-        raw_payload_gzip: bytes,
+        raw_payload_gzip: bytes | memoryview,
         match_data: dict,
         etag: str,
         session: Annotated[AsyncSession, Depends(get_db_session)],
+        damage_aggregates: Optional[list[PlayerDamageAggregates]] = None,
+        position_tracks: Optional[list[CompactPositionTrack]] = None,
+        match_stats: Optional[list[PlayerMatchStats]] = None,
+        boss_timelines: Optional[list[CompactBossTimeline]] = None,
+        replace: bool = False,
     ) -> None:
+        """
+        Store a match and its derived rows in one transaction.
+
+        Failures on first store are logged and swallowed: the analysis is
+        still served, and the next request tries again.
+
+        Raises:
+            MatchDataIntegrityException: With `replace`, if nothing was
+                stored (the match keeps its old rows)
+        """
         try:
+            # Content-addressed, so a failed insert below only leaves a blob
+            # that the next attempt reuses
+            raw_payload_digest = await self.blob_store.put(raw_payload_gzip)
+        except BlobStoreError as e:
+            logger.error("Create parsed match failed, raw payload not stored: %s", e)
+            if replace:
+                raise MatchDataIntegrityException(f"Replace parsed match failed: {e}")
+            return
+
+        try:
+            if replace:
+                await self._delete_match_rows(match_id, session)
             parsed_match = ParsedMatch(
                 match_id=match_id,
                 schema_version=schema_version,
-                raw_payload_gzip=raw_payload_gzip,
+                raw_payload_digest=raw_payload_digest,
+                raw_payload_size=len(raw_payload_gzip),
                 match_data=match_data,
                 etag=etag,
             )
             session.add(parsed_match)
+            # Derived rows go in the same transaction so they never disagree
+            # with the match_data they were computed from
+            self._add_damage_aggregates(match_id, schema_version, damage_aggregates or [], session)
+            self._add_position_tracks(match_id, schema_version, position_tracks or [], session)
+            self._add_match_stats(match_id, schema_version, match_stats or [], session)
+            self._add_boss_timelines(match_id, schema_version, boss_timelines or [], session)
             await session.commit()
             await session.refresh(parsed_match)
         except SQLAlchemyError as e:
@@ -84,3 +342,343 @@ class ParsedMatchesRepo:
             if minimal is None:
                 minimal = e.args[0] if e.args else e.__class__.__name__
             logger.error("Create parsed match failed: %s", minimal)
+            if replace:
+                await session.rollback()
+                raise MatchDataIntegrityException(f"Replace parsed match failed: {minimal}")
+
+    @staticmethod
+    async def _delete_match_rows(match_id: int, session: AsyncSession) -> None:
+        """Delete the match and its derived rows across every schema version."""
+        for table in (PlayerDamageAggregate, PlayerPositionTrack, PlayerMatchStat, BossTimeline, ParsedMatch):
+            await session.execute(delete(table).where(col(table.match_id) == match_id))
+
+    async def get_match_ids(
+        self,
+        schema_version: int,
+        after_match_id: int,
+        limit: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[int]:
+        """Ascending ids (> after_match_id) of matches stored under `schema_version`."""
+        try:
+            stmt = (
+                select(ParsedMatch.match_id)
+                .where(
+                    ParsedMatch.schema_version == schema_version,
+                    ParsedMatch.match_id > after_match_id,
+                )
+                .order_by(col(ParsedMatch.match_id))
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars())
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch match ids failed: {e}")
+
+    async def get_damage_aggregates(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[PlayerDamageAggregates]:
+        try:
+            stmt = select(PlayerDamageAggregate).where(
+                PlayerDamageAggregate.match_id == match_id,
+                PlayerDamageAggregate.schema_version == schema_version,
+            )
+            result = await session.execute(stmt)
+            return [
+                PlayerDamageAggregates.model_validate(row, from_attributes=True)
+                for row in result.scalars()
+            ]
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch damage aggregates failed: {e}")
+
+    async def create_damage_aggregates(
+        self,
+        match_id: int,
+        schema_version: int,
+        damage_aggregates: list[PlayerDamageAggregates],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> None:
+        """Backfill aggregates; rows a concurrent backfill already wrote are kept."""
+        try:
+            await self._insert_missing(
+                PlayerDamageAggregate, match_id, schema_version, damage_aggregates, session
+            )
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Create damage aggregates failed: {e}")
+
+    @staticmethod
+    async def _insert_missing(
+        table: type[SQLModel],
+        match_id: int,
+        schema_version: int,
+        rows: Sequence[BaseModel],
+        session: AsyncSession,
+    ) -> None:
+        """
+        Insert derived rows for a match, skipping any that already exist.
+
+        Lazy backfills run on first read, so two concurrent first reads of a
+        match both try to write the same rows; the loser must not fail.
+        """
+        if not rows:
+            return
+        await session.execute(
+            insert(table).values([
+                {"match_id": match_id, "schema_version": schema_version, **row.model_dump()}
+                for row in rows
+            ]).on_conflict_do_nothing()
+        )
+
+    @staticmethod
+    def _add_damage_aggregates(
+        match_id: int,
+        schema_version: int,
+        damage_aggregates: list[PlayerDamageAggregates],
+        session: AsyncSession,
+    ) -> None:
+        session.add_all([
+            PlayerDamageAggregate(
+                match_id=match_id,
+                schema_version=schema_version,
+                **aggregates.model_dump(),
+            )
+            for aggregates in damage_aggregates
+        ])
+
+    async def get_position_tracks(
+        self,
+        match_id: int,
+        schema_version: int,
+        level: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[CompactPositionTrack]:
+        try:
+            stmt = select(PlayerPositionTrack).where(
+                PlayerPositionTrack.match_id == match_id,
+                PlayerPositionTrack.schema_version == schema_version,
+                PlayerPositionTrack.level == level,
+            )
+            result = await session.execute(stmt)
+            return [
+                CompactPositionTrack.model_validate(row, from_attributes=True)
+                for row in result.scalars()
+            ]
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch position tracks failed: {e}")
+
+    async def create_position_tracks(
+        self,
+        match_id: int,
+        schema_version: int,
+        position_tracks: list[CompactPositionTrack],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> None:
+        """Backfill tracks; rows a concurrent backfill already wrote are kept."""
+        try:
+            await self._insert_missing(
+                PlayerPositionTrack, match_id, schema_version, position_tracks, session
+            )
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Create position tracks failed: {e}")
+
+    @staticmethod
+    def _add_position_tracks(
+        match_id: int,
+        schema_version: int,
+        position_tracks: list[CompactPositionTrack],
+        session: AsyncSession,
+    ) -> None:
+        session.add_all([
+            PlayerPositionTrack(
+                match_id=match_id,
+                schema_version=schema_version,
+                **track.model_dump(),
+            )
+            for track in position_tracks
+        ])
+
+    async def get_match_ids_without_stats(
+        self,
+        schema_version: int,
+        after_match_id: int,
+        limit: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[int]:
+        """Ascending ids (> after_match_id) of stored matches with no PlayerMatchStat rows yet."""
+        try:
+            has_stats = select(PlayerMatchStat.match_id).where(
+                PlayerMatchStat.match_id == ParsedMatch.match_id,
+                PlayerMatchStat.schema_version == schema_version,
+            ).exists()
+            stmt = (
+                select(ParsedMatch.match_id)
+                .where(
+                    ParsedMatch.schema_version == schema_version,
+                    ParsedMatch.match_id > after_match_id,
+                    ~has_stats,
+                )
+                .order_by(col(ParsedMatch.match_id))
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars())
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch matches without stats failed: {e}")
+
+    async def create_match_stats(
+        self,
+        match_id: int,
+        schema_version: int,
+        match_stats: list[PlayerMatchStats],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> None:
+        try:
+            self._add_match_stats(match_id, schema_version, match_stats, session)
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Create match stats failed: {e}")
+
+    @staticmethod
+    def _add_match_stats(
+        match_id: int,
+        schema_version: int,
+        match_stats: list[PlayerMatchStats],
+        session: AsyncSession,
+    ) -> None:
+        session.add_all([
+            PlayerMatchStat(
+                match_id=match_id,
+                schema_version=schema_version,
+                **stats.model_dump(),
+            )
+            for stats in match_stats
+        ])
+
+    async def get_match_ids_without_boss_timelines(
+        self,
+        schema_version: int,
+        after_match_id: int,
+        limit: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[int]:
+        """Ascending ids (> after_match_id) of stored matches with no BossTimeline rows yet."""
+        try:
+            has_timelines = select(BossTimeline.match_id).where(
+                BossTimeline.match_id == ParsedMatch.match_id,
+                BossTimeline.schema_version == schema_version,
+            ).exists()
+            stmt = (
+                select(ParsedMatch.match_id)
+                .where(
+                    ParsedMatch.schema_version == schema_version,
+                    ParsedMatch.match_id > after_match_id,
+                    ~has_timelines,
+                )
+                .order_by(col(ParsedMatch.match_id))
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars())
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch matches without boss timelines failed: {e}")
+
+    async def get_boss_timelines(
+        self,
+        match_id: int,
+        schema_version: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[CompactBossTimeline]:
+        try:
+            stmt = select(BossTimeline).where(
+                BossTimeline.match_id == match_id,
+                BossTimeline.schema_version == schema_version,
+            ).order_by(col(BossTimeline.entity_index))
+            result = await session.execute(stmt)
+            return [
+                CompactBossTimeline.model_validate(row, from_attributes=True)
+                for row in result.scalars()
+            ]
+        except SQLAlchemyError as e:
+            raise MatchDataIntegrityException(f"Fetch boss timelines failed: {e}")
+
+    async def create_boss_timelines(
+        self,
+        match_id: int,
+        schema_version: int,
+        boss_timelines: list[CompactBossTimeline],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> None:
+        """Backfill timelines; rows a concurrent backfill already wrote are kept."""
+        try:
+            await self._insert_missing(
+                BossTimeline, match_id, schema_version, boss_timelines, session
+            )
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Create boss timelines failed: {e}")
+
+    @staticmethod
+    def _add_boss_timelines(
+        match_id: int,
+        schema_version: int,
+        boss_timelines: list[CompactBossTimeline],
+        session: AsyncSession,
+    ) -> None:
+        session.add_all([
+            BossTimeline(
+                match_id=match_id,
+                schema_version=schema_version,
+                **timeline.model_dump(),
+            )
+            for timeline in boss_timelines
+        ])
+
+    async def offload_raw_payloads(
+        self,
+        batch_size: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> int:
+        """
+        Move up to `batch_size` legacy in-row raw payloads to the blob store.
+
+        Returns:
+            Number of rows moved; 0 once every payload is offloaded
+        """
+        try:
+            stmt = (
+                select(ParsedMatch.match_id, ParsedMatch.schema_version, ParsedMatch.raw_payload_gzip)
+                .where(col(ParsedMatch.raw_payload_gzip).is_not(None))
+                .limit(batch_size)
+            )
+            rows = (await session.execute(stmt)).all()
+            for match_id, schema_version, raw_payload_gzip in rows:
+                digest = await self.blob_store.put(raw_payload_gzip)
+                await session.execute(
+                    update(ParsedMatch)
+                    .where(
+                        ParsedMatch.match_id == match_id,
+                        ParsedMatch.schema_version == schema_version,
+                    )
+                    .values(
+                        raw_payload_digest=digest,
+                        raw_payload_size=len(raw_payload_gzip),
+                        raw_payload_gzip=None,
+                    )
+                )
+            await session.commit()
+            return len(rows)
+        except BlobStoreError:
+            await session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise MatchDataIntegrityException(f"Offload raw payloads failed: {e}")
@@ -1,6 +1,6 @@
 from typing import Optional, Annotated
 from fastapi import Depends
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from psycopg.errors import UniqueViolation
@@ -61,3 +61,16 @@ class UserRepository:
         if db_user:
             return db_user
         return None
+
+
+    async def get_users_by_steam_ids(
+        self,
+        hashed_steam_ids: list[str],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[User]:
+        """Every registered user among `hashed_steam_ids`, in one IN query."""
+        if not hashed_steam_ids:
+            return []
+        stmt = select(User).where(col(User.hashed_steam_id).in_(hashed_steam_ids))
+        result = await session.execute(stmt)
+        return list(result.scalars())
@@ -1,20 +1,32 @@
 import jwt
 from fastapi import Depends
 from datetime import timedelta
-from typing import Optional, Annotated
+from typing import Any, Optional, Annotated
+from pydantic import ValidationError
 from app.config import Settings, get_settings
+from app.domain.user import SessionUser
+from app.infra.db.models import User
 from app.utils.datetime_utils import utcnow
 
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 
-def create_access_token(user_id: int, settings: SettingsDep, expires_delta: Optional[timedelta] = None) -> str:
+USER_CLAIM = "user"
+
+def create_access_token(
+    user_id: int,
+    settings: SettingsDep,
+    expires_delta: Optional[timedelta] = None,
+    user: Optional[User] = None,
+) -> str:
     now = utcnow()
     expire = now + (expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode = {
+    to_encode: dict[str, Any] = {
         "id": user_id,
         "iat": now,
         "exp": expire
     }
+    if settings.JWT_EMBED_USER_CLAIMS and user is not None:
+        to_encode[USER_CLAIM] = SessionUser.model_validate(user, from_attributes=True).model_dump(mode="json")
     encoded_jwt = jwt.encode(
         to_encode,
         settings.JWT_SECRET_KEY,
@@ -22,7 +34,7 @@ def create_access_token(user_id: int, settings: SettingsDep, expires_delta: Opti
     )
     return encoded_jwt
 
-def decode_access_token(token: str, settings: SettingsDep) -> int:
+def decode_access_token_payload(token: str, settings: SettingsDep) -> dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
@@ -30,13 +42,26 @@ def decode_access_token(token: str, settings: SettingsDep) -> int:
             algorithms=[settings.JWT_ALGORITHM],
             options={"require": ["exp", "iat"]},
         )
-        user_id: int = payload["id"]
-        if user_id is None:
+        if payload.get("id") is None:
             raise ValueError("Missing user_id in token")
-        return user_id
+        return payload
     except jwt.ExpiredSignatureError:
         raise ValueError("Token has expired")
     except jwt.MissingRequiredClaimError as e:
         raise ValueError(f"Missing required claim: {e.claim}")
     except jwt.PyJWTError as e:
         raise ValueError(f"Invalid token: {e}")
+
+def decode_access_token(token: str, settings: SettingsDep) -> int:
+    user_id: int = decode_access_token_payload(token, settings)["id"]
+    return user_id
+
+def user_from_claims(payload: dict[str, Any]) -> Optional[SessionUser]:
+    """The user embedded by create_access_token, or None if the token has none (or a malformed one)."""
+    claims = payload.get(USER_CLAIM)
+    if not isinstance(claims, dict) or claims.get("id") != payload["id"]:
+        return None
+    try:
+        return SessionUser.model_validate(claims)
+    except ValidationError:
+        return None
@@ -0,0 +1,121 @@
+from typing import Optional
+from app.domain.boss import (
+    BOSS_DAMAGE_BURST_GAP_S,
+    BossData,
+    BossEvent,
+    BossEventType,
+    BossHealthTimeline,
+    CompactBossTimeline,
+)
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class BossTimelineService:
+    @staticmethod
+    def compact(bosses: BossData) -> list[CompactBossTimeline]:
+        """
+        One change-point encoded timeline per boss entity, with its snapshot.
+
+        Bosses with a snapshot but no health samples still get a (empty)
+        timeline, so their spawn and death events are kept.
+        """
+        snapshots = {s.entity_index: s for s in bosses.snapshots}
+        change_points = BossTimelineService.change_points(bosses.health_timeline)
+
+        return [
+            CompactBossTimeline(
+                entity_index=entity_index,
+                snapshot=snapshots.get(entity_index),
+                t=[t for t, _ in change_points.get(entity_index, [])],
+                health=[health for _, health in change_points.get(entity_index, [])],
+            )
+            for entity_index in sorted(snapshots.keys() | change_points.keys())
+        ]
+
+    @staticmethod
+    def change_points(health_timeline: BossHealthTimeline) -> dict[int, list[tuple[int, int]]]:
+        """entity_index -> [(second, health)] keeping only seconds where health changed."""
+        points: dict[int, list[tuple[int, int]]] = {}
+        last_health: dict[str, int] = {}
+        for t, window in enumerate(health_timeline):
+            for key, health in window.items():
+                if last_health.get(key) == health:
+                    continue
+                last_health[key] = health
+                points.setdefault(int(key), []).append((t, health))
+        return points
+
+    @staticmethod
+    def events(
+        timelines: list[CompactBossTimeline],
+        start_s: int = 0,
+        end_s: Optional[int] = None,
+        burst_gap_s: int = BOSS_DAMAGE_BURST_GAP_S,
+    ) -> list[BossEvent]:
+        """
+        Spawn, damage burst and death events overlapping [start_s, end_s), in time order.
+        """
+        events: list[BossEvent] = []
+        for timeline in timelines:
+            snapshot = timeline.snapshot
+            if snapshot is not None:
+                events.append(BossEvent(
+                    type=BossEventType.SPAWN,
+                    entity_index=timeline.entity_index,
+                    time_s=snapshot.spawn_time_s,
+                    end_s=snapshot.spawn_time_s,
+                    health=timeline.health[0] if timeline.health else snapshot.max_health,
+                ))
+            events.extend(BossTimelineService._damage_bursts(timeline, burst_gap_s))
+            if snapshot is not None and snapshot.death_time_s is not None:
+                events.append(BossEvent(
+                    type=BossEventType.DEATH,
+                    entity_index=timeline.entity_index,
+                    time_s=snapshot.death_time_s,
+                    end_s=snapshot.death_time_s,
+                    health=BossTimelineService.health_at(timeline, snapshot.death_time_s),
+                ))
+
+        in_range = [
+            e for e in events
+            if e.end_s >= start_s and (end_s is None or e.time_s < end_s)
+        ]
+        return sorted(in_range, key=lambda e: (e.time_s, e.entity_index))
+
+    @staticmethod
+    def health_at(timeline: CompactBossTimeline, time_s: int) -> Optional[int]:
+        health = None
+        for t, value in zip(timeline.t, timeline.health):
+            if t > time_s:
+                break
+            health = value
+        return health
+
+    @staticmethod
+    def _damage_bursts(timeline: CompactBossTimeline, burst_gap_s: int) -> list[BossEvent]:
+        bursts: list[BossEvent] = []
+        current: Optional[BossEvent] = None
+        for i in range(1, len(timeline.t)):
+            t, health = timeline.t[i], timeline.health[i]
+            lost = timeline.health[i - 1] - health
+            if lost <= 0:
+                # Regen or a respawn resets the burst
+                current = None
+                continue
+
+            if current is not None and t - current.end_s <= burst_gap_s:
+                current.end_s = t
+                current.health = health
+                current.damage = (current.damage or 0) + lost
+            else:
+                current = BossEvent(
+                    type=BossEventType.DAMAGE,
+                    entity_index=timeline.entity_index,
+                    time_s=t,
+                    end_s=t,
+                    health=health,
+                    damage=lost,
+                )
+                bursts.append(current)
+        return bursts
@@ -0,0 +1,48 @@
+from collections import defaultdict
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import Damage
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class DamageAggregationService:
+    @staticmethod
+    def aggregate(match_data: TransformedMatchData) -> list[PlayerDamageAggregates]:
+        return [
+            DamageAggregationService.aggregate_player(custom_id, player_data.damage)
+            for custom_id, player_data in match_data.per_player_data.items()
+        ]
+
+    @staticmethod
+    def aggregate_player(custom_id: str, damage: Damage) -> PlayerDamageAggregates:
+        total_damage = 0
+        total_absorbed = 0
+        total_health_lost = 0
+        cumulative_damage: list[int] = []
+        by_victim: dict[str, int] = defaultdict(int)
+        by_ability: dict[str, int] = defaultdict(int)
+        by_citadel_type: dict[str, int] = defaultdict(int)
+
+        for window in damage:
+            for victim_id, records in (window or {}).items():
+                for record in records:
+                    amount = record.damage or 0
+                    total_damage += amount
+                    total_absorbed += record.damage_absorbed or 0
+                    total_health_lost += record.health_lost or 0
+                    by_victim[victim_id] += amount
+                    by_ability[str(record.ability_id or 0)] += amount
+                    by_citadel_type[str(record.citadel_type or 0)] += amount
+            cumulative_damage.append(total_damage)
+
+        return PlayerDamageAggregates(
+            custom_id=custom_id,
+            total_damage=total_damage,
+            total_absorbed=total_absorbed,
+            total_health_lost=total_health_lost,
+            cumulative_damage=cumulative_damage,
+            by_victim=dict(by_victim),
+            by_ability=dict(by_ability),
+            by_citadel_type=dict(by_citadel_type),
+        )
@@ -1,20 +1,29 @@
 from app.utils.logger import get_logger
-from app.infra.deadlock_api.deadlock_api_client import DeadlockAPIClient
-from app.domain.deadlock_api import MatchMetadata, MatchSummary
+from app.infra.deadlock_api.deadlock_api_client import get_deadlock_api_client
+from app.infra.deadlock_api.rate_limiter import RequestPriority
+from app.domain.deadlock_api import LeanMatchMetadata, MatchMetadata, MatchSummary
 
-api_client = DeadlockAPIClient()
 logger = get_logger(__name__)
 
 class DeadlockAPIService:
-    async def get_account_match_history_for(self, account_id: str) -> list[MatchSummary]:
-        return await api_client.fetch_account_match_history(account_id)
+    def __init__(self, priority: RequestPriority = RequestPriority.INTERACTIVE):
+        self.priority = priority
+        self.api_client = get_deadlock_api_client()
+
+    async def get_account_match_history_for(
+        self, account_id: str, min_start_time: int | None = None
+    ) -> list[MatchSummary]:
+        return await self.api_client.fetch_account_match_history(account_id, min_start_time, self.priority)
 
     async def get_match_metadata_for(self, match_id: int) -> MatchMetadata:
-        return await api_client.fetch_match_metadata(match_id)
+        return await self.api_client.fetch_match_metadata(match_id, self.priority)
+
+    async def get_lean_match_metadata_for(self, match_id: int) -> LeanMatchMetadata:
+        return await self.api_client.fetch_lean_match_metadata(match_id, self.priority)
 
     async def get_demo_url(self, match_id: int) -> dict[str, str]:
         salts_response = await self.get_salts(match_id)
-        logger.debug(f"salts_response: ${salts_response}")
+        logger.debug("salts_response: %s", salts_response)
         return {"demo_url": salts_response["demo_url"]}
 
     # DLAPIService#fetch_salts returns a response that looks like:
@@ -27,4 +36,4 @@ class DeadlockAPIService:
     #     demo_url (str): URL pointing to the compressed replay/demo file (.dem.bz2).
     # }
     async def get_salts(self, match_id: int) -> dict[str, str]:
-        return await api_client.fetch_salts(match_id)
+        return await self.api_client.fetch_salts(match_id, self.priority)
@@ -0,0 +1,71 @@
+from typing import Optional
+import numpy as np
+from app.domain.heatmap import MINIMAP_MAX, MINIMAP_MIN, HeatmapGroupBy, PositionHeatmaps
+from app.domain.match_analysis import TransformedMatchData
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class HeatmapService:
+    @staticmethod
+    def build(
+        match_data: TransformedMatchData,
+        grid_size: int,
+        group_by: HeatmapGroupBy = HeatmapGroupBy.MATCH,
+        custom_ids: Optional[list[str]] = None,
+        team: Optional[int] = None,
+        start_s: int = 0,
+        end_s: Optional[int] = None,
+    ) -> PositionHeatmaps:
+        """
+        Bin stored player positions into grid_size x grid_size heatmaps.
+
+        Positions are stored once per second per player, so the index into
+        PlayerMatchData.positions is the second offset used for the time window.
+        """
+        match_length_s = match_data.total_match_time_s - match_data.match_start_time_s
+        end_s = match_length_s if end_s is None else min(end_s, match_length_s)
+        team_by_player = {p.custom_id: p.team for p in match_data.players_data}
+
+        tracks: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for custom_id, player_data in match_data.per_player_data.items():
+            if custom_ids is not None and custom_id not in custom_ids:
+                continue
+            if team is not None and team_by_player.get(custom_id) != team:
+                continue
+            window = player_data.positions[start_s:end_s]
+            xs = np.fromiter((p.x for p in window if p is not None), dtype=np.float64)
+            ys = np.fromiter((p.y for p in window if p is not None), dtype=np.float64)
+            tracks[custom_id] = (xs, ys)
+
+        groups: dict[str, list[str]] = {}
+        for custom_id in tracks:
+            if group_by == HeatmapGroupBy.PLAYER:
+                key = custom_id
+            elif group_by == HeatmapGroupBy.TEAM:
+                key = str(team_by_player.get(custom_id))
+            else:
+                key = "all"
+            groups.setdefault(key, []).append(custom_id)
+
+        bounds = [[MINIMAP_MIN, MINIMAP_MAX], [MINIMAP_MIN, MINIMAP_MAX]]
+        heatmaps: dict[str, list[list[int]]] = {}
+        for key, members in groups.items():
+            xs = np.concatenate([tracks[m][0] for m in members])
+            ys = np.concatenate([tracks[m][1] for m in members])
+            # histogram2d's first axis is its first argument, so pass y first
+            # to get row-major [y][x] output
+            counts, _, _ = np.histogram2d(ys, xs, bins=grid_size, range=bounds)
+            heatmaps[key] = counts.astype(np.int32).tolist()
+
+        return PositionHeatmaps(
+            grid_size=grid_size,
+            x_min=MINIMAP_MIN,
+            x_max=MINIMAP_MAX,
+            y_min=MINIMAP_MIN,
+            y_max=MINIMAP_MAX,
+            start_s=start_s,
+            end_s=end_s,
+            group_by=group_by,
+            heatmaps=heatmaps,
+        )
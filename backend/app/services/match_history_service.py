@@ -0,0 +1,78 @@
+from datetime import timedelta
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.domain.deadlock_api import MatchSummary
+from app.domain.exceptions import DeadlockAPIError
+from app.infra.db.session import get_db_session
+from app.repo.match_history_repo import MatchHistoryRepo
+from app.services.deadlock_api_service import DeadlockAPIService
+from app.utils.datetime_utils import utcnow
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class MatchHistoryService:
+    """
+    Serves account match history from the DB, refreshing it incrementally.
+
+    A refresh only asks the Deadlock API for matches newer than the latest
+    stored `start_time`, and only runs once per refresh interval per account.
+    """
+
+    def __init__(
+        self,
+        deadlock_api_service: DeadlockAPIService,
+        repo: MatchHistoryRepo,
+        refresh_interval: timedelta = timedelta(seconds=settings.MATCH_HISTORY_REFRESH_INTERVAL_S),
+    ):
+        self.deadlock_api_service = deadlock_api_service
+        self.repo = repo
+        self.refresh_interval = refresh_interval
+
+    async def get_match_history(
+        self,
+        account_id: int,
+        limit: int,
+        offset: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> list[MatchSummary]:
+        refreshed_at = await self.repo.get_refreshed_at(account_id, session)
+        if refreshed_at is None or utcnow() - refreshed_at >= self.refresh_interval:
+            try:
+                await self.refresh(account_id, session)
+            except DeadlockAPIError as e:
+                if refreshed_at is None:
+                    raise
+                # We have a previous copy; serving it stale beats failing the page
+                logger.warning("Match history refresh failed for account_id=%s, serving stored copy: %s",
+                               account_id, e)
+
+        return await self.repo.get_match_history(account_id, limit, offset, session)
+
+    async def refresh(
+        self,
+        account_id: int,
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> int:
+        """
+        Fetch and store matches newer than the latest stored one.
+
+        Returns:
+            Number of new matches fetched
+        """
+        latest_start_time = await self.repo.get_latest_start_time(account_id, session)
+        history = await self.deadlock_api_service.get_account_match_history_for(
+            str(account_id), min_start_time=latest_start_time
+        )
+        matches = [MatchSummary.model_validate(m) for m in history]
+        if latest_start_time is not None:
+            # Upstream may ignore the lower bound; never re-store what we already have
+            matches = [m for m in matches if m.start_time >= latest_start_time]
+
+        await self.repo.store_matches(account_id, matches, session)
+        logger.info("Refreshed match history for account_id=%s: %s new matches", account_id, len(matches))
+        return len(matches)
@@ -0,0 +1,52 @@
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.match_stats import PlayerMatchStats
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SECONDS_PER_MINUTE = 60
+
+class MatchStatsService:
+    @staticmethod
+    def build(
+        match_data: TransformedMatchData,
+        damage_aggregates: list[PlayerDamageAggregates],
+    ) -> list[PlayerMatchStats]:
+        """
+        Flatten a match into one PlayerMatchStats per player.
+
+        Args:
+            match_data: The transformed match, for player identity and length
+            damage_aggregates: The match's per-player aggregates (see
+                DamageAggregationService), so damage isn't re-scanned here
+
+        Returns:
+            Stats for every player present in both match_data.players_data
+            and damage_aggregates
+        """
+        players = {p.custom_id: p for p in match_data.players_data}
+        stats = []
+        for aggregates in damage_aggregates:
+            player = players.get(aggregates.custom_id)
+            if player is None:
+                logger.warning("No player data for custom_id=%s, skipping stats", aggregates.custom_id)
+                continue
+
+            stats.append(PlayerMatchStats(
+                custom_id=aggregates.custom_id,
+                steam_id_32=player.steam_id_32,
+                hero_id=player.hero_id,
+                team=player.team,
+                total_match_time_s=match_data.total_match_time_s,
+                match_length_s=match_data.total_match_time_s - match_data.match_start_time_s,
+                total_damage=aggregates.total_damage,
+                total_absorbed=aggregates.total_absorbed,
+                total_health_lost=aggregates.total_health_lost,
+                damage_by_minute=MatchStatsService.damage_by_minute(aggregates.cumulative_damage),
+            ))
+        return stats
+
+    @staticmethod
+    def damage_by_minute(cumulative_damage: list[int]) -> list[int]:
+        return cumulative_damage[::SECONDS_PER_MINUTE]
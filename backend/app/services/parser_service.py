@@ -1,4 +1,4 @@
-from app.infra.parser.parser_client import ParserClient
+from app.infra.parser.parser_client import ParserClient, get_parser_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -7,8 +7,9 @@ logger = get_logger(__name__)
 class ParserService:
     """Service for orchestrating parser operations."""
 
-    def __init__(self):
-        self.client = ParserClient()
+    def __init__(self, client: ParserClient | None = None):
+        # Shared, so requests reuse connections and the circuit breaker's state
+        self.client = client or get_parser_client()
 
     async def check_demo_available(self, match_id: int) -> tuple[bool, str | None]:
         """Check if parser has a local demo file for the match."""
@@ -0,0 +1,116 @@
+import numpy as np
+from app.domain.player import PositionWindow
+from app.domain.position_track import (
+    POSITION_QUANTUM,
+    SIMPLIFICATION_TOLERANCES,
+    CompactPositionTrack,
+)
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class PositionCompactionService:
+    @staticmethod
+    def compact_all(
+        per_player_positions: dict[str, PositionWindow],
+        levels: tuple[int, ...] = tuple(SIMPLIFICATION_TOLERANCES),
+    ) -> list[CompactPositionTrack]:
+        return [
+            PositionCompactionService.compact(custom_id, positions, level)
+            for custom_id, positions in per_player_positions.items()
+            for level in levels
+        ]
+
+    @staticmethod
+    def compact(custom_id: str, positions: PositionWindow, level: int) -> CompactPositionTrack:
+        """
+        Simplify, quantize and delta-encode one player's position track.
+
+        positions[i] is the player's position i seconds into the match, None
+        for seconds the parser had no sample for; TransformService.to_match_data
+        keeps one slot per second so gaps don't shift later timestamps.
+        """
+        samples = [(t, p.x, p.y, p.z) for t, p in enumerate(positions) if p is not None]
+        track = np.array(samples, dtype=np.float64).reshape(-1, 4)
+
+        keep = PositionCompactionService.simplify(track, SIMPLIFICATION_TOLERANCES[level])
+        kept = track[keep]
+        t = kept[:, 0].astype(np.int64)
+        xyz = np.rint(kept[:, 1:] / POSITION_QUANTUM).astype(np.int64)
+
+        return CompactPositionTrack(
+            custom_id=custom_id,
+            level=level,
+            quantum=POSITION_QUANTUM,
+            t=PositionCompactionService._delta_encode(t),
+            x=PositionCompactionService._delta_encode(xyz[:, 0]),
+            y=PositionCompactionService._delta_encode(xyz[:, 1]),
+            z=PositionCompactionService._delta_encode(xyz[:, 2]),
+        )
+
+    @staticmethod
+    def simplify(track: np.ndarray, tolerance: float) -> np.ndarray:
+        """
+        Ramer-Douglas-Peucker over (t, x, y, z) samples using synchronized
+        Euclidean distance: each dropped sample must lie within `tolerance`
+        (in the x/y plane) of where linear interpolation *at its timestamp*
+        would put it. Plain spatial RDP would drop the samples of a player
+        standing still and distort playback timing.
+
+        Returns:
+            Sorted indices of the samples to keep
+        """
+        n = len(track)
+        if n < 3 or tolerance <= 0:
+            return np.arange(n)
+
+        t, xy = track[:, 0], track[:, 1:3]
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+
+        # Split every open segment of the current recursion depth in one
+        # vectorized pass instead of one numpy call per segment
+        starts, ends = np.array([0]), np.array([n - 1])
+        while len(starts):
+            inner_counts = ends - starts - 1
+            has_inner = inner_counts > 0
+            starts, ends, inner_counts = starts[has_inner], ends[has_inner], inner_counts[has_inner]
+            if not len(starts):
+                break
+
+            segment = np.repeat(np.arange(len(starts)), inner_counts)
+            offsets = np.cumsum(inner_counts) - inner_counts
+            inner = np.arange(inner_counts.sum()) - offsets[segment] + starts[segment] + 1
+
+            first, last = starts[segment], ends[segment]
+            ratio = (t[inner] - t[first]) / (t[last] - t[first])
+            expected = xy[first] + ratio[:, None] * (xy[last] - xy[first])
+            distances = np.hypot(*(xy[inner] - expected).T)
+
+            max_distance = np.maximum.reduceat(distances, offsets)
+            is_max = distances == max_distance[segment]
+            # first farthest sample per segment
+            candidates = np.flatnonzero(is_max)
+            _, first_hit = np.unique(segment[candidates], return_index=True)
+            farthest = inner[candidates[first_hit]]
+
+            split = max_distance > tolerance
+            splits = farthest[split]
+            keep[splits] = True
+            starts = np.concatenate([starts[split], splits])
+            ends = np.concatenate([splits, ends[split]])
+
+        return np.flatnonzero(keep)
+
+    @staticmethod
+    def decode(track: CompactPositionTrack) -> list[tuple[int, float, float, float]]:
+        """Inverse of `compact` (up to quantization/simplification): [(t, x, y, z), ...]"""
+        t = np.cumsum(track.t)
+        xyz = np.stack([np.cumsum(track.x), np.cumsum(track.y), np.cumsum(track.z)], axis=1) * track.quantum
+        return [(int(ti), float(x), float(y), float(z)) for ti, (x, y, z) in zip(t, xyz)]
+
+    @staticmethod
+    def _delta_encode(values: np.ndarray) -> list[int]:
+        if len(values) == 0:
+            return []
+        return np.diff(values, prepend=0).tolist()
@@ -0,0 +1,135 @@
+import asyncio
+from functools import lru_cache
+from typing import Optional
+from app.config import get_settings
+from app.domain.steam_account import SteamPlayer
+from app.infra.steam.steam_api_client import MAX_IDS_PER_CALL, SteamAPIClient
+from app.utils.logger import get_logger
+from app.utils.ttl_cache import TTLCache
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class SteamPlayerBatcher:
+    """
+    Coalesces concurrent single-id summary lookups into one upstream call.
+
+    The first `get` opens a short batching window; every id requested before
+    the window closes (or until the batch is full) is fetched together.
+    """
+
+    def __init__(self, client: SteamAPIClient, window_s: float, max_batch_size: int = MAX_IDS_PER_CALL):
+        self.client = client
+        self.window_s = window_s
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks; hold running flushes
+        # here so one can't be garbage collected with its waiters unresolved
+        self._flush_tasks: set[asyncio.Task] = set()
+        self.upstream_calls = 0
+
+    async def get(self, steam_id: str) -> Optional[SteamPlayer]:
+        future = self._pending.get(steam_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[steam_id] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._schedule_flush(loop, delay=0)
+            elif self._flush_handle is None:
+                self._schedule_flush(loop, delay=self.window_s)
+
+        return await asyncio.shield(future)
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(delay, self._start_flush, loop)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Steam player summary batch flush failed", exc_info=task.exception())
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending, {}
+        self._flush_handle = None
+        if not batch:
+            return
+
+        self.upstream_calls += 1
+        logger.debug("Fetching %s steam player summaries in one batch", len(batch))
+        try:
+            players = await self.client.fetch_player_summaries(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id = {player.steamid: player for player in players}
+        for steam_id, future in batch.items():
+            if not future.done():
+                future.set_result(by_id.get(steam_id))
+
+
+class SteamAccountService:
+    """Cached, batched access to Steam player summaries."""
+
+    def __init__(self, client: SteamAPIClient, cache_ttl_s: float, batch_window_s: float):
+        self.client = client
+        self.cache: TTLCache[str, SteamPlayer] = TTLCache(ttl_s=cache_ttl_s, maxsize=10_000)
+        self.batcher = SteamPlayerBatcher(client, window_s=batch_window_s)
+
+    async def get_player(self, steam_id: str) -> Optional[SteamPlayer]:
+        """Return the summary for a single steam id, or None if Steam doesn't know it."""
+        cached = self.cache.get(steam_id)
+        if cached is not None:
+            return cached
+
+        player = await self.batcher.get(steam_id)
+        if player is not None:
+            self.cache.set(steam_id, player)
+        return player
+
+    async def get_players(self, steam_ids: list[str]) -> list[SteamPlayer]:
+        """
+        Return summaries for many steam ids, preserving request order.
+
+        Cached summaries are served locally; the rest are fetched with as few
+        upstream calls as possible. Unknown ids are omitted.
+        """
+        unique_ids = list(dict.fromkeys(steam_ids))
+        found: dict[str, SteamPlayer] = {}
+        missing: list[str] = []
+        for steam_id in unique_ids:
+            cached = self.cache.get(steam_id)
+            if cached is not None:
+                found[steam_id] = cached
+            else:
+                missing.append(steam_id)
+
+        if missing:
+            for player in await self.client.fetch_player_summaries(missing):
+                self.cache.set(player.steamid, player)
+                found[player.steamid] = player
+
+        return [found[steam_id] for steam_id in unique_ids if steam_id in found]
+
+
+@lru_cache
+def get_steam_account_service() -> SteamAccountService:
+    """The process-wide service (and its cache), created on first use rather than at import."""
+    return SteamAccountService(
+        SteamAPIClient(),
+        cache_ttl_s=settings.STEAM_SUMMARY_CACHE_TTL_S,
+        batch_window_s=settings.STEAM_SUMMARY_BATCH_WINDOW_MS / 1000,
+    )
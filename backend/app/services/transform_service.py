@@ -3,6 +3,7 @@ from app.domain.match_analysis import (
     PlayerMatchData,
     TransformedMatchData,
 )
+from app.domain.player import PlayerPosition
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,12 +25,17 @@ class TransformService:
             )
 
         for i in range(0, (parsed_match.total_match_time_s - parsed_match.match_start_time_s)):
+            # positions[i] must stay the player's position i seconds in, so a
+            # second the parser has no sample for is stored as None
+            window: dict[str, PlayerPosition] = {}
             for player_position in getattr(parsed_match, "positions", [])[i]:
                 custom_id = player_position.custom_id
 
                 is_human_player = int(custom_id) < 20
                 if is_human_player:
-                    match_data.per_player_data[str(custom_id)].positions.append(player_position)
+                    window.setdefault(str(custom_id), player_position)
+            for custom_id, player_data in match_data.per_player_data.items():
+                player_data.positions.append(window.get(custom_id))
 
             for player in getattr(parsed_match, "players_data", []):
                 custom_id = player.custom_id
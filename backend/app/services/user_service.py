@@ -1,20 +1,54 @@
 from typing import Optional, Annotated
 from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
 from app.infra.db.models import User
 from app.infra.db.session import get_db_session
 from app.repo.users_repo import UserRepository
-from app.utils.steam_id_utils import encrypt_steam_id, hash_steam_id
+from app.utils.steam_id_utils import encrypt_steam_id, hash_steam_id, hash_steam_ids
+from app.utils.ttl_cache import TTLCache
+
+settings = get_settings()
+
+# Users by id, shared by every request in the process. Entries are detached
+# copies, so they never hold on to (or get refreshed through) a session.
+user_cache = TTLCache[int, User](
+    ttl_s=settings.USER_CACHE_TTL_S, maxsize=settings.USER_CACHE_MAX_ENTRIES
+)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    # Covers ORM flushes; bulk UPDATE/DELETE statements must invalidate themselves
+    if target.id is not None:
+        user_cache.invalidate(target.id)
 
 class UserService:
+    def __init__(self, cache: TTLCache[int, User] = user_cache):
+        self.cache = cache
+
     async def create_user(self, steam_id: str, session: Annotated[AsyncSession, Depends(get_db_session)]) -> User:
         hashed_steam_id = hash_steam_id(steam_id)
         encrypted_steam_id: str = encrypt_steam_id(steam_id)
         return await UserRepository().create_user(hashed_steam_id, encrypted_steam_id, session=session)
 
     async def find_user_by_id(self, user_id: int, session: Annotated[AsyncSession, Depends(get_db_session)]) -> Optional[User]:
-        return await UserRepository().get_user_by_id(user_id, session=session)
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        user = await UserRepository().get_user_by_id(user_id, session=session)
+        if user is not None:
+            self.cache.set(user_id, User.model_validate(user.model_dump()))
+        return user
 
     async def find_user_by_steam_id(self, steam_id: str, session: Annotated[AsyncSession, Depends(get_db_session)]) -> Optional[User]:
         hashed_steam_id = hash_steam_id(steam_id)
-        return await UserRepository().get_user_by_steam_id(hashed_steam_id, session=session)
\ No newline at end of file
+        return await UserRepository().get_user_by_steam_id(hashed_steam_id, session=session)
+
+    async def find_users_by_steam_ids(self, steam_ids: list[str], session: Annotated[AsyncSession, Depends(get_db_session)]) -> dict[str, User]:
+        """Registered users among `steam_ids` (e.g. every player in a match), keyed by steam id."""
+        steam_ids_by_hash = hash_steam_ids(steam_ids)
+        users = await UserRepository().get_users_by_steam_ids(list(steam_ids_by_hash), session=session)
+        return {steam_ids_by_hash[user.hashed_steam_id]: user for user in users}
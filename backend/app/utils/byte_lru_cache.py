@@ -0,0 +1,59 @@
+"""
+In-process LRU cache for serialized payloads, bounded by total bytes.
+"""
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ByteLRUCache(Generic[K]):
+    """
+    LRU cache of bytes values whose combined size stays under `max_bytes`.
+
+    Analysis responses range from a few KB to tens of MB, so bounding by
+    entry count would either waste memory or hold almost nothing.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[K, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> Optional[bytes]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            # Would evict everything else and still not fit
+            return
+
+        self.invalidate(key)
+        self._entries[key] = value
+        self.size_bytes += len(value)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self.size_bytes -= len(value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,9 +1,94 @@
 """
 Centralized logger utility providing consistent logging configuration across the application.
+
+Records are put on a bounded queue by the calling thread and formatted and
+written by a listener thread, so a slow stdout (or a burst of logs) never
+blocks the event loop. Message arguments are formatted on the listener
+thread too: log with %-style arguments, not f-strings, and don't log objects
+that are mutated right after the call.
 """
+import atexit
 import logging
+import queue
+import random
 import sys
-from typing import Optional
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+import orjson
+
+# Attributes every LogRecord has; anything else came in via `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a share of INFO-and-below records from noisy loggers.
+
+    `rates` maps logger name prefixes ("app.api.match") to the share of
+    records kept; the longest matching prefix wins. Warnings and errors are
+    always kept.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._rate_by_logger: dict[str, Optional[float]] = {}
+        self.sampled_out = 0
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        if name not in self._rate_by_logger:
+            prefixes = [p for p in self.rates if name == p or name.startswith(f"{p}.")]
+            self._rate_by_logger[name] = self.rates[max(prefixes, key=len)] if prefixes else None
+        return self._rate_by_logger[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate_for(record.name)
+        if rate is None or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Drops (and counts) records when the queue is full instead of waiting on the listener."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record can be handed over
+        # as is; the default formats it here, on the caller's thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 class LoggerManager:
@@ -22,15 +107,26 @@ class LoggerManager:
             LoggerManager._initialized = True
 
     def _setup_logging(self):
-        """Configure the root logger with desired format and handlers."""
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        """Route the root logger through a queue to a stdout handler on a listener thread."""
+        from app.config import get_settings
+
+        settings = get_settings()
+        if settings.LOG_FORMAT == "json":
+            formatter: logging.Formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        self.queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+        self.sampling_filter = SamplingFilter(settings.LOG_SAMPLE_RATES)
+        self.queue_handler.addFilter(self.sampling_filter)
+        self.listener = QueueListener(self.queue_handler.queue, stream_handler, respect_handler_level=True)
+        self.listener.start()
+        # Flush whatever is still queued on interpreter exit
+        atexit.register(self.listener.stop)
+
+        logging.basicConfig(level=settings.LOG_LEVEL, handlers=[self.queue_handler])
 
     def get_logger(self, name: str) -> logging.Logger:
         """
@@ -1,22 +1,37 @@
 import hashlib
+from functools import lru_cache
 from cryptography.fernet import Fernet
 from app.config import get_settings
 
-settings = get_settings()
-FERNET_SECRET_KEY = settings.FERNET_SECRET_KEY
-STEAM_HASH_SALT = settings.STEAM_HASH_SALT
 
-if FERNET_SECRET_KEY is None or STEAM_HASH_SALT is None:
-    raise RuntimeError("FERNET_SECRET_KEY or STEAM_HASH_SALT not set in environment.")
+def _require(name: str) -> str:
+    value = getattr(get_settings(), name)
+    if value is None:
+        raise RuntimeError(f"{name} not set in environment.")
+    return value
 
-fernet = Fernet(FERNET_SECRET_KEY)
+@lru_cache
+def _fernet() -> Fernet:
+    return Fernet(_require("FERNET_SECRET_KEY"))
 
+@lru_cache
+def _salted_sha256() -> "hashlib._Hash":
+    # SHA-256 state with the salt already absorbed; each hash copies it and
+    # only feeds the steam id
+    return hashlib.sha256(_require("STEAM_HASH_SALT").encode())
+
+@lru_cache(maxsize=65536)
 def hash_steam_id(steam_id: str) -> str:
-    salt = settings.STEAM_HASH_SALT.encode()
-    return hashlib.sha256(salt + steam_id.encode()).hexdigest()
+    digest = _salted_sha256().copy()
+    digest.update(steam_id.encode())
+    return digest.hexdigest()
+
+def hash_steam_ids(steam_ids: list[str]) -> dict[str, str]:
+    """Hashed steam id -> steam id, for resolving batched lookups back to their inputs."""
+    return {hash_steam_id(steam_id): steam_id for steam_id in steam_ids}
 
 def encrypt_steam_id(steam_id: str) -> str:
-    return fernet.encrypt(steam_id.encode()).decode()
+    return _fernet().encrypt(steam_id.encode()).decode()
 
 def decrypt_steam_id(encrypted: str) -> str:
-    return fernet.decrypt(encrypted.encode()).decode()
\ No newline at end of file
+    return _fernet().decrypt(encrypted.encode()).decode()
@@ -0,0 +1,83 @@
+"""
+Fixtures for the pytest-benchmark suite (benchmarks/test_*.py).
+
+Postgres-backed benchmarks run against BENCHMARK_DATABASE_URL and are
+skipped when it isn't set. Tables are created on start and dropped on exit,
+so point it at a scratch database.
+"""
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any, TypeVar
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from app.domain.match_analysis import ParsedMatchResponse
+from app.domain.boss import BossData
+from app.domain.player import PlayerData
+from app.infra.db import (  # noqa: F401 - registers every table on SQLModel.metadata
+    account_match_history,
+    boss_timeline,
+    models,
+    parsed_match,
+    player_damage_aggregate,
+    player_match_stat,
+    player_position_track,
+)
+from benchmarks.payloads import MATCH_MINUTES, synthetic_parser_payload
+
+T = TypeVar("T")
+
+BENCHMARK_DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL")
+
+
+@pytest.fixture(scope="session", params=MATCH_MINUTES, ids=[f"{m}min" for m in MATCH_MINUTES])
+def parser_payload(request) -> dict[str, Any]:
+    return synthetic_parser_payload(request.param)
+
+
+@pytest.fixture(scope="session")
+def parsed_match(parser_payload) -> ParsedMatchResponse:
+    # Same construction as AnalyzeMatchUseCase._transform_and_store
+    return ParsedMatchResponse(
+        total_match_time_s=parser_payload["total_match_time_s"],
+        match_start_time_s=parser_payload["match_start_time_s"],
+        damage=parser_payload["damage"],
+        players_data=[PlayerData(**p) for p in parser_payload["players"]],
+        positions=parser_payload["positions"],
+        bosses=BossData(**parser_payload["bosses"]),
+    )
+
+
+@pytest.fixture(scope="session")
+def run() -> Iterator[Callable[[Awaitable[T]], T]]:
+    """Run a coroutine to completion on one loop shared by the whole session."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def db_engine(run) -> Iterator[AsyncEngine]:
+    if not BENCHMARK_DATABASE_URL:
+        pytest.skip("BENCHMARK_DATABASE_URL not set")
+
+    engine = create_async_engine(BENCHMARK_DATABASE_URL, echo=False)
+
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    async def drop_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await engine.dispose()
+
+    run(create_all())
+    yield engine
+    run(drop_all())
+
+
+@pytest.fixture(scope="session")
+def db_sessionmaker(db_engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(db_engine, expire_on_commit=False)
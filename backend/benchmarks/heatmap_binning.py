@@ -0,0 +1,60 @@
+"""
+Full-match heatmap binning timings on synthetic position tracks.
+
+Usage (from backend/):
+    python -m benchmarks.heatmap_binning
+"""
+import random
+import statistics
+import time
+from app.domain.boss import BossData
+from app.domain.heatmap import MINIMAP_MAX, MINIMAP_MIN, HeatmapGroupBy
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import PlayerData, PlayerMatchData, PlayerPosition
+from app.services.heatmap_service import HeatmapService
+
+MATCH_MINUTES = (20, 35, 50)
+PLAYERS = 12
+ROUNDS = 10
+
+
+def synthetic_match(match_length_s: int) -> TransformedMatchData:
+    rng = random.Random(match_length_s)
+    players_data = []
+    per_player_data = {}
+    for i in range(PLAYERS):
+        custom_id = str(i + 1)
+        players_data.append(PlayerData(entity_id=custom_id, custom_id=custom_id, name=f"p{i}", team=i % 2, lane=1))
+        x = y = 0.0
+        positions = []
+        for _ in range(match_length_s):
+            x = min(MINIMAP_MAX, max(MINIMAP_MIN, x + rng.uniform(-400, 400)))
+            y = min(MINIMAP_MAX, max(MINIMAP_MIN, y + rng.uniform(-400, 400)))
+            positions.append(PlayerPosition.model_construct(custom_id=custom_id, x=x, y=y, z=0.0, is_npc=False))
+        per_player_data[custom_id] = PlayerMatchData.model_construct(positions=positions, damage=[])
+
+    return TransformedMatchData.model_construct(
+        total_match_time_s=match_length_s,
+        match_start_time_s=0,
+        players_data=players_data,
+        per_player_data=per_player_data,
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+
+def main() -> None:
+    for minutes in MATCH_MINUTES:
+        match_data = synthetic_match(minutes * 60)
+        for grid_size in (64, 256):
+            for group_by in HeatmapGroupBy:
+                samples = []
+                for _ in range(ROUNDS):
+                    start = time.perf_counter()
+                    HeatmapService.build(match_data, grid_size, group_by)
+                    samples.append((time.perf_counter() - start) * 1000)
+                print(f"{minutes}min grid={grid_size:<3} group_by={group_by.value:<6} "
+                      f"{statistics.median(samples):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""
+Load tests for /match/analysis against local stand-ins for the Deadlock API
+and the parser.
+
+Usage (from backend/), three processes:
+    # 1. Mock Deadlock API on :9001 and stub parser on :9000
+    python -m benchmarks.loadtest.serve --parse-delay-s 2 --api-latency-ms 80 --api-failure-rate 0.02
+
+    # 2. The backend under test, pointed at them
+    DEADLOCK_API_DOMAIN=http://127.0.0.1:9001 PARSER_BASE_URL=http://127.0.0.1:9000 \
+        uvicorn app.main:app --port 8000
+
+    # 3. A scenario (hit, revalidate, cold, herd)
+    python -m benchmarks.loadtest --scenario hit --concurrency 32 --duration-s 30
+"""
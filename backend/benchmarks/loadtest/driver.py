@@ -0,0 +1,204 @@
+"""
+Closed-loop asyncio load driver for /match/analysis.
+
+Scenarios:
+    hit         analyzed matches, served from the DB / response cache
+    revalidate  analyzed matches with If-None-Match; every answer should be a 304
+    cold        a new match per request, so every request parses
+    herd        bursts of concurrent requests for the same new match
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Optional
+import httpx
+
+
+@dataclass
+class LoadResult:
+    scenario: str
+    elapsed_s: float = 0.0
+    latencies_s: list[float] = field(default_factory=list)
+    statuses: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+    notes: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_s)
+
+    def percentile_ms(self, pct: float) -> float:
+        if not self.latencies_s:
+            return 0.0
+        ordered = sorted(self.latencies_s)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] * 1000
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "scenario": self.scenario,
+            "requests": self.requests,
+            "throughput_rps": round(self.requests / self.elapsed_s, 2) if self.elapsed_s else 0.0,
+            "p50_ms": round(self.percentile_ms(50), 1),
+            "p99_ms": round(self.percentile_ms(99), 1),
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "statuses": dict(self.statuses),
+            **self.notes,
+        }
+
+
+async def _timed(result: LoadResult, send: Callable[[], Awaitable[httpx.Response]], expected: int) -> Optional[httpx.Response]:
+    start = time.perf_counter()
+    try:
+        response = await send()
+    except httpx.HTTPError as e:
+        result.latencies_s.append(time.perf_counter() - start)
+        result.statuses[type(e).__name__] += 1
+        result.errors += 1
+        return None
+
+    result.latencies_s.append(time.perf_counter() - start)
+    result.statuses[str(response.status_code)] += 1
+    if response.status_code != expected:
+        result.errors += 1
+    return response
+
+
+async def _closed_loop(
+    result: LoadResult,
+    request: Callable[[], Awaitable[object]],
+    concurrency: int,
+    duration_s: float,
+) -> None:
+    deadline = time.perf_counter() + duration_s
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed_s = time.perf_counter() - start
+
+
+class LoadDriver:
+    def __init__(self, client: httpx.AsyncClient, match_ids: list[int], parser_url: Optional[str] = None):
+        self.client = client
+        self.match_ids = match_ids
+        self.parser_url = parser_url
+        self.etags: dict[int, str] = {}
+
+    def _url(self, match_id: int) -> str:
+        return f"/match/analysis/{match_id}"
+
+    async def warm(self) -> None:
+        """Analyze every match once (sequentially) and remember its ETag."""
+        for match_id in self.match_ids:
+            response = await self.client.get(self._url(match_id))
+            response.raise_for_status()
+            self.etags[match_id] = response.headers["ETag"]
+
+    async def hit(self, concurrency: int, duration_s: float) -> LoadResult:
+        result = LoadResult("hit")
+        ids = itertools.cycle(self.match_ids)
+        await _closed_loop(
+            result, lambda: _timed(result, lambda: self.client.get(self._url(next(ids))), 200),
+            concurrency, duration_s,
+        )
+        return result
+
+    async def revalidate(self, concurrency: int, duration_s: float) -> LoadResult:
+        result = LoadResult("revalidate")
+        ids = itertools.cycle(self.match_ids)
+
+        def send() -> Awaitable[httpx.Response]:
+            match_id = next(ids)
+            return self.client.get(self._url(match_id), headers={"If-None-Match": self.etags[match_id]})
+
+        await _closed_loop(result, lambda: _timed(result, send, 304), concurrency, duration_s)
+        return result
+
+    async def cold(self, concurrency: int, duration_s: float, first_match_id: int) -> LoadResult:
+        result = LoadResult("cold")
+        ids = itertools.count(first_match_id)
+        parses_before = await self._parser_parses()
+        await _closed_loop(
+            result, lambda: _timed(result, lambda: self.client.get(self._url(next(ids))), 200),
+            concurrency, duration_s,
+        )
+        await self._note_parses(result, parses_before)
+        return result
+
+    async def herd(self, concurrency: int, rounds: int, first_match_id: int) -> LoadResult:
+        """`concurrency` simultaneous requests for one new match, `rounds` times."""
+        result = LoadResult("herd")
+        parses_before = await self._parser_parses()
+        start = time.perf_counter()
+        for match_id in range(first_match_id, first_match_id + rounds):
+            await asyncio.gather(*(
+                _timed(result, lambda: self.client.get(self._url(match_id)), 200)
+                for _ in range(concurrency)
+            ))
+        result.elapsed_s = time.perf_counter() - start
+        await self._note_parses(result, parses_before)
+        result.notes["new_matches"] = rounds
+        return result
+
+    async def _parser_parses(self) -> Optional[int]:
+        if not self.parser_url:
+            return None
+        response = await self.client.get(f"{self.parser_url}/stats")
+        return response.json()["parses"]
+
+    async def _note_parses(self, result: LoadResult, parses_before: Optional[int]) -> None:
+        # How many parses the backend asked for; more than one per new match
+        # means concurrent cold misses were not coalesced
+        parses_after = await self._parser_parses()
+        if parses_before is not None and parses_after is not None:
+            result.notes["parser_parses"] = parses_after - parses_before
+
+
+async def run(args: argparse.Namespace) -> LoadResult:
+    match_ids = [int(m) for m in args.match_ids.split(",")]
+    limits = httpx.Limits(max_connections=max(args.concurrency, 10))
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout_s, limits=limits) as client:
+        driver = LoadDriver(client, match_ids, parser_url=args.parser_url)
+        if args.scenario in ("hit", "revalidate"):
+            await driver.warm()
+        if args.scenario == "hit":
+            return await driver.hit(args.concurrency, args.duration_s)
+        if args.scenario == "revalidate":
+            return await driver.revalidate(args.concurrency, args.duration_s)
+        # Fresh ids per run so "cold" stays cold against a reused database;
+        # match_id is an int4 column, so stay below 2**31
+        first_match_id = args.first_match_id or 1_000_000_000 + (int(time.time()) % 100_000) * 10_000
+        if args.scenario == "cold":
+            return await driver.cold(args.concurrency, args.duration_s, first_match_id)
+        return await driver.herd(args.concurrency, args.rounds, first_match_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--parser-url", default="http://127.0.0.1:9000",
+                        help="stub parser, queried for parse counts (empty to skip)")
+    parser.add_argument("--scenario", choices=("hit", "revalidate", "cold", "herd"), default="hit")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration-s", type=float, default=30.0)
+    parser.add_argument("--rounds", type=int, default=5, help="herd only: number of new matches")
+    parser.add_argument("--match-ids", default="1,2,3,4,5,6,7,8", help="hit/revalidate: matches to cycle through")
+    parser.add_argument("--first-match-id", type=int, default=0, help="cold/herd: defaults to a time-based id")
+    parser.add_argument("--timeout-s", type=float, default=60.0)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args)).summary()
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>16}: {value}")
@@ -0,0 +1,28 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass(frozen=True)
+class Faults:
+    """Latency and failures injected into every request to a stand-in service."""
+    latency_s: float = 0.0
+    # Uniform +/- jitter around latency_s
+    jitter_s: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 503
+
+
+def add_fault_injection(app: FastAPI, faults: Faults, rng: random.Random | None = None) -> None:
+    rng = rng or random.Random()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        delay_s = max(0.0, faults.latency_s + rng.uniform(-faults.jitter_s, faults.jitter_s))
+        if delay_s:
+            await asyncio.sleep(delay_s)
+        if faults.failure_rate and rng.random() < faults.failure_rate:
+            return JSONResponse({"detail": "injected failure"}, status_code=faults.failure_status)
+        return await call_next(request)
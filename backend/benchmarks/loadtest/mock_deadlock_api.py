@@ -0,0 +1,40 @@
+"""
+Stand-in for the Deadlock API endpoints the backend calls: match metadata,
+salts (whose demo_url the stub parser accepts) and account match history.
+"""
+from pathlib import Path
+from typing import Any, Optional
+import orjson
+from fastapi import FastAPI, Response
+from benchmarks.loadtest.faults import Faults, add_fault_injection
+
+DEFAULT_METADATA_PAYLOAD = Path(__file__).resolve().parents[3] / "frontend" / "public" / "match_metadata.json"
+
+
+def create_app(faults: Faults = Faults(), metadata_payload: Path = DEFAULT_METADATA_PAYLOAD) -> FastAPI:
+    app = FastAPI()
+    add_fault_injection(app, faults)
+    # A recorded payload, re-labelled with whichever match id is requested
+    metadata: dict[str, Any] = orjson.loads(metadata_payload.read_bytes())
+
+    @app.get("/v1/matches/{match_id}/metadata")
+    async def match_metadata(match_id: int) -> Response:
+        payload = {**metadata, "match_info": {**metadata["match_info"], "match_id": match_id}}
+        return Response(content=orjson.dumps(payload), media_type="application/json")
+
+    @app.get("/v1/matches/{match_id}/salts")
+    async def salts(match_id: int):
+        return {
+            "match_id": match_id,
+            "cluster_id": 1,
+            "metadata_salt": 1,
+            "replay_salt": 1,
+            "metadata_url": f"http://replays.invalid/{match_id}_1.meta.bz2",
+            "demo_url": f"http://replays.invalid/{match_id}_1.dem.bz2",
+        }
+
+    @app.get("/v1/players/{steam_id}/match-history")
+    async def match_history(steam_id: str, min_unix_timestamp: Optional[int] = None):
+        return []
+
+    return app
@@ -0,0 +1,54 @@
+"""
+Run the mock Deadlock API and the stub parser in one process.
+
+Usage (from backend/):
+    python -m benchmarks.loadtest.serve --api-latency-ms 80 --parse-delay-s 2 --parser-failure-rate 0.01
+"""
+import argparse
+import asyncio
+import uvicorn
+from benchmarks import stub_parser
+from benchmarks.loadtest import mock_deadlock_api
+from benchmarks.loadtest.faults import Faults
+from benchmarks.payloads import MATCH_MINUTES
+
+
+async def serve(api: uvicorn.Config, parser: uvicorn.Config) -> None:
+    await asyncio.gather(uvicorn.Server(api).serve(), uvicorn.Server(parser).serve())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--api-port", type=int, default=9001)
+    parser.add_argument("--api-latency-ms", type=float, default=50.0)
+    parser.add_argument("--api-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--api-failure-rate", type=float, default=0.0)
+    parser.add_argument("--parser-port", type=int, default=9000)
+    parser.add_argument("--parser-latency-ms", type=float, default=5.0)
+    parser.add_argument("--parser-failure-rate", type=float, default=0.0)
+    parser.add_argument("--parse-delay-s", type=float, default=0.0)
+    parser.add_argument("--minutes", default=",".join(str(m) for m in MATCH_MINUTES),
+                        help="comma-separated match lengths, cycled by match id")
+    args = parser.parse_args()
+
+    api_app = mock_deadlock_api.create_app(Faults(
+        latency_s=args.api_latency_ms / 1000,
+        jitter_s=args.api_jitter_ms / 1000,
+        failure_rate=args.api_failure_rate,
+    ))
+    parser_app = stub_parser.create_app(
+        stub_parser.StubParserConfig(
+            minutes=tuple(int(m) for m in args.minutes.split(",")),
+            parse_delay_s=args.parse_delay_s,
+        ),
+        Faults(latency_s=args.parser_latency_ms / 1000, failure_rate=args.parser_failure_rate),
+    )
+    asyncio.run(serve(
+        uvicorn.Config(api_app, host=args.host, port=args.api_port, log_level="warning"),
+        uvicorn.Config(parser_app, host=args.host, port=args.parser_port, log_level="warning"),
+    ))
+
+
+if __name__ == "__main__":
+    main()
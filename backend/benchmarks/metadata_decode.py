@@ -0,0 +1,64 @@
+"""
+Decode + encode timings for Deadlock API match metadata payloads.
+
+Compares the previous path (json.loads -> MatchMetadata(**...) ->
+json.dumps(model_dump())) with orjson decoding, model_validate_json on raw
+bytes, the lean projection, and model_dump_json / orjson encoding.
+
+Usage (from backend/):
+    python -m benchmarks.metadata_decode [payload.json ...]
+
+Defaults to the recorded metadata payloads in frontend/public/.
+"""
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+import orjson
+from app.domain.deadlock_api import LeanMatchMetadata, MatchMetadata
+
+DEFAULT_PAYLOADS = sorted((Path(__file__).resolve().parents[2] / "frontend" / "public").glob("match_metadata*.json"))
+ROUNDS = 20
+
+
+def time_ms(func: Callable[[], object], rounds: int = ROUNDS) -> float:
+    """Median wall time of `func` in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_payload(raw: bytes) -> dict[str, float]:
+    full = MatchMetadata.model_validate_json(raw)
+    lean = LeanMatchMetadata.model_validate_json(raw)
+    return {
+        "decode json.loads + MatchMetadata(**)": time_ms(lambda: MatchMetadata(**json.loads(raw))),
+        "decode MatchMetadata.model_validate_json": time_ms(lambda: MatchMetadata.model_validate_json(raw)),
+        "decode orjson + MatchMetadata.model_validate": time_ms(lambda: MatchMetadata.model_validate(orjson.loads(raw))),
+        "decode LeanMatchMetadata.model_validate_json": time_ms(lambda: LeanMatchMetadata.model_validate_json(raw)),
+        "decode orjson + LeanMatchMetadata.model_validate": time_ms(lambda: LeanMatchMetadata.model_validate(orjson.loads(raw))),
+        "encode json.dumps(full.model_dump())": time_ms(lambda: json.dumps(full.model_dump())),
+        "encode orjson.dumps(full.model_dump())": time_ms(lambda: orjson.dumps(full.model_dump())),
+        "encode full.model_dump_json()": time_ms(lambda: full.model_dump_json()),
+        "encode lean.model_dump_json()": time_ms(lambda: lean.model_dump_json()),
+        "encoded size full (KB)": len(full.model_dump_json()) / 1024,
+        "encoded size lean (KB)": len(lean.model_dump_json()) / 1024,
+    }
+
+
+def main(paths: list[Path]) -> None:
+    for path in paths:
+        raw = path.read_bytes()
+        print(f"{path.name} ({len(raw) / 1024:.0f} KB raw)")
+        for name, value in bench_payload(raw).items():
+            unit = "" if "size" in name else " ms"
+            print(f"  {name:<50} {value:9.2f}{unit}")
+
+
+if __name__ == "__main__":
+    main([Path(p) for p in sys.argv[1:]] or DEFAULT_PAYLOADS)
@@ -0,0 +1,144 @@
+"""
+Synthetic parser payloads shaped like the Rust parser's /parse response.
+
+Defaults follow real matches: 12 players and a handful of NPCs/bosses with a
+position every second, damage in roughly a third of player-seconds, and a
+boss health entry per second. benchmarks.stub_parser serves them over HTTP.
+"""
+import random
+from typing import Any
+
+MATCH_MINUTES = (20, 35, 50)
+PLAYERS = 12
+# TransformService treats custom ids below 20 as players
+MAX_PLAYERS = 19
+# NPC custom ids start at 20 (see TransformService); these are the boss types
+NPC_CUSTOM_IDS = (21, 25, 26, 27, 28)
+BOSSES = 14
+MINIMAP_EXTENT = 10752.0
+
+
+def _damage_record(rng: random.Random, victim_health_max: int) -> dict[str, Any]:
+    damage = rng.randint(10, 250)
+    return {
+        "damage": damage,
+        "pre_damage": damage + rng.randint(0, 40),
+        "type": rng.randint(0, 4),
+        "citadel_type": rng.randint(0, 8),
+        "entindex_inflictor": rng.randint(1, 64),
+        "entindex_ability": rng.randint(64, 4096),
+        "damage_absorbed": rng.randint(0, 20),
+        "victim_health_max": victim_health_max,
+        "victim_health_new": rng.randint(0, victim_health_max),
+        "flags": rng.getrandbits(16),
+        "ability_id": rng.getrandbits(31),
+        "attacker_class": rng.randint(0, 40),
+        "victim_class": rng.randint(0, 40),
+        "victim_shield_max": 0,
+        "victim_shield_new": 0,
+        "hits": rng.randint(1, 3),
+        "health_lost": damage,
+    }
+
+
+def synthetic_parser_payload(
+    match_minutes: int,
+    seed: int = 0,
+    players: int = PLAYERS,
+    damage_rate: float = 0.35,
+    bosses: int = BOSSES,
+) -> dict[str, Any]:
+    """
+    A /parse response for a `match_minutes` match, deterministic for a given seed.
+
+    Args:
+        players: Player count, 1 to MAX_PLAYERS
+        damage_rate: Chance that a player deals damage in a given second;
+            each damaging second hits 1-2 victims with 1-2 records each
+        bosses: Boss/objective entities with a snapshot and health timeline
+    """
+    if not 1 <= players <= MAX_PLAYERS:
+        raise ValueError(f"players must be between 1 and {MAX_PLAYERS}")
+    rng = random.Random(seed * 1000 + match_minutes)
+    total_match_time_s = match_minutes * 60
+    player_ids = [str(i + 1) for i in range(players)]
+
+    players = [
+        {
+            "entity_id": str(100 + i),
+            "custom_id": custom_id,
+            "name": f"player-{custom_id}",
+            "steam_id_32": 100_000_000 + seed * 100 + i,
+            "hero_id": rng.randint(1, 60),
+            "lobby_player_slot": i,
+            "team": i % 2,
+            "lane": (i // 2) % 4 + 1,
+            "zipline_lane_color": rng.randint(0, 3),
+        }
+        for i, custom_id in enumerate(player_ids)
+    ]
+
+    coords = {custom_id: [0.0, 0.0] for custom_id in player_ids}
+    positions = []
+    damage = []
+    for _ in range(total_match_time_s):
+        window = []
+        for custom_id in player_ids:
+            xy = coords[custom_id]
+            xy[0] = min(MINIMAP_EXTENT, max(-MINIMAP_EXTENT, xy[0] + rng.uniform(-400, 400)))
+            xy[1] = min(MINIMAP_EXTENT, max(-MINIMAP_EXTENT, xy[1] + rng.uniform(-400, 400)))
+            window.append({"custom_id": custom_id, "x": xy[0], "y": xy[1], "z": rng.uniform(0, 512), "is_npc": False})
+        for npc_id in NPC_CUSTOM_IDS:
+            window.append({"custom_id": str(npc_id), "x": 0.0, "y": 0.0, "z": 0.0, "is_npc": True})
+        positions.append(window)
+
+        second = {}
+        for attacker in player_ids:
+            if rng.random() >= damage_rate:
+                continue
+            victims = rng.sample(player_ids, min(len(player_ids), rng.randint(1, 2)))
+            second[attacker] = {
+                victim: [_damage_record(rng, 2500) for _ in range(rng.randint(1, 2))]
+                for victim in victims
+            }
+        damage.append(second)
+
+    snapshots = []
+    for entity_index in range(bosses):
+        death_time_s = rng.randint(total_match_time_s // 3, total_match_time_s) if entity_index % 3 else None
+        snapshots.append({
+            "entity_index": 500 + entity_index,
+            "custom_id": NPC_CUSTOM_IDS[entity_index % len(NPC_CUSTOM_IDS)],
+            "boss_name_hash": rng.getrandbits(31),
+            "team": entity_index % 2,
+            "lane": entity_index % 4 + 1,
+            "x": rng.uniform(-MINIMAP_EXTENT, MINIMAP_EXTENT),
+            "y": rng.uniform(-MINIMAP_EXTENT, MINIMAP_EXTENT),
+            "z": 0.0,
+            "spawn_time_s": 0,
+            "max_health": 20000,
+            "life_state_on_create": 0,
+            "death_time_s": death_time_s,
+            "life_state_on_delete": 2 if death_time_s is not None else None,
+        })
+
+    health = {str(s["entity_index"]): s["max_health"] for s in snapshots}
+    health_timeline = []
+    for t in range(total_match_time_s):
+        for snapshot in snapshots:
+            key = str(snapshot["entity_index"])
+            death_time_s = snapshot["death_time_s"]
+            if death_time_s is not None and t >= death_time_s:
+                health[key] = 0
+            elif death_time_s is not None and t >= death_time_s - 60:
+                health[key] = max(0, health[key] - rng.randint(0, 600))
+        health_timeline.append(dict(health))
+
+    return {
+        "total_match_time_s": total_match_time_s,
+        "match_start_time_s": 0,
+        "players": players,
+        "damage": damage,
+        "positions": positions,
+        "bosses": {"snapshots": snapshots, "health_timeline": health_timeline},
+    }
@@ -0,0 +1,116 @@
+"""
+Stand-in for the Rust parser service that serves synthetic payloads, so the
+backend can be load-tested without demos, the parser or the network.
+
+Every match id has a local demo, so AnalyzeMatchUseCase only asks the
+Deadlock API for a demo URL when a check fails; /parse accepts both local
+paths and those URLs. Match length cycles through --minutes by match id and
+the payload is seeded with the match id, so repeated parses of a match
+return the same data. GET /stats counts checks and parses per match.
+
+Usage (from backend/):
+    python -m benchmarks.stub_parser --port 9000 --minutes 20,35,50 --parse-delay-s 2
+    PARSER_BASE_URL=http://localhost:9000 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import base64
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+import orjson
+import uvicorn
+from fastapi import FastAPI, HTTPException, Response
+from pydantic import BaseModel
+from benchmarks.loadtest.faults import Faults, add_fault_injection
+from benchmarks.payloads import BOSSES, MATCH_MINUTES, PLAYERS, synthetic_parser_payload
+
+# Local replay paths ({match_id}_*.dem) and Deadlock API demo URLs (.dem.bz2)
+DEMO_MATCH_ID_PATTERN = re.compile(r"(?:^|/)(\d+)(?:_[^/]*)?\.dem(?:\.bz2)?$")
+
+
+@dataclass(frozen=True)
+class StubParserConfig:
+    minutes: tuple[int, ...] = MATCH_MINUTES
+    players: int = PLAYERS
+    damage_rate: float = 0.35
+    bosses: int = BOSSES
+    # Simulated parse time, so load tests see realistic cold-path latency
+    parse_delay_s: float = 0.0
+
+
+class ParseRequest(BaseModel):
+    demo_url: str
+
+
+def create_app(config: StubParserConfig = StubParserConfig(), faults: Faults = Faults()) -> FastAPI:
+    app = FastAPI()
+    add_fault_injection(app, faults)
+    checks: Counter[int] = Counter()
+    parses: Counter[int] = Counter()
+
+    @lru_cache(maxsize=32)
+    def encoded_payload(match_id: int) -> bytes:
+        minutes = config.minutes[match_id % len(config.minutes)]
+        return orjson.dumps(synthetic_parser_payload(
+            minutes, seed=match_id, players=config.players,
+            damage_rate=config.damage_rate, bosses=config.bosses,
+        ))
+
+    @app.get("/check-demo/{match_id}")
+    async def check_demo(match_id: int):
+        checks[match_id] += 1
+        return {"available": True, "filename": f"{match_id}_stub.dem"}
+
+    @app.post("/parse")
+    async def parse(request: ParseRequest) -> Response:
+        demo_path = base64.urlsafe_b64decode(request.demo_url).decode()
+        match = DEMO_MATCH_ID_PATTERN.search(demo_path)
+        if match is None:
+            raise HTTPException(status_code=400, detail=f"Not a stub demo: {demo_path}")
+
+        match_id = int(match.group(1))
+        parses[match_id] += 1
+        if config.parse_delay_s:
+            await asyncio.sleep(config.parse_delay_s)
+        # Generating a 50 minute payload takes a while; don't block the loop
+        content = await asyncio.to_thread(encoded_payload, match_id)
+        return Response(content=content, media_type="application/json")
+
+    @app.get("/stats")
+    async def stats():
+        return {
+            "checks": sum(checks.values()),
+            "parses": sum(parses.values()),
+            "parses_by_match": {str(match_id): n for match_id, n in parses.items()},
+        }
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--minutes", default=",".join(str(m) for m in MATCH_MINUTES),
+                        help="comma-separated match lengths, cycled by match id")
+    parser.add_argument("--players", type=int, default=PLAYERS)
+    parser.add_argument("--damage-rate", type=float, default=0.35)
+    parser.add_argument("--bosses", type=int, default=BOSSES)
+    parser.add_argument("--parse-delay-s", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = StubParserConfig(
+        minutes=tuple(int(m) for m in args.minutes.split(",")),
+        players=args.players,
+        damage_rate=args.damage_rate,
+        bosses=args.bosses,
+        parse_delay_s=args.parse_delay_s,
+    )
+    uvicorn.run(create_app(config, Faults(failure_rate=args.failure_rate)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
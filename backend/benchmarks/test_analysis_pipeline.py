@@ -0,0 +1,171 @@
+"""
+pytest-benchmark suite for the match analysis pipeline on synthetic 20/35/50
+minute parser payloads (see benchmarks/payloads.py).
+
+Usage (from backend/):
+    # CPU-only stages
+    python -m pytest benchmarks
+
+    # Include repo reads/writes and /match/analysis against a scratch Postgres
+    BENCHMARK_DATABASE_URL=postgresql+psycopg://... python -m pytest benchmarks
+
+    # Record a baseline, then fail later runs whose median regresses by >20%
+    python -m pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-save=baseline
+    python -m pytest benchmarks --benchmark-storage=benchmarks/baselines \
+        --benchmark-compare --benchmark-compare-fail=median:20%
+
+Baselines are only comparable on the machine (and Python) that recorded
+them; pytest-benchmark files them per machine under benchmarks/baselines/.
+"""
+import gzip
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+import pytest
+from fastapi.testclient import TestClient
+from app.api.match import get_deadlock_service
+from app.application.use_cases.analyze_match import AnalyzeMatchUseCase
+from app.config import get_settings
+from app.domain.deadlock_api import LeanMatchMetadata
+from app.domain.match_analysis import MATCH_SCHEMA_VERSION, TransformedMatchData
+from app.infra.blob_store.blob_store import LocalFileBlobStore
+from app.infra.cache.tiered_cache import TieredCache, get_analysis_cache
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
+from app.services.boss_timeline_service import BossTimelineService
+from app.services.damage_aggregation_service import DamageAggregationService
+from app.services.match_stats_service import MatchStatsService
+from app.services.position_compaction_service import PositionCompactionService
+from app.services.transform_service import TransformService
+from app.utils.byte_lru_cache import ByteLRUCache
+from app.utils.http_cache import compute_etag
+
+ROUNDS = 5
+METADATA_PAYLOAD = Path(__file__).resolve().parents[2] / "frontend" / "public" / "match_metadata.json"
+
+
+class DiscardingRepo:
+    """Stands in for ParsedMatchesRepo so _transform_and_store measures CPU only."""
+
+    async def create_parsed_match(self, *args, **kwargs) -> None:
+        return None
+
+
+class StubDeadlockAPIService:
+    def __init__(self):
+        self.metadata = LeanMatchMetadata.model_validate_json(METADATA_PAYLOAD.read_bytes())
+
+    async def get_lean_match_metadata_for(self, match_id: int) -> LeanMatchMetadata:
+        return self.metadata
+
+
+@pytest.fixture(scope="module")
+def match_data(parsed_match) -> TransformedMatchData:
+    return TransformService.to_match_data(parsed_match)
+
+
+@pytest.fixture(scope="module")
+def stored_match(db_sessionmaker, run, parsed_match, match_data) -> int:
+    """Writes the match once and returns its match id."""
+    match_id = parsed_match.total_match_time_s
+    run(_store(db_sessionmaker, match_id, parsed_match, match_data))
+    return match_id
+
+
+@pytest.fixture(scope="module")
+def blob_store():
+    with tempfile.TemporaryDirectory() as root:
+        yield LocalFileBlobStore(root)
+
+
+async def _store(db_sessionmaker, match_id, parsed_match, match_data, blob_store=None) -> None:
+    store_kwargs = _derived(match_data)
+    match_data_dump = match_data.model_dump()
+    repo = ParsedMatchesRepo(blob_store or LocalFileBlobStore(tempfile.mkdtemp()))
+    async with db_sessionmaker() as session:
+        await repo.create_parsed_match(
+            match_id,
+            MATCH_SCHEMA_VERSION,
+            gzip.compress(parsed_match.model_dump_json().encode("utf-8")),
+            match_data_dump,
+            compute_etag(match_data_dump, MATCH_SCHEMA_VERSION),
+            session,
+            replace=True,
+            **store_kwargs,
+        )
+
+
+def _derived(match_data: TransformedMatchData) -> dict[str, Any]:
+    # Same derived views as StoreParsedMatchUseCase
+    damage_aggregates = DamageAggregationService.aggregate(match_data)
+    return {
+        "damage_aggregates": damage_aggregates,
+        "position_tracks": PositionCompactionService.compact_all(
+            {custom_id: p.positions for custom_id, p in match_data.per_player_data.items()}
+        ),
+        "match_stats": MatchStatsService.build(match_data, damage_aggregates),
+        "boss_timelines": BossTimelineService.compact(match_data.bosses),
+    }
+
+
+def test_transform_and_store(benchmark, run, parser_payload):
+    use_case = AnalyzeMatchUseCase(parser_service=None, deadlock_api_service=None, repo=DiscardingRepo())
+    benchmark.pedantic(
+        lambda: run(use_case._transform_and_store(1, MATCH_SCHEMA_VERSION, parser_payload, session=None)),
+        rounds=ROUNDS,
+        warmup_rounds=1,
+    )
+
+
+def test_to_match_data(benchmark, parsed_match):
+    benchmark.pedantic(TransformService.to_match_data, args=(parsed_match,), rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_compute_etag(benchmark, match_data):
+    match_data_dump = match_data.model_dump()
+    benchmark.pedantic(compute_etag, args=(match_data_dump, MATCH_SCHEMA_VERSION), rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_repo_write(benchmark, run, db_sessionmaker, blob_store, parsed_match, match_data):
+    match_id = 1_000_000 + parsed_match.total_match_time_s
+    benchmark.pedantic(
+        lambda: run(_store(db_sessionmaker, match_id, parsed_match, match_data, blob_store)),
+        rounds=ROUNDS,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.parametrize("read", ["match_data", "skeleton", "player"])
+def test_repo_read(benchmark, run, db_sessionmaker, stored_match, read):
+    repo = ParsedMatchesRepo()
+
+    async def fetch():
+        async with db_sessionmaker() as session:
+            if read == "match_data":
+                return await repo.get_match_data_with_etag(stored_match, MATCH_SCHEMA_VERSION, session)
+            if read == "skeleton":
+                return await repo.get_match_skeleton(stored_match, MATCH_SCHEMA_VERSION, session)
+            return await repo.get_player_match_data(stored_match, MATCH_SCHEMA_VERSION, "1", session)
+
+    assert run(fetch()) is not None
+    benchmark.pedantic(lambda: run(fetch()), rounds=ROUNDS * 2, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("analysis_cache", ["hit", "miss"])
+def test_match_analysis_endpoint(benchmark, stored_match, analysis_cache):
+    """GET /match/analysis for a stored match, from the response cache or from match_data."""
+    from app.main import app
+
+    settings = get_settings().model_copy(update={"DATABASE_URL": os.environ["BENCHMARK_DATABASE_URL"]})
+    cache_bytes = 512 * 1024 * 1024 if analysis_cache == "hit" else 0
+    cache = TieredCache(ByteLRUCache[str](cache_bytes))
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_deadlock_service] = StubDeadlockAPIService
+    app.dependency_overrides[get_analysis_cache] = lambda: cache
+    try:
+        with TestClient(app) as client:
+            url = f"/match/analysis/{stored_match}"
+            assert client.get(url).status_code == 200
+            benchmark.pedantic(lambda: client.get(url), rounds=ROUNDS * 2, warmup_rounds=1)
+    finally:
+        app.dependency_overrides.clear()
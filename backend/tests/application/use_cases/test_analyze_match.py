@@ -23,13 +23,13 @@ async def test_execute_returns_cached_data_when_available():
             health_timeline=[]
         )
     )
-    mock_repo.get_match_data.return_value = cached_data
+    mock_repo.get_match_data_with_etag.return_value = (cached_data, "stored-etag")
 
     use_case = AnalyzeMatchUseCase(mock_parser, mock_deadlock, mock_repo)
     result, etag = await use_case.execute(12345, schema_version=1, session=MagicMock())
 
     assert result == cached_data
-    assert etag is not None
+    assert etag == "stored-etag"
     # Should not call parser or API
     mock_parser.check_demo_available.assert_not_called()
     mock_deadlock.get_demo_url.assert_not_called()
@@ -42,7 +42,7 @@ async def test_execute_uses_local_demo_when_available():
     mock_deadlock = AsyncMock()
     mock_repo = AsyncMock()
 
-    mock_repo.get_match_data.return_value = None  # Cache miss
+    mock_repo.get_match_data_with_etag.return_value = None  # Cache miss
     mock_parser.check_demo_available.return_value = (True, "12345_67890.dem")
     mock_parser.parse_demo.return_value = {
         "total_match_time_s": 0,
@@ -70,7 +70,7 @@ async def test_execute_falls_back_to_api_when_parser_check_fails():
     mock_deadlock = AsyncMock()
     mock_repo = AsyncMock()
 
-    mock_repo.get_match_data.return_value = None
+    mock_repo.get_match_data_with_etag.return_value = None
     mock_parser.check_demo_available.side_effect = ParserServiceError("timeout")
     mock_deadlock.get_demo_url.return_value = {"demo_url": "http://example.com/demo.bz2"}
     mock_parser.parse_demo.return_value = {
@@ -96,7 +96,7 @@ async def test_execute_falls_back_when_local_parse_fails():
     mock_deadlock = AsyncMock()
     mock_repo = AsyncMock()
 
-    mock_repo.get_match_data.return_value = None
+    mock_repo.get_match_data_with_etag.return_value = None
     mock_parser.check_demo_available.return_value = (True, "12345_67890.dem")
     mock_parser.parse_demo.side_effect = [
         ParserServiceError("parse failed"),  # Local parse fails
@@ -126,7 +126,7 @@ async def test_execute_raises_when_all_sources_fail():
     mock_deadlock = AsyncMock()
     mock_repo = AsyncMock()
 
-    mock_repo.get_match_data.return_value = None
+    mock_repo.get_match_data_with_etag.return_value = None
     mock_parser.check_demo_available.return_value = (False, None)
     mock_deadlock.get_demo_url.return_value = {"demo_url": "http://example.com/demo.bz2"}
     mock_parser.parse_demo.side_effect = ParserServiceError("parse failed")
@@ -135,3 +135,30 @@ async def test_execute_raises_when_all_sources_fail():
 
     with pytest.raises(ParserServiceError):
         await use_case.execute(12345, schema_version=1, session=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_execute_stores_damage_aggregates_with_parsed_match():
+    """Test that damage aggregates are computed at ingest and stored with the match."""
+    mock_parser = AsyncMock()
+    mock_deadlock = AsyncMock()
+    mock_repo = AsyncMock()
+
+    mock_repo.get_match_data_with_etag.return_value = None
+    mock_parser.check_demo_available.return_value = (True, "12345_67890.dem")
+    mock_parser.parse_demo.return_value = {
+        "total_match_time_s": 1,
+        "match_start_time_s": 0,
+        "players": [{"entity_id": "1", "custom_id": "1", "name": "p1", "team": 0, "lane": 1}],
+        "damage": [{"1": {"2": [{"damage": 7}]}}],
+        "positions": [[]],
+        "bosses": {"snapshots": [], "health_timeline": []}
+    }
+
+    use_case = AnalyzeMatchUseCase(mock_parser, mock_deadlock, mock_repo)
+    await use_case.execute(12345, schema_version=1, session=MagicMock())
+
+    aggregates = mock_repo.create_parsed_match.call_args.kwargs["damage_aggregates"]
+    assert [(a.custom_id, a.total_damage) for a in aggregates] == [("1", 7)]
+    match_stats = mock_repo.create_parsed_match.call_args.kwargs["match_stats"]
+    assert [(s.custom_id, s.total_damage, s.damage_by_minute) for s in match_stats] == [("1", 7, [7])]
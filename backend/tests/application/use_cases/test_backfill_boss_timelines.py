@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.application.use_cases.backfill_boss_timelines import BackfillBossTimelinesUseCase
+from app.domain.boss import BossData, BossSnapshot
+from app.domain.match_analysis import TransformedMatchData
+
+
+def make_match_data(snapshots: list[BossSnapshot]) -> TransformedMatchData:
+    return TransformedMatchData(
+        total_match_time_s=60,
+        match_start_time_s=0,
+        players_data=[],
+        per_player_data={},
+        bosses=BossData(snapshots=snapshots, health_timeline=[]),
+    )
+
+
+def make_snapshot(entity_index: int) -> BossSnapshot:
+    return BossSnapshot(
+        entity_index=entity_index,
+        custom_id=21,
+        boss_name_hash=1,
+        team=2,
+        lane=1,
+        x=0.0,
+        y=0.0,
+        z=0.0,
+        spawn_time_s=0,
+        max_health=1000,
+        life_state_on_create=0,
+        death_time_s=30,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_backfills_batch_and_returns_cursor():
+    mock_repo = AsyncMock()
+    mock_repo.get_match_ids_without_boss_timelines.return_value = [10, 11]
+    mock_repo.get_match_data.side_effect = [make_match_data([make_snapshot(3)]), make_match_data([])]
+
+    backfilled, last_match_id = await BackfillBossTimelinesUseCase(mock_repo).execute(1, MagicMock(), 5, 50)
+
+    assert (backfilled, last_match_id) == (1, 11)
+    assert mock_repo.get_match_ids_without_boss_timelines.call_args.args[:3] == (1, 5, 50)
+    mock_repo.create_boss_timelines.assert_awaited_once()
+    timelines = mock_repo.create_boss_timelines.call_args.args[2]
+    assert [(t.entity_index, t.snapshot.death_time_s) for t in timelines] == [(3, 30)]
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_no_cursor_when_done():
+    mock_repo = AsyncMock()
+    mock_repo.get_match_ids_without_boss_timelines.return_value = []
+
+    assert await BackfillBossTimelinesUseCase(mock_repo).execute(1, MagicMock()) == (0, None)
@@ -0,0 +1,42 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.application.use_cases.backfill_match_stats import BackfillMatchStatsUseCase
+from app.domain.boss import BossData
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import PlayerData, PlayerMatchData
+
+
+def make_match_data(players: list[PlayerData]) -> TransformedMatchData:
+    return TransformedMatchData(
+        total_match_time_s=60,
+        match_start_time_s=0,
+        players_data=players,
+        per_player_data={p.custom_id: PlayerMatchData(positions=[], damage=[]) for p in players},
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_indexes_batch_and_returns_cursor():
+    player = PlayerData(entity_id="1", custom_id="1", name="a", hero_id=7, team=0, lane=1)
+    mock_repo = AsyncMock()
+    mock_repo.get_match_ids_without_stats.return_value = [10, 11]
+    mock_repo.get_match_data.side_effect = [make_match_data([player]), make_match_data([])]
+    mock_repo.get_damage_aggregates.return_value = []
+
+    indexed, last_match_id = await BackfillMatchStatsUseCase(mock_repo).execute(1, MagicMock(), 5, 50)
+
+    assert (indexed, last_match_id) == (1, 11)
+    mock_repo.get_match_ids_without_stats.assert_awaited_once()
+    assert mock_repo.get_match_ids_without_stats.call_args.args[:3] == (1, 5, 50)
+    mock_repo.create_match_stats.assert_awaited_once()
+    stats = mock_repo.create_match_stats.call_args.args[2]
+    assert [(s.custom_id, s.hero_id) for s in stats] == [("1", 7)]
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_no_cursor_when_done():
+    mock_repo = AsyncMock()
+    mock_repo.get_match_ids_without_stats.return_value = []
+
+    assert await BackfillMatchStatsUseCase(mock_repo).execute(1, MagicMock()) == (0, None)
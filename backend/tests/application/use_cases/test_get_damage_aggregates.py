@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.application.use_cases.get_damage_aggregates import GetDamageAggregatesUseCase
+from app.domain.boss import BossData
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import PlayerMatchData
+
+
+def make_aggregates(custom_id: str) -> PlayerDamageAggregates:
+    return PlayerDamageAggregates(
+        custom_id=custom_id, total_damage=0, total_absorbed=0, total_health_lost=0,
+        cumulative_damage=[], by_victim={}, by_ability={}, by_citadel_type={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_stored_aggregates():
+    mock_repo = AsyncMock()
+    mock_repo.get_damage_aggregates.return_value = [make_aggregates("1"), make_aggregates("2")]
+
+    result = await GetDamageAggregatesUseCase(mock_repo).execute(1, 1, MagicMock(), custom_id="2")
+
+    assert [a.custom_id for a in result] == ["2"]
+    mock_repo.get_match_data.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_backfills_when_missing():
+    mock_repo = AsyncMock()
+    mock_repo.get_damage_aggregates.return_value = []
+    mock_repo.get_match_data.return_value = TransformedMatchData(
+        total_match_time_s=0,
+        match_start_time_s=0,
+        players_data=[],
+        per_player_data={"1": PlayerMatchData(positions=[], damage=[])},
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+    result = await GetDamageAggregatesUseCase(mock_repo).execute(1, 1, MagicMock())
+
+    assert [a.custom_id for a in result] == ["1"]
+    mock_repo.create_damage_aggregates.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_none_for_unanalyzed_match():
+    mock_repo = AsyncMock()
+    mock_repo.get_damage_aggregates.return_value = []
+    mock_repo.get_match_data.return_value = None
+
+    assert await GetDamageAggregatesUseCase(mock_repo).execute(1, 1, MagicMock()) is None
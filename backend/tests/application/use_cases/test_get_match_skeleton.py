@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.application.use_cases.get_match_skeleton import GetMatchSkeletonUseCase
+from app.domain.boss import BossData
+from app.domain.match_analysis import MatchDataSkeleton, TransformedMatchData
+from app.domain.player import PlayerData, PlayerMatchData
+
+
+@pytest.mark.asyncio
+async def test_execute_serves_stored_projection():
+    skeleton = MatchDataSkeleton(
+        total_match_time_s=1,
+        match_start_time_s=0,
+        players_data=[],
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+    mock_repo = AsyncMock()
+    mock_repo.get_match_skeleton.return_value = (skeleton, "etag")
+    mock_analyze = AsyncMock()
+
+    result = await GetMatchSkeletonUseCase(mock_analyze, mock_repo).execute(1, 1, MagicMock())
+
+    assert result == (skeleton, "etag")
+    mock_analyze.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_analyzes_unstored_match_and_drops_per_player_data():
+    player = PlayerData(entity_id="1", custom_id="1", name="p1", team=0, lane=1)
+    mock_repo = AsyncMock()
+    mock_repo.get_match_skeleton.return_value = None
+    mock_analyze = AsyncMock()
+    mock_analyze.execute.return_value = (
+        TransformedMatchData(
+            total_match_time_s=1,
+            match_start_time_s=0,
+            players_data=[player],
+            per_player_data={"1": PlayerMatchData(positions=[], damage=[])},
+            bosses=BossData(snapshots=[], health_timeline=[]),
+        ),
+        "etag",
+    )
+
+    skeleton, etag = await GetMatchSkeletonUseCase(mock_analyze, mock_repo).execute(1, 1, MagicMock())
+
+    assert etag == "etag"
+    assert skeleton.players_data == [player]
+    assert "per_player_data" not in skeleton.model_dump()
+    mock_analyze.execute.assert_awaited_once()
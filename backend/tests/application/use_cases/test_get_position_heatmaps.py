@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.application.use_cases.get_position_heatmaps import GetPositionHeatmapsUseCase
+from app.utils.ttl_cache import TTLCache
+
+
+def make_repo(etag: str) -> AsyncMock:
+    mock_repo = AsyncMock()
+    mock_repo.get_etag.return_value = etag
+    mock_repo.get_match_data_with_etag.return_value = (MagicMock(), etag)
+    return mock_repo
+
+
+@pytest.mark.asyncio
+async def test_execute_serves_cached_heatmaps_for_same_etag():
+    cache: TTLCache = TTLCache(ttl_s=60)
+    mock_repo = make_repo("v1")
+
+    with patch("app.application.use_cases.get_position_heatmaps.HeatmapService") as service:
+        first = await GetPositionHeatmapsUseCase(mock_repo, cache).execute(1, 1, MagicMock(), grid_size=64)
+        second = await GetPositionHeatmapsUseCase(mock_repo, cache).execute(1, 1, MagicMock(), grid_size=64)
+
+    assert first is second
+    service.build.assert_called_once()
+    mock_repo.get_match_data_with_etag.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_rebuilds_after_match_is_reanalyzed():
+    cache: TTLCache = TTLCache(ttl_s=60)
+
+    with patch("app.application.use_cases.get_position_heatmaps.HeatmapService") as service:
+        await GetPositionHeatmapsUseCase(make_repo("v1"), cache).execute(1, 1, MagicMock(), grid_size=64)
+        await GetPositionHeatmapsUseCase(make_repo("v2"), cache).execute(1, 1, MagicMock(), grid_size=64)
+
+    assert service.build.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_none_for_unknown_match():
+    mock_repo = AsyncMock()
+    mock_repo.get_etag.return_value = None
+
+    result = await GetPositionHeatmapsUseCase(mock_repo, TTLCache(ttl_s=60)).execute(1, 1, MagicMock(), grid_size=64)
+
+    assert result is None
+    mock_repo.get_match_data_with_etag.assert_not_called()
@@ -0,0 +1,49 @@
+import gzip
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from app.application.use_cases.retransform_match import RetransformMatchUseCase
+from app.domain.boss import BossData
+from app.domain.match_analysis import ParsedMatchResponse
+from app.domain.player import PlayerData
+
+
+def make_repo(raw_payload: bytes | None) -> AsyncMock:
+    @asynccontextmanager
+    async def open_raw_gzip(match_id, schema_version, session):
+        yield memoryview(raw_payload) if raw_payload is not None else None
+
+    mock_repo = AsyncMock()
+    mock_repo.open_raw_gzip = open_raw_gzip
+    return mock_repo
+
+
+@pytest.mark.asyncio
+async def test_execute_rebuilds_and_replaces_match_from_raw_payload():
+    parsed_match = ParsedMatchResponse(
+        total_match_time_s=0,
+        match_start_time_s=0,
+        damage=[],
+        players_data=[PlayerData(entity_id="1", custom_id="1", name="p1", team=0, lane=1)],
+        positions=[],
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+    raw_payload = gzip.compress(parsed_match.model_dump_json().encode("utf-8"))
+    mock_repo = make_repo(raw_payload)
+
+    match_data, etag = await RetransformMatchUseCase(mock_repo).execute(1, 1, 2, MagicMock())
+
+    assert list(match_data.per_player_data) == ["1"]
+    call = mock_repo.create_parsed_match.call_args
+    assert call.args[:2] == (1, 2)
+    assert bytes(call.args[2]) == raw_payload
+    assert call.args[4] == etag
+    assert call.kwargs["replace"] is True
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_none_for_unstored_match():
+    mock_repo = make_repo(None)
+
+    assert await RetransformMatchUseCase(mock_repo).execute(1, 1, 2, MagicMock()) is None
+    mock_repo.create_parsed_match.assert_not_called()
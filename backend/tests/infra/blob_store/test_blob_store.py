@@ -0,0 +1,87 @@
+import io
+import pytest
+from app.domain.exceptions import BlobNotFoundError
+from app.infra.blob_store.blob_store import LocalFileBlobStore, S3BlobStore, compute_digest
+
+
+class FakeClientError(Exception):
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class InMemoryS3Client:
+    """Just enough of the boto3 S3 client API, like a local MinIO would serve."""
+
+    def __init__(self):
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.put_count = 0
+
+    def put_object(self, Bucket, Key, Body):
+        self.put_count += 1
+        self.objects[(Bucket, Key)] = Body
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise FakeClientError("404")
+        return {}
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise FakeClientError("NoSuchKey")
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+@pytest.mark.asyncio
+async def test_local_store_round_trips_under_sharded_path(tmp_path):
+    store = LocalFileBlobStore(tmp_path)
+
+    digest = await store.put(b"payload")
+
+    assert digest == compute_digest(b"payload")
+    assert store.path_for(digest) == tmp_path / digest[:2] / digest[2:4] / digest
+    assert await store.get(digest) == b"payload"
+    assert await store.put(b"payload") == digest
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [digest]
+
+
+@pytest.mark.asyncio
+async def test_local_store_open_maps_blob_read_only(tmp_path):
+    store = LocalFileBlobStore(tmp_path)
+    digest = await store.put(b"0123456789")
+
+    async with store.open(digest) as view:
+        assert bytes(view[2:5]) == b"234"
+        assert view.readonly
+
+
+@pytest.mark.asyncio
+async def test_local_store_missing_blob_raises(tmp_path):
+    store = LocalFileBlobStore(tmp_path)
+
+    with pytest.raises(BlobNotFoundError):
+        await store.get("ab" * 32)
+    with pytest.raises(BlobNotFoundError):
+        async with store.open("ab" * 32):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_s3_store_round_trips_and_skips_existing_objects():
+    client = InMemoryS3Client()
+    store = S3BlobStore(client, "bucket", prefix="raw/")
+
+    digest = await store.put(b"payload")
+    await store.put(b"payload")
+
+    assert ("bucket", f"raw/{digest[:2]}/{digest[2:4]}/{digest}") in client.objects
+    assert client.put_count == 1
+    async with store.open(digest) as view:
+        assert bytes(view) == b"payload"
+
+    await store.delete(digest)
+    with pytest.raises(BlobNotFoundError):
+        await store.get(digest)
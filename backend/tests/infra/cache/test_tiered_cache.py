@@ -0,0 +1,88 @@
+import os
+import pytest
+from app.infra.cache.shared_cache import DiskCache, SharedCache
+from app.infra.cache.tiered_cache import TieredCache, analysis_cache_key
+from app.utils.byte_lru_cache import ByteLRUCache
+
+
+class FailingCache(SharedCache):
+    async def _get(self, key):
+        raise ConnectionError("shared tier down")
+
+    async def _set(self, key, value):
+        raise ConnectionError("shared tier down")
+
+    async def purge_other_namespaces(self):
+        return None
+
+
+def test_byte_lru_cache_evicts_least_recently_used_by_size():
+    cache = ByteLRUCache[str](max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.size_bytes == 8
+    assert cache.evictions == 1
+
+
+def test_byte_lru_cache_skips_values_larger_than_the_cache():
+    cache = ByteLRUCache[str](max_bytes=4)
+    cache.set("a", b"12")
+    cache.set("big", b"12345")
+
+    assert cache.get("big") is None
+    assert cache.get("a") == b"12"
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_shared_hits_to_local(tmp_path):
+    shared = DiskCache(tmp_path, "v1", max_bytes=1024)
+    await shared.set("k", b"value")
+    cache = TieredCache(ByteLRUCache[str](1024), shared)
+
+    assert await cache.get("k") == b"value"
+    assert await cache.get("k") == b"value"
+    assert shared.hits == 1
+    assert cache.local.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_treats_shared_errors_as_misses():
+    shared = FailingCache("v1")
+    cache = TieredCache(ByteLRUCache[str](1024), shared)
+
+    await cache.set("k", b"value")
+    cache.local.clear()
+
+    assert await cache.get("k") is None
+    assert shared.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_oldest_files(tmp_path):
+    cache = DiskCache(tmp_path, "v1", max_bytes=10)
+    await cache.set("old", b"12345")
+    os.utime(cache.path_for("old"), (0, 0))
+    await cache.set("new", b"12345")
+    await cache.set("newest", b"12345")
+
+    assert await cache.get("old") is None
+    assert await cache.get("newest") == b"12345"
+    assert cache.evictions >= 1
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_purges_other_namespaces(tmp_path):
+    old = DiskCache(tmp_path, "v1", max_bytes=1024)
+    await old.set(analysis_cache_key(1, "etag"), b"old shape")
+    new = DiskCache(tmp_path, "v2", max_bytes=1024)
+
+    await new.purge_other_namespaces()
+
+    assert not (tmp_path / "v1").exists()
+    assert await new.get(analysis_cache_key(1, "etag")) is None
@@ -0,0 +1,71 @@
+import asyncio
+import time
+import pytest
+from app.infra.deadlock_api.rate_limiter import RequestPriority, TokenBucketRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_burst_does_not_wait():
+    limiter = TokenBucketRateLimiter(rate_per_s=1, burst=5, background_reserve=0)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+    assert limiter.throttled[RequestPriority.INTERACTIVE] == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill_once_bucket_is_empty():
+    limiter = TokenBucketRateLimiter(rate_per_s=50, burst=1, background_reserve=0)
+
+    await limiter.acquire()
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.015
+    assert limiter.throttled[RequestPriority.INTERACTIVE] == 1
+
+
+@pytest.mark.asyncio
+async def test_background_requests_leave_reserve_for_interactive():
+    limiter = TokenBucketRateLimiter(rate_per_s=0.001, burst=10, background_reserve=0.5)
+
+    for _ in range(5):
+        await limiter.acquire(RequestPriority.BACKGROUND)
+
+    # Only the reserve is left; background has to wait but interactive does not
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(RequestPriority.BACKGROUND), timeout=0.05)
+    await asyncio.wait_for(limiter.acquire(RequestPriority.INTERACTIVE), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_interactive_waiters_go_before_background():
+    limiter = TokenBucketRateLimiter(rate_per_s=100, burst=1, background_reserve=0)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def take(priority: RequestPriority, name: str):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    background = asyncio.create_task(take(RequestPriority.BACKGROUND, "background"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(take(RequestPriority.INTERACTIVE, "interactive"))
+    await asyncio.gather(background, interactive)
+
+    assert order == ["interactive", "background"]
+
+
+@pytest.mark.parametrize("burst,background_reserve", [(10, -0.1), (10, 0.95), (10, 1.0), (1, 0.5)])
+def test_reserve_must_leave_a_background_token(burst, background_reserve):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate_per_s=1, burst=burst, background_reserve=background_reserve)
+
+
+def test_reserve_may_leave_exactly_one_background_token():
+    limiter = TokenBucketRateLimiter(rate_per_s=1, burst=10, background_reserve=0.9)
+
+    assert limiter.reserve_tokens + 1 == pytest.approx(limiter.burst)
@@ -0,0 +1,55 @@
+import tracemalloc
+import pytest
+from prometheus_client import REGISTRY
+from app.infra.metrics.memory import MB, profile_memory, track
+from app.infra.metrics.timing import span
+
+
+@pytest.fixture
+def tracing_memory():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def test_profile_is_none_without_tracemalloc():
+    assert not tracemalloc.is_tracing()
+    with profile_memory("test_ingest", "match_id=1") as profile:
+        with track("test_stage"):
+            pass
+
+    assert profile is None
+
+
+def test_stages_record_peak_and_retained_memory(tracing_memory):
+    count_before = REGISTRY.get_sample_value("stage_memory_peak_bytes_count", {"stage": "test_build"}) or 0.0
+
+    with profile_memory("test_ingest", "match_id=1") as profile:
+        with span("test_build"):
+            kept = bytearray(4 * MB)
+            scratch = bytearray(8 * MB)
+            del scratch
+        with span("test_small"):
+            pass
+
+    peak, retained = profile.stages["test_build"]
+    assert 12 * MB <= peak < 13 * MB
+    assert 4 * MB <= retained < 5 * MB
+    assert profile.stages["test_small"][0] < MB
+    # A nested stage resets tracemalloc's peak; the outer stage must still see it
+    assert profile.peak_bytes >= peak
+    assert "test_build=" in profile.summary()
+    assert REGISTRY.get_sample_value("stage_memory_peak_bytes_count", {"stage": "test_build"}) == count_before + 1
+    del kept
+
+
+def test_nested_peak_reaches_parent_after_reset(tracing_memory):
+    with profile_memory("test_ingest", "match_id=2") as profile:
+        with track("test_outer"):
+            scratch = bytearray(8 * MB)
+            del scratch
+            with track("test_inner"):
+                pass
+
+    assert profile.stages["test_outer"][0] >= 8 * MB
+    assert profile.stages["test_inner"][0] < MB
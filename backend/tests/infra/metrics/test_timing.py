@@ -0,0 +1,74 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from app.infra.metrics.timing import ServerTimingMiddleware, span, timed
+
+
+def stage_count(stage: str) -> float:
+    return REGISTRY.get_sample_value("stage_duration_seconds_count", {"stage": stage}) or 0.0
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @timed("test_fetch")
+    async def fetch() -> int:
+        return 1
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        await fetch()
+        await fetch()
+        with span("test_encode"):
+            return {"id": item_id}
+
+    return app
+
+
+def test_spans_are_reported_in_server_timing_header():
+    response = TestClient(make_app()).get("/items/1")
+
+    entries = [entry.strip().split(";")[0] for entry in response.headers["Server-Timing"].split(",")]
+    assert entries == ["test_fetch", "test_encode", "total"]
+
+
+def test_spans_and_requests_are_observed_in_histograms():
+    before = stage_count("test_fetch")
+    requests_before = REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    ) or 0.0
+
+    TestClient(make_app()).get("/items/2")
+
+    assert stage_count("test_fetch") == before + 2
+    assert REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    ) == requests_before + 1
+
+
+def test_span_outside_a_request_only_feeds_the_histogram():
+    before = stage_count("test_offline")
+    with span("test_offline"):
+        pass
+    assert stage_count("test_offline") == before + 1
+
+
+def test_span_records_failed_stages():
+    before = stage_count("test_failing")
+    with pytest.raises(ValueError):
+        with span("test_failing"):
+            raise ValueError("boom")
+    assert stage_count("test_failing") == before + 1
+
+
+def test_metrics_endpoint_exports_app_counters():
+    from app.main import app
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert 'cache_hits_total{cache="user"}' in response.text
+    assert 'deadlock_api_tokens_acquired_total{priority="interactive"}' in response.text
+    assert "stage_duration_seconds_bucket" in response.text
@@ -0,0 +1,89 @@
+from app.domain.boss import BossData, BossEventType, BossSnapshot, CompactBossTimeline
+from app.services.boss_timeline_service import BossTimelineService
+
+
+def make_snapshot(entity_index: int, spawn_time_s: int = 0, death_time_s: int | None = None) -> BossSnapshot:
+    return BossSnapshot(
+        entity_index=entity_index,
+        custom_id=21,
+        boss_name_hash=1,
+        team=2,
+        lane=1,
+        x=0.0,
+        y=0.0,
+        z=0.0,
+        spawn_time_s=spawn_time_s,
+        max_health=1000,
+        life_state_on_create=0,
+        death_time_s=death_time_s,
+    )
+
+
+def test_compact_keeps_only_change_points():
+    bosses = BossData(
+        snapshots=[make_snapshot(7)],
+        health_timeline=[
+            {"7": 1000},
+            {"7": 1000, "9": 500},
+            {"7": 900, "9": 500},
+            {"7": 900, "9": 500},
+            {"7": 1000, "9": 0},
+        ],
+    )
+
+    timelines = {t.entity_index: t for t in BossTimelineService.compact(bosses)}
+
+    assert timelines[7].t == [0, 2, 4]
+    assert timelines[7].health == [1000, 900, 1000]
+    assert timelines[7].snapshot.entity_index == 7
+    assert timelines[9].t == [1, 4]
+    assert timelines[9].health == [500, 0]
+    assert timelines[9].snapshot is None
+
+
+def test_compact_keeps_bosses_without_health_samples():
+    bosses = BossData(
+        snapshots=[make_snapshot(7), make_snapshot(11, spawn_time_s=30, death_time_s=90)],
+        health_timeline=[{"7": 1000}, {"7": 900}],
+    )
+
+    timelines = BossTimelineService.compact(bosses)
+
+    assert [t.entity_index for t in timelines] == [7, 11]
+    assert timelines[1].t == [] and timelines[1].health == []
+    events = BossTimelineService.events(timelines)
+    assert [(e.type, e.time_s) for e in events if e.entity_index == 11] == [
+        (BossEventType.SPAWN, 30),
+        (BossEventType.DEATH, 90),
+    ]
+
+
+def test_events_merge_close_drops_into_bursts():
+    timeline = CompactBossTimeline(
+        entity_index=7,
+        snapshot=make_snapshot(7, spawn_time_s=0, death_time_s=40),
+        t=[0, 10, 12, 30, 31, 35, 40],
+        health=[1000, 900, 700, 800, 600, 500, 0],
+    )
+
+    events = BossTimelineService.events([timeline])
+
+    assert [(e.type, e.time_s, e.end_s, e.damage, e.health) for e in events] == [
+        (BossEventType.SPAWN, 0, 0, None, 1000),
+        (BossEventType.DAMAGE, 10, 12, 300, 700),
+        (BossEventType.DAMAGE, 31, 40, 800, 0),
+        (BossEventType.DEATH, 40, 40, None, 0),
+    ]
+
+
+def test_events_filters_by_overlap_with_range():
+    timeline = CompactBossTimeline(
+        entity_index=7,
+        snapshot=make_snapshot(7),
+        t=[0, 10, 12, 50],
+        health=[1000, 900, 700, 600],
+    )
+
+    events = BossTimelineService.events([timeline], start_s=11, end_s=50)
+
+    assert [(e.type, e.time_s) for e in events] == [(BossEventType.DAMAGE, 10)]
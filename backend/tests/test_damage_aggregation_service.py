@@ -0,0 +1,46 @@
+from app.domain.boss import BossData
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import DamageRecord, PlayerMatchData
+from app.services.damage_aggregation_service import DamageAggregationService
+
+
+def test_aggregate_player_totals_and_breakdowns():
+    damage = [
+        {"2": [DamageRecord(damage=10, ability_id=100, citadel_type=1, damage_absorbed=2, health_lost=8)]},
+        {},
+        None,
+        {
+            "2": [DamageRecord(damage=5, ability_id=100, citadel_type=1, health_lost=5)],
+            "21": [DamageRecord(damage=20, citadel_type=2)],
+        },
+    ]
+
+    aggregates = DamageAggregationService.aggregate_player("1", damage)
+
+    assert aggregates.custom_id == "1"
+    assert aggregates.total_damage == 35
+    assert aggregates.total_absorbed == 2
+    assert aggregates.total_health_lost == 13
+    assert aggregates.cumulative_damage == [10, 10, 10, 35]
+    assert aggregates.by_victim == {"2": 15, "21": 20}
+    assert aggregates.by_ability == {"100": 15, "0": 20}
+    assert aggregates.by_citadel_type == {"1": 15, "2": 20}
+
+
+def test_aggregate_covers_every_player():
+    match_data = TransformedMatchData(
+        total_match_time_s=2,
+        match_start_time_s=0,
+        players_data=[],
+        per_player_data={
+            "1": PlayerMatchData(positions=[], damage=[{}, {}]),
+            "2": PlayerMatchData(positions=[], damage=[{"1": [DamageRecord(damage=3)]}, {}]),
+        },
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+    aggregates = {a.custom_id: a for a in DamageAggregationService.aggregate(match_data)}
+
+    assert aggregates["1"].total_damage == 0
+    assert aggregates["1"].cumulative_damage == [0, 0]
+    assert aggregates["2"].cumulative_damage == [3, 3]
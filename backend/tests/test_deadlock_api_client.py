@@ -1,13 +1,20 @@
+import asyncio
+import httpx
 import pytest
 import pytest_asyncio
+from unittest.mock import patch
 from app.domain.deadlock_api import MatchMetadata, MatchInfoFields
-from app.infra.deadlock_api.deadlock_api_client import DeadlockAPIClient
+from app.domain.exceptions import DeadlockAPIError
+from app.infra.deadlock_api.deadlock_api_client import DeadlockAPIClient, RetryPolicy
+from app.infra.deadlock_api.rate_limiter import TokenBucketRateLimiter
 from app.domain.player import PlayerInfo
 from app.domain.deadlock_api import MatchPaths
 
 @pytest_asyncio.fixture
 async def client():
     c = DeadlockAPIClient()
+    c.retry_policy = RetryPolicy(max_retries=2, base_delay_s=0, max_delay_s=0)
+    c.rate_limiter = TokenBucketRateLimiter(rate_per_s=1000, burst=1000)
     yield c
     await c.client.aclose()
 
@@ -24,7 +31,7 @@ async def test_call_api_success(httpx_mock, client):
 @pytest.mark.parametrize("status_code", [400, 404, 429, 500])
 async def test_call_api_failed(httpx_mock, client, status_code):
     url = client.api_url("/v1/players/bad-request/match-history")
-    httpx_mock.add_response(url=url, status_code=status_code)
+    httpx_mock.add_response(url=url, status_code=status_code, is_reusable=True)
     with pytest.raises(Exception) as excinfo:
         await client.call_api(url)
     msg = str(excinfo.value)
@@ -93,3 +100,106 @@ async def test_fetch_salts_success(httpx_mock, client):
     httpx_mock.add_response(url=url, status_code=200, json=expected)
     result = await client.fetch_salts(789)
     assert result == expected
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code,expected_attempts", [(400, 1), (404, 1), (429, 3), (503, 3)])
+async def test_call_api_only_retries_retryable_statuses(httpx_mock, client, status_code, expected_attempts):
+    url = client.api_url("/v1/matches/1/salts")
+    httpx_mock.add_response(url=url, status_code=status_code, is_reusable=True)
+    with pytest.raises(DeadlockAPIError):
+        await client.call_api(url)
+    assert len(httpx_mock.get_requests()) == expected_attempts
+    assert client.retry_count == expected_attempts - 1
+
+@pytest.mark.asyncio
+async def test_call_api_retries_then_succeeds(httpx_mock, client):
+    url = client.api_url("/v1/matches/1/salts")
+    httpx_mock.add_response(url=url, status_code=502)
+    httpx_mock.add_response(url=url, status_code=200, json={"demo_url": "x"})
+    response = await client.call_api(url)
+    assert response.status_code == 200
+    assert client.retry_count == 1
+
+@pytest.mark.asyncio
+async def test_call_api_wraps_transport_errors(httpx_mock, client):
+    url = client.api_url("/v1/matches/1/salts")
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"), url=url, is_reusable=True)
+    with pytest.raises(DeadlockAPIError, match="ConnectError"):
+        await client.call_api(url)
+    assert client.retry_count == 2
+
+@pytest.mark.parametrize("retry_after,expected", [("3", 3.0), ("120", 10.0), ("0", 0.0)])
+def test_backoff_delay_honors_retry_after(retry_after, expected):
+    policy = RetryPolicy(max_retries=3, base_delay_s=0.5, max_delay_s=10.0)
+    assert policy.backoff_delay(0, retry_after) == expected
+
+def test_backoff_delay_is_jittered_and_bounded():
+    policy = RetryPolicy(max_retries=5, base_delay_s=0.5, max_delay_s=4.0)
+    for attempt in range(6):
+        delay = policy.backoff_delay(attempt)
+        assert 0 <= delay <= min(4.0, 0.5 * 2 ** attempt)
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_faster_response(client):
+    client.hedge_default_delay_s = 0.01
+    calls = 0
+
+    async def mock_get(url, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"attempt": calls}, request=httpx.Request("GET", url))
+
+    with patch.object(client.client, "get", side_effect=mock_get):
+        response = await client.call_api(client.api_url("/v1/matches/1/metadata"), hedge=True)
+
+    assert response.json() == {"attempt": 2}
+    assert client.hedge_count == 1
+    assert client.hedge_win_count == 1
+
+@pytest.mark.asyncio
+async def test_hedged_request_records_cancelled_primary_latency(client):
+    client.hedge_default_delay_s = 0.05
+    calls = 0
+
+    async def mock_get(url, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={}, request=httpx.Request("GET", url))
+
+    with patch.object(client.client, "get", side_effect=mock_get):
+        await client.call_api(client.api_url("/v1/matches/1/metadata"), hedge=True)
+
+    # Both the winning hedge and the primary it beat are sampled
+    assert len(client.hedge_latency.samples) == 2
+    assert max(client.hedge_latency.samples) >= 0.05
+
+@pytest.mark.asyncio
+async def test_hedge_not_sent_for_fast_response(httpx_mock, client):
+    client.hedge_default_delay_s = 1
+    url = client.api_url("/v1/matches/1/metadata")
+    httpx_mock.add_response(url=url, status_code=200, json={})
+    await client.call_api(url, hedge=True)
+    assert client.hedge_count == 0
+
+@pytest.mark.asyncio
+async def test_fetch_lean_match_metadata_drops_unused_fields(httpx_mock, client):
+    url = client.api_url("/v1/matches/456/metadata")
+    match_info = {
+        "duration_s": 1800, "match_outcome": 0, "winning_team": 1,
+        "players": [{"team": 0, "hero_id": 1, "account_id": 1}],
+        "start_time": 1620000000, "match_id": 456, "game_mode": 1, "match_mode": 1,
+        "objectives": [{"team_objective_id": 1}], "mid_boss": [],
+        "damage_matrix": {"sample_time_s": list(range(100))},
+        "match_paths": {"x_resolution": 16383, "y_resolution": 16383},
+    }
+    httpx_mock.add_response(url=url, status_code=200, json={"match_info": match_info})
+    result = await client.fetch_lean_match_metadata(456)
+    dumped = result.model_dump()["match_info"]
+    assert dumped["match_id"] == 456
+    assert dumped["players"] == [{"team": 0, "hero_id": 1}]
+    assert "damage_matrix" not in dumped
+    assert "match_paths" not in dumped
@@ -0,0 +1,55 @@
+from app.domain.boss import BossData
+from app.domain.heatmap import MINIMAP_MAX, MINIMAP_MIN, HeatmapGroupBy
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import PlayerData, PlayerMatchData, PlayerPosition
+from app.services.heatmap_service import HeatmapService
+
+
+def make_match_data() -> TransformedMatchData:
+    def track(custom_id: str, points: list[tuple[float, float]]) -> PlayerMatchData:
+        return PlayerMatchData(
+            positions=[PlayerPosition(custom_id=custom_id, x=x, y=y, z=0, is_npc=False) for x, y in points],
+            damage=[],
+        )
+
+    return TransformedMatchData(
+        total_match_time_s=3,
+        match_start_time_s=0,
+        players_data=[
+            PlayerData(entity_id="1", custom_id="1", name="a", team=0, lane=1),
+            PlayerData(entity_id="2", custom_id="2", name="b", team=1, lane=1),
+        ],
+        per_player_data={
+            # bottom-left corner for 3 seconds
+            "1": track("1", [(MINIMAP_MIN + 1, MINIMAP_MIN + 1)] * 3),
+            # top-right corner, then bottom-left
+            "2": track("2", [(MINIMAP_MAX - 1, MINIMAP_MAX - 1)] * 2 + [(MINIMAP_MIN + 1, MINIMAP_MIN + 1)]),
+        },
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+
+def test_build_bins_all_players_into_one_grid():
+    result = HeatmapService.build(make_match_data(), grid_size=2)
+
+    assert result.heatmaps == {"all": [[4, 0], [0, 2]]}
+    assert (result.start_s, result.end_s) == (0, 3)
+
+
+def test_build_groups_by_team_and_player():
+    by_team = HeatmapService.build(make_match_data(), grid_size=2, group_by=HeatmapGroupBy.TEAM)
+    by_player = HeatmapService.build(make_match_data(), grid_size=2, group_by=HeatmapGroupBy.PLAYER)
+
+    assert by_team.heatmaps == {"0": [[3, 0], [0, 0]], "1": [[1, 0], [0, 2]]}
+    assert by_player.heatmaps.keys() == {"1", "2"}
+
+
+def test_build_filters_by_time_window_team_and_player():
+    window = HeatmapService.build(make_match_data(), grid_size=2, start_s=2, end_s=10)
+    team = HeatmapService.build(make_match_data(), grid_size=2, team=1)
+    player = HeatmapService.build(make_match_data(), grid_size=2, custom_ids=["1"])
+
+    assert window.heatmaps == {"all": [[2, 0], [0, 0]]}
+    assert window.end_s == 3
+    assert team.heatmaps == {"all": [[1, 0], [0, 2]]}
+    assert player.heatmaps == {"all": [[3, 0], [0, 0]]}
@@ -0,0 +1,58 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+# Generous, so slow CI machines pass; regressions from import-time clients or
+# eagerly imported heavy dependencies show up in the other assertions first
+IMPORT_TIME_BUDGET_S = float(os.getenv("IMPORT_TIME_BUDGET_S", "3.0"))
+# Only needed by the requests that use them
+LAZY_MODULES = ("openid.consumer.consumer",)
+
+IMPORT_AND_REPORT = """
+import json
+import app.main
+from app.infra.deadlock_api.deadlock_api_client import get_deadlock_api_client
+from app.infra.parser.parser_client import get_parser_client
+from app.services.steam_account_service import get_steam_account_service
+from app.utils import steam_id_utils
+
+print(json.dumps({
+    "clients_created": [
+        factory.__name__
+        for factory in (get_deadlock_api_client, get_parser_client, get_steam_account_service, steam_id_utils._fernet)
+        if factory.cache_info().currsize
+    ],
+}))
+"""
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+
+def import_app() -> tuple[dict, dict[str, tuple[int, int]]]:
+    """Import app.main in a fresh interpreter; returns its report and module -> (self_us, cumulative_us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_AND_REPORT],
+        cwd=BACKEND_ROOT, capture_output=True, text=True, check=True,
+    )
+    modules = {
+        m.group(3): (int(m.group(1)), int(m.group(2)))
+        for m in map(IMPORTTIME_LINE.match, result.stderr.splitlines()) if m
+    }
+    return json.loads(result.stdout.strip().splitlines()[-1]), modules
+
+
+def test_app_import_is_lazy_and_within_budget():
+    report, modules = import_app()
+
+    assert report["clients_created"] == []
+    assert [m for m in LAZY_MODULES if m in modules] == []
+
+    import_s = modules["app.main"][1] / 1e6
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:10]
+    assert import_s < IMPORT_TIME_BUDGET_S, (
+        f"import app.main took {import_s:.2f}s; slowest modules (self us): "
+        + ", ".join(f"{name}={self_us}" for name, (self_us, _) in slowest)
+    )
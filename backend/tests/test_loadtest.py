@@ -0,0 +1,74 @@
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI, Request, Response
+from app.domain.deadlock_api import MatchMetadata
+from benchmarks.loadtest import mock_deadlock_api
+from benchmarks.loadtest.driver import LoadDriver, LoadResult
+from benchmarks.loadtest.faults import Faults, add_fault_injection
+
+
+def fake_backend() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/match/analysis/{match_id}")
+    async def analysis(match_id: int, request: Request):
+        etag = f'"{match_id}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=b"{}", media_type="application/json", headers={"ETag": etag})
+
+    return app
+
+
+def asgi_client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_load_result_summary():
+    result = LoadResult("hit", elapsed_s=2.0, latencies_s=[i / 1000 for i in range(1, 101)], errors=5)
+
+    summary = result.summary()
+
+    assert summary["requests"] == 100
+    assert summary["throughput_rps"] == 50.0
+    assert summary["p50_ms"] == 51.0
+    assert summary["p99_ms"] == 100.0
+    assert summary["error_rate"] == 0.05
+
+
+@pytest.mark.asyncio
+async def test_driver_scenarios_against_fake_backend():
+    async with asgi_client(fake_backend()) as client:
+        driver = LoadDriver(client, match_ids=[1, 2])
+        await driver.warm()
+
+        hit = await driver.hit(concurrency=4, duration_s=0.05)
+        revalidate = await driver.revalidate(concurrency=4, duration_s=0.05)
+        herd = await driver.herd(concurrency=8, rounds=2, first_match_id=100)
+
+    assert driver.etags == {1: '"1"', 2: '"2"'}
+    assert hit.requests > 0 and set(hit.statuses) == {"200"} and hit.errors == 0
+    assert revalidate.requests > 0 and set(revalidate.statuses) == {"304"} and revalidate.errors == 0
+    assert herd.requests == 16 and herd.notes["new_matches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_injected_failures_count_as_errors():
+    app = fake_backend()
+    add_fault_injection(app, Faults(failure_rate=1.0))
+    async with asgi_client(app) as client:
+        result = await LoadDriver(client, match_ids=[1]).hit(concurrency=2, duration_s=0.02)
+
+    assert result.statuses.keys() == {"503"}
+    assert result.errors == result.requests > 0
+
+
+@pytest.mark.asyncio
+async def test_mock_deadlock_api_serves_requested_match():
+    async with asgi_client(mock_deadlock_api.create_app()) as client:
+        metadata = await client.get("/v1/matches/42/metadata")
+        salts = await client.get("/v1/matches/42/salts")
+
+    assert MatchMetadata.model_validate(orjson.loads(metadata.content)).match_info.match_id == 42
+    assert salts.json()["demo_url"].endswith("/42_1.dem.bz2")
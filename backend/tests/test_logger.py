@@ -0,0 +1,56 @@
+import logging
+import queue
+import orjson
+from app.utils.logger import JsonFormatter, NonBlockingQueueHandler, SamplingFilter
+
+
+def make_record(name: str = "app.api.match", level: int = logging.INFO, msg: str = "served %s", args=(1,), **extra):
+    record = logging.makeLogRecord({"name": name, "levelno": level, "levelname": logging.getLevelName(level),
+                                    "msg": msg, "args": args})
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_message_and_extra_fields():
+    line = JsonFormatter().format(make_record(match_id=42))
+
+    entry = orjson.loads(line)
+    assert entry["message"] == "served 1"
+    assert entry["logger"] == "app.api.match"
+    assert entry["level"] == "INFO"
+    assert entry["match_id"] == 42
+    assert "args" not in entry
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        import sys
+        record = make_record(level=logging.ERROR, exc_info=sys.exc_info())
+
+    assert "ValueError: boom" in orjson.loads(JsonFormatter().format(record))["exc_info"]
+
+
+def test_sampling_uses_longest_prefix_and_keeps_warnings():
+    sampling = SamplingFilter({"app": 1.0, "app.api.match": 0.0})
+
+    assert sampling.filter(make_record("app.api.session"))
+    assert not sampling.filter(make_record("app.api.match"))
+    assert not sampling.filter(make_record("app.api.match.sub", level=logging.DEBUG))
+    assert sampling.filter(make_record("app.api.matchmaking"))
+    assert sampling.filter(make_record("app.api.match", level=logging.WARNING))
+    assert sampling.sampled_out == 2
+
+
+def test_queue_handler_defers_formatting_and_drops_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    args = {"size": 1}
+    first = make_record(msg="%(size)s", args=(args,))
+
+    handler.handle(first)
+    handler.handle(make_record())
+
+    queued = handler.queue.get_nowait()
+    assert queued is first and queued.args == (args,)
+    assert handler.dropped == 1
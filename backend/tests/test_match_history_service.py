@@ -0,0 +1,72 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from app.domain.exceptions import DeadlockAPIError
+from app.services.match_history_service import MatchHistoryService
+from app.utils.datetime_utils import utcnow
+
+
+def make_summary(match_id: int, start_time: int) -> dict:
+    return {
+        "account_id": 1, "match_id": match_id, "hero_id": 1, "hero_level": 1,
+        "start_time": start_time, "game_mode": 1, "match_mode": 1, "player_team": 0,
+        "player_kills": 0, "player_deaths": 0, "player_assists": 0, "denies": 0,
+        "net_worth": 0, "last_hits": 0, "match_duration_s": 1800, "match_result": 1,
+        "objectives_mask_team0": 0, "objectives_mask_team1": 0,
+    }
+
+
+def make_service(api, repo) -> MatchHistoryService:
+    return MatchHistoryService(api, repo, refresh_interval=timedelta(minutes=5))
+
+
+@pytest.mark.asyncio
+async def test_serves_from_store_when_recently_refreshed():
+    api = AsyncMock()
+    repo = AsyncMock()
+    repo.get_refreshed_at.return_value = utcnow()
+    repo.get_match_history.return_value = []
+
+    await make_service(api, repo).get_match_history(1, 100, 0, MagicMock())
+
+    api.get_account_match_history_for.assert_not_called()
+    repo.get_match_history.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_requests_matches_newer_than_latest_stored():
+    api = AsyncMock()
+    repo = AsyncMock()
+    repo.get_refreshed_at.return_value = utcnow() - timedelta(hours=1)
+    repo.get_latest_start_time.return_value = 1000
+    api.get_account_match_history_for.return_value = [make_summary(1, 900), make_summary(2, 1100)]
+
+    await make_service(api, repo).get_match_history(1, 100, 0, MagicMock())
+
+    api.get_account_match_history_for.assert_awaited_once_with("1", min_start_time=1000)
+    stored = repo.store_matches.call_args.args[1]
+    assert [m.match_id for m in stored] == [2]
+
+
+@pytest.mark.asyncio
+async def test_serves_stale_copy_when_refresh_fails():
+    api = AsyncMock()
+    repo = AsyncMock()
+    repo.get_refreshed_at.return_value = utcnow() - timedelta(hours=1)
+    repo.get_latest_start_time.return_value = 1000
+    api.get_account_match_history_for.side_effect = DeadlockAPIError("HTTP 500")
+    repo.get_match_history.return_value = []
+
+    assert await make_service(api, repo).get_match_history(1, 100, 0, MagicMock()) == []
+
+
+@pytest.mark.asyncio
+async def test_raises_when_first_refresh_fails():
+    api = AsyncMock()
+    repo = AsyncMock()
+    repo.get_refreshed_at.return_value = None
+    repo.get_latest_start_time.return_value = None
+    api.get_account_match_history_for.side_effect = DeadlockAPIError("HTTP 500")
+
+    with pytest.raises(DeadlockAPIError):
+        await make_service(api, repo).get_match_history(1, 100, 0, MagicMock())
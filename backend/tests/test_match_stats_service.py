@@ -0,0 +1,66 @@
+from app.domain.boss import BossData
+from app.domain.damage_aggregates import PlayerDamageAggregates
+from app.domain.match_analysis import TransformedMatchData
+from app.domain.player import PlayerData
+from app.services.match_stats_service import MatchStatsService
+
+
+def make_aggregates(custom_id: str, cumulative_damage: list[int]) -> PlayerDamageAggregates:
+    return PlayerDamageAggregates(
+        custom_id=custom_id,
+        total_damage=cumulative_damage[-1] if cumulative_damage else 0,
+        total_absorbed=0,
+        total_health_lost=0,
+        cumulative_damage=cumulative_damage,
+        by_victim={},
+        by_ability={},
+        by_citadel_type={},
+    )
+
+
+def make_match(players: list[PlayerData], match_start_time_s: int = 0) -> TransformedMatchData:
+    return TransformedMatchData(
+        total_match_time_s=150,
+        match_start_time_s=match_start_time_s,
+        players_data=players,
+        per_player_data={},
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+
+def test_damage_by_minute_samples_each_minute_boundary():
+    cumulative = list(range(150))
+
+    assert MatchStatsService.damage_by_minute(cumulative) == [0, 60, 120]
+
+
+def test_build_joins_player_identity_and_aggregates():
+    match_data = make_match([
+        PlayerData(entity_id="1", custom_id="1", name="a", steam_id_32=42, hero_id=7, team=0, lane=1),
+        PlayerData(entity_id="2", custom_id="2", name="b", team=1, lane=1),
+    ])
+    aggregates = [make_aggregates("1", list(range(150))), make_aggregates("2", [])]
+
+    stats = {s.custom_id: s for s in MatchStatsService.build(match_data, aggregates)}
+
+    assert stats["1"].steam_id_32 == 42
+    assert stats["1"].hero_id == 7
+    assert stats["1"].total_match_time_s == 150
+    assert stats["1"].total_damage == 149
+    assert stats["1"].damage_by_minute == [0, 60, 120]
+    assert stats["2"].hero_id is None
+    assert stats["2"].damage_by_minute == []
+
+
+def test_build_records_played_length_without_pregame():
+    match_data = make_match([PlayerData(entity_id="1", custom_id="1", name="a", team=0, lane=1)], match_start_time_s=30)
+
+    [stats] = MatchStatsService.build(match_data, [make_aggregates("1", [1])])
+
+    assert (stats.total_match_time_s, stats.match_length_s) == (150, 120)
+
+
+def test_build_skips_aggregates_without_player_data():
+    match_data = make_match([])
+
+    assert MatchStatsService.build(match_data, [make_aggregates("1", [1])]) == []
@@ -1,9 +1,50 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import SQLAlchemyError
+from app.domain.exceptions import BlobStoreError, MatchDataIntegrityException
+from app.repo.parsed_matches_repo import ParsedMatchesRepo
 
 # TODO: These tests need to be updated to match current schema
 # - ParsedPlayer no longer exists
-# Skipping all tests until schema is updated
+# Skipping the old tests until schema is updated
 
 @pytest.mark.skip(reason="Test schema outdated - needs update to match current domain models")
 def test_placeholder():
     pass
+
+
+def make_failing_repo() -> ParsedMatchesRepo:
+    blob_store = AsyncMock()
+    blob_store.put.side_effect = BlobStoreError("bucket unavailable")
+    return ParsedMatchesRepo(blob_store=blob_store)
+
+
+@pytest.mark.asyncio
+async def test_create_parsed_match_swallows_failures_on_first_store():
+    repo = make_failing_repo()
+
+    await repo.create_parsed_match(1, 2, b"raw", {}, "etag", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_create_parsed_match_raises_when_replace_stores_nothing():
+    repo = make_failing_repo()
+
+    with pytest.raises(MatchDataIntegrityException):
+        await repo.create_parsed_match(1, 2, b"raw", {}, "etag", AsyncMock(), replace=True)
+
+
+@pytest.mark.asyncio
+async def test_create_parsed_match_rolls_back_failed_replace():
+    blob_store = AsyncMock()
+    blob_store.put.return_value = "digest"
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.add_all = MagicMock()
+    session.commit.side_effect = SQLAlchemyError("deadlock detected")
+
+    with pytest.raises(MatchDataIntegrityException):
+        await ParsedMatchesRepo(blob_store=blob_store).create_parsed_match(
+            1, 2, b"raw", {}, "etag", session, replace=True
+        )
+    session.rollback.assert_awaited_once()
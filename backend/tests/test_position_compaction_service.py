@@ -0,0 +1,59 @@
+from app.domain.player import PlayerPosition
+from app.domain.position_track import POSITION_QUANTUM
+from app.services.position_compaction_service import PositionCompactionService
+
+
+def make_positions(points: list[tuple[float, float]]) -> list[PlayerPosition | None]:
+    return [PlayerPosition(custom_id="1", x=x, y=y, z=96.0, is_npc=False) for x, y in points]
+
+
+def test_level_zero_round_trips_within_quantum():
+    positions = make_positions([(0, 0), (13.3, -7.9), (1000.2, 512.5), (-3000, 42)])
+
+    track = PositionCompactionService.compact("1", positions, level=0)
+    decoded = PositionCompactionService.decode(track)
+
+    assert track.t == [0, 1, 1, 1]
+    assert len(decoded) == len(positions)
+    for (t, x, y, z), original in zip(decoded, positions):
+        assert abs(x - original.x) <= POSITION_QUANTUM / 2
+        assert abs(y - original.y) <= POSITION_QUANTUM / 2
+        assert abs(z - original.z) <= POSITION_QUANTUM / 2
+
+
+def test_tracks_are_delta_encoded():
+    positions = make_positions([(80, 80), (160, 80), (160, 160)])
+
+    track = PositionCompactionService.compact("1", positions, level=0)
+
+    assert track.x == [10, 10, 0]
+    assert track.y == [10, 0, 10]
+    assert track.z == [12, 0, 0]
+
+
+def test_simplification_drops_straight_line_samples():
+    positions = make_positions([(i * 100.0, 0) for i in range(60)])
+
+    track = PositionCompactionService.compact("1", positions, level=1)
+
+    assert [t for t, *_ in PositionCompactionService.decode(track)] == [0, 59]
+
+
+def test_simplification_keeps_timing_of_stationary_players():
+    # Stands still for 30 seconds, then walks east for 10 seconds
+    positions = make_positions([(0, 0)] * 30 + [(i * 300.0, 0) for i in range(1, 11)])
+
+    track = PositionCompactionService.compact("1", positions, level=2)
+    decoded = PositionCompactionService.decode(track)
+
+    # The moment the player starts moving must survive simplification
+    assert [t for t, *_ in decoded] == [0, 29, 39]
+
+
+def test_missing_samples_are_skipped():
+    positions = make_positions([(0, 0), (8, 8)])
+    positions.insert(1, None)
+
+    track = PositionCompactionService.compact("1", positions, level=0)
+
+    assert [t for t, *_ in PositionCompactionService.decode(track)] == [0, 2]
@@ -0,0 +1,128 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.steam_account import SteamPlayer
+from app.domain.exceptions import SteamAPIError
+from app.infra.steam.steam_api_client import PLAYER_SUMMARIES_URL, SteamAPIClient
+from app.services.steam_account_service import SteamAccountService
+
+
+def make_player(steam_id: str) -> SteamPlayer:
+    return SteamPlayer(
+        steamid=steam_id,
+        communityvisibilitystate=3,
+        personaname=f"player-{steam_id}",
+        profileurl=f"https://steamcommunity.com/profiles/{steam_id}",
+        avatar="a.jpg",
+        avatarmedium="am.jpg",
+        avatarfull="af.jpg",
+        avatarhash="hash",
+    )
+
+
+def make_service(client) -> SteamAccountService:
+    return SteamAccountService(client, cache_ttl_s=60, batch_window_s=0.005)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_single_lookups_are_coalesced():
+    client = AsyncMock()
+    client.fetch_player_summaries.side_effect = lambda ids: [make_player(i) for i in ids]
+    service = make_service(client)
+
+    players = await asyncio.gather(*(service.get_player(str(i)) for i in range(12)))
+
+    assert [p.steamid for p in players] == [str(i) for i in range(12)]
+    client.fetch_player_summaries.assert_awaited_once()
+    assert sorted(client.fetch_player_summaries.call_args.args[0]) == sorted(str(i) for i in range(12))
+
+
+@pytest.mark.asyncio
+async def test_get_player_serves_from_cache():
+    client = AsyncMock()
+    client.fetch_player_summaries.side_effect = lambda ids: [make_player(i) for i in ids]
+    service = make_service(client)
+
+    await service.get_player("1")
+    await service.get_player("1")
+
+    assert client.fetch_player_summaries.await_count == 1
+    assert service.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_player_returns_none_for_unknown_id():
+    client = AsyncMock()
+    client.fetch_player_summaries.return_value = []
+    service = make_service(client)
+
+    assert await service.get_player("404") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_propagate_to_every_waiter():
+    client = AsyncMock()
+    client.fetch_player_summaries.side_effect = SteamAPIError("Steam API returned 503")
+    service = make_service(client)
+
+    results = await asyncio.gather(
+        service.get_player("1"), service.get_player("2"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, SteamAPIError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_flush_task_is_held_until_it_finishes():
+    client = AsyncMock()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fetch(ids):
+        started.set()
+        await release.wait()
+        return [make_player(i) for i in ids]
+
+    client.fetch_player_summaries.side_effect = fetch
+    service = make_service(client)
+
+    lookup = asyncio.create_task(service.get_player("1"))
+    await started.wait()
+    assert len(service.batcher._flush_tasks) == 1
+
+    release.set()
+    assert (await lookup).steamid == "1"
+    await asyncio.sleep(0)
+    assert service.batcher._flush_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_get_players_only_fetches_uncached_ids():
+    client = AsyncMock()
+    client.fetch_player_summaries.side_effect = lambda ids: [make_player(i) for i in ids]
+    service = make_service(client)
+    service.cache.set("1", make_player("1"))
+
+    players = await service.get_players(["2", "1", "2", "3"])
+
+    assert [p.steamid for p in players] == ["2", "1", "3"]
+    client.fetch_player_summaries.assert_awaited_once_with(["2", "3"])
+
+
+@pytest.mark.asyncio
+async def test_client_chunks_requests_to_100_ids(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        json={"response": {"players": []}},
+        is_reusable=True,
+    )
+    client = SteamAPIClient()
+
+    await client.fetch_player_summaries([str(i) for i in range(150)])
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert all(str(r.url).startswith(PLAYER_SUMMARIES_URL) for r in requests)
+    assert len(requests[0].url.params["steamids"].split(",")) == 100
+    assert len(requests[1].url.params["steamids"].split(",")) == 50
+    await client.client.aclose()
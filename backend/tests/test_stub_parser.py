@@ -0,0 +1,48 @@
+import base64
+import httpx
+import pytest
+from app.domain.match_analysis import ParsedMatchResponse
+from app.infra.parser.parser_client import ParserClient
+from benchmarks.payloads import synthetic_parser_payload
+from benchmarks.stub_parser import StubParserConfig, create_app
+
+
+def make_client(config: StubParserConfig) -> ParserClient:
+    client = ParserClient()
+    client.base_url = "http://stub-parser"
+    client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(config)))
+    return client
+
+
+def test_synthetic_payload_is_configurable_and_parses():
+    payload = synthetic_parser_payload(2, seed=3, players=4, damage_rate=1.0, bosses=2)
+
+    parsed = ParsedMatchResponse.model_validate({**payload, "players_data": payload["players"]})
+
+    assert parsed.total_match_time_s == 120
+    assert len(parsed.players_data) == 4
+    assert len(parsed.positions) == len(parsed.damage) == 120
+    assert all(len(second) == 4 for second in parsed.damage)
+    assert len(parsed.bosses.snapshots) == 2
+    assert synthetic_parser_payload(2, seed=3, players=4) == synthetic_parser_payload(2, seed=3, players=4)
+
+
+def test_synthetic_payload_rejects_npc_range_player_counts():
+    with pytest.raises(ValueError):
+        synthetic_parser_payload(1, players=20)
+
+
+@pytest.mark.asyncio
+async def test_parser_client_round_trip_against_stub():
+    client = make_client(StubParserConfig(minutes=(1, 2), players=6))
+
+    available, filename = await client.check_demo_available(41)
+    payload = await client.parse_demo(
+        base64.urlsafe_b64encode(f"/parser/src/replays/{filename}".encode()).decode()
+    )
+
+    assert available
+    # Match length cycles through `minutes` by match id
+    assert payload["total_match_time_s"] == 120
+    assert len(payload["players"]) == 6
+    await client.client.aclose()
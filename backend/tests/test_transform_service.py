@@ -0,0 +1,51 @@
+from app.domain.boss import BossData
+from app.domain.match_analysis import ParsedMatchResponse
+from app.domain.player import PlayerData, PlayerPosition
+from app.services.position_compaction_service import PositionCompactionService
+from app.services.transform_service import TransformService
+
+
+def make_position(custom_id: str, x: float) -> PlayerPosition:
+    return PlayerPosition(custom_id=custom_id, x=x, y=0.0, z=0.0, is_npc=False)
+
+
+def make_parsed_match(positions: list[list[PlayerPosition]]) -> ParsedMatchResponse:
+    return ParsedMatchResponse(
+        total_match_time_s=len(positions),
+        match_start_time_s=0,
+        damage=[{} for _ in positions],
+        players_data=[
+            PlayerData(entity_id="1", custom_id="1", name="a", team=0, lane=1),
+            PlayerData(entity_id="2", custom_id="2", name="b", team=1, lane=1),
+        ],
+        positions=positions,
+        bosses=BossData(snapshots=[], health_timeline=[]),
+    )
+
+
+def test_positions_keep_one_slot_per_second():
+    parsed_match = make_parsed_match([
+        [make_position("1", 0), make_position("2", 0)],
+        [make_position("2", 1)],
+        [make_position("1", 2), make_position("2", 2), make_position("25", 2)],
+    ])
+
+    match_data = TransformService.to_match_data(parsed_match)
+
+    player_1 = match_data.per_player_data["1"].positions
+    assert [p.x if p is not None else None for p in player_1] == [0, None, 2]
+    assert len(match_data.per_player_data["2"].positions) == 3
+
+
+def test_compacted_timestamps_survive_gaps():
+    parsed_match = make_parsed_match([
+        [make_position("1", 0)],
+        [],
+        [],
+        [make_position("1", 30)],
+    ])
+
+    positions = TransformService.to_match_data(parsed_match).per_player_data["1"].positions
+    track = PositionCompactionService.compact("1", positions, level=0)
+
+    assert [t for t, *_ in PositionCompactionService.decode(track)] == [0, 3]
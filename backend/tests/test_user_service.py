@@ -0,0 +1,117 @@
+import hashlib
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.api.session import current_user_lookups, get_current_user
+from app.config import Settings, get_settings
+from app.infra.db.models import User
+from app.services.auth.manage_jwt_token import create_access_token, decode_access_token_payload, user_from_claims
+from app.services.user_service import UserService
+from app.utils.steam_id_utils import hash_steam_id
+from app.utils.ttl_cache import TTLCache
+
+
+def make_user(user_id: int = 7) -> User:
+    return User(id=user_id, encrypted_steam_id="enc", hashed_steam_id="hash")
+
+
+def make_settings(embed: bool) -> Settings:
+    return Settings(JWT_SECRET_KEY="test-secret", JWT_ALGORITHM="HS256", JWT_EMBED_USER_CLAIMS=embed)
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_id_is_served_from_cache():
+    service = UserService(cache=TTLCache(ttl_s=60))
+    with patch("app.services.user_service.UserRepository") as repo_cls:
+        repo_cls.return_value.get_user_by_id = AsyncMock(return_value=make_user())
+
+        first = await service.find_user_by_id(7, session=AsyncMock())
+        second = await service.find_user_by_id(7, session=AsyncMock())
+
+    assert first.id == second.id == 7
+    repo_cls.return_value.get_user_by_id.assert_awaited_once()
+    assert service.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_id_does_not_cache_missing_users():
+    service = UserService(cache=TTLCache(ttl_s=60))
+    with patch("app.services.user_service.UserRepository") as repo_cls:
+        repo_cls.return_value.get_user_by_id = AsyncMock(return_value=None)
+
+        assert await service.find_user_by_id(7, session=AsyncMock()) is None
+        assert await service.find_user_by_id(7, session=AsyncMock()) is None
+
+    assert repo_cls.return_value.get_user_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_users_by_steam_ids_keys_users_by_steam_id():
+    service = UserService(cache=TTLCache(ttl_s=60))
+    registered = User(id=1, encrypted_steam_id="enc", hashed_steam_id=hash_steam_id("111"))
+    with patch("app.services.user_service.UserRepository") as repo_cls:
+        repo_cls.return_value.get_users_by_steam_ids = AsyncMock(return_value=[registered])
+
+        users = await service.find_users_by_steam_ids(["111", "222", "111"], session=AsyncMock())
+
+    assert users == {"111": registered}
+    hashes = repo_cls.return_value.get_users_by_steam_ids.call_args.args[0]
+    assert sorted(hashes) == sorted([hash_steam_id("111"), hash_steam_id("222")])
+
+
+def test_hash_steam_id_matches_salted_sha256():
+    expected = hashlib.sha256(get_settings().STEAM_HASH_SALT.encode() + b"76561198000000000").hexdigest()
+    assert hash_steam_id("76561198000000000") == expected
+    assert hash_steam_id("76561198000000000") == expected
+
+
+def test_user_claims_round_trip():
+    settings = make_settings(embed=True)
+    token = create_access_token(user_id=7, settings=settings, user=make_user())
+
+    user = user_from_claims(decode_access_token_payload(token, settings))
+
+    assert user is not None
+    assert user.id == 7
+
+
+def test_user_claims_leave_out_steam_ids():
+    settings = make_settings(embed=True)
+    token = create_access_token(user_id=7, settings=settings, user=make_user())
+
+    claims = decode_access_token_payload(token, settings)["user"]
+
+    assert set(claims) == {"id", "created_at", "updated_at"}
+
+
+def test_user_claims_are_omitted_unless_enabled():
+    settings = make_settings(embed=False)
+    token = create_access_token(user_id=7, settings=settings, user=make_user())
+
+    assert user_from_claims(decode_access_token_payload(token, settings)) is None
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_skips_the_db_with_embedded_claims():
+    settings = make_settings(embed=True)
+    token = create_access_token(user_id=7, settings=settings, user=make_user())
+    from_token = current_user_lookups.from_token
+
+    with patch("app.api.session.UserService") as service_cls:
+        user = await get_current_user(settings=settings, token=token, session=AsyncMock())
+
+    assert user.id == 7
+    service_cls.assert_not_called()
+    assert current_user_lookups.from_token == from_token + 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_falls_back_to_the_db_without_claims():
+    settings = make_settings(embed=False)
+    token = create_access_token(user_id=7, settings=settings, user=make_user())
+
+    with patch("app.api.session.UserService") as service_cls:
+        service_cls.return_value.find_user_by_id = AsyncMock(return_value=make_user())
+        user = await get_current_user(settings=settings, token=token, session=AsyncMock())
+
+    assert user.model_dump().keys() == {"id", "created_at", "updated_at"}
+    service_cls.return_value.find_user_by_id.assert_awaited_once()
@@ -53,4 +53,14 @@ async def test_get_user_by_steam_id_success(repo, async_session):
 @pytest.mark.asyncio
 async def test_get_user_by_steam_id_not_found(repo, async_session):
     found = await repo.get_user_by_steam_id("00000000000000000", async_session)
-    assert found is None
\ No newline at end of file
+    assert found is None
+
+@pytest.mark.asyncio
+async def test_get_users_by_steam_ids_returns_only_registered_users(repo, async_session):
+    created = await repo.create_user("batch-hash-1", "batch-enc-1", async_session)
+    found = await repo.get_users_by_steam_ids(["batch-hash-1", "batch-hash-missing"], async_session)
+    assert [user.id for user in found] == [created.id]
+
+@pytest.mark.asyncio
+async def test_get_users_by_steam_ids_empty(repo, async_session):
+    assert await repo.get_users_by_steam_ids([], async_session) == []
@@ -50,9 +50,10 @@ const PlayerCards: React.FC<PlayerCardsProps> = ({
           const heroImg = player.hero.images?.icon_hero_card_webp;
           const health = 0;
           // const health = playerPathState.health[currentTick];
+          // Seconds without a position sample are null; fall back to [0,0]
           const { normX, normY } = normalizePosition(
-            playerPosition.x,
-            playerPosition.y
+            playerPosition?.x ?? 0,
+            playerPosition?.y ?? 0
           );
           const regionLabels: string[] = getPlayerRegionLabels(normX, normY);
 